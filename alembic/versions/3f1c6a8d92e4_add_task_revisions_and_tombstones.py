@@ -0,0 +1,53 @@
+"""Add task revisions, updated_at and tombstones for delta sync
+
+Revision ID: 3f1c6a8d92e4
+Revises: 7b3e9d41a2c8
+Create Date: 2026-10-18 13:27:52.904113
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f1c6a8d92e4'
+down_revision: Union[str, None] = '7b3e9d41a2c8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add the sync columns and index to tasks, and the tombstone table."""
+    # SQLite cannot ALTER TABLE ADD COLUMN with a CURRENT_TIMESTAMP default; batch mode
+    # rebuilds the table there and emits plain ALTER TABLE statements elsewhere
+    with op.batch_alter_table('tasks') as batch_op:
+        batch_op.add_column(sa.Column('revision', sa.Integer(), nullable=False, server_default='0'))
+        batch_op.add_column(
+            sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now())
+        )
+    op.create_index('ix_tasks_owner_id_revision', 'tasks', ['owner_id', 'revision'], unique=False, if_not_exists=True)
+
+    op.create_table(
+        'task_tombstones',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('task_id', sa.Integer(), nullable=False),
+        sa.Column('owner_id', sa.Integer(), nullable=False),
+        sa.Column('revision', sa.Integer(), nullable=False),
+        sa.Column('deleted_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
+        sa.ForeignKeyConstraint(['owner_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('ix_task_tombstones_owner_id_revision', 'task_tombstones', ['owner_id', 'revision'], unique=False)
+
+
+def downgrade() -> None:
+    """Drop the tombstone table and the sync columns."""
+    op.drop_index('ix_task_tombstones_owner_id_revision', table_name='task_tombstones')
+    op.drop_table('task_tombstones')
+
+    op.drop_index('ix_tasks_owner_id_revision', table_name='tasks')
+    with op.batch_alter_table('tasks') as batch_op:
+        batch_op.drop_column('updated_at')
+        batch_op.drop_column('revision')
@@ -0,0 +1,86 @@
+"""Add full-text search index over task title and description
+
+Revision ID: 4e9b7f3a6d21
+Revises: 8d2a5c7e1b39
+Create Date: 2026-10-18 14:48:33.105267
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4e9b7f3a6d21'
+down_revision: Union[str, None] = '8d2a5c7e1b39'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SEARCH_CONFIG = "english"
+
+SQLITE_SEARCH_DDL = (
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS tasks_fts USING fts5(
+        title, description, content='tasks', content_rowid='id', tokenize='porter unicode61'
+    )
+    """,
+    """
+    CREATE TRIGGER tasks_fts_insert AFTER INSERT ON tasks
+    BEGIN
+        INSERT INTO tasks_fts (rowid, title, description) VALUES (NEW.id, NEW.title, NEW.description);
+    END
+    """,
+    """
+    CREATE TRIGGER tasks_fts_delete AFTER DELETE ON tasks
+    BEGIN
+        INSERT INTO tasks_fts (tasks_fts, rowid, title, description)
+        VALUES ('delete', OLD.id, OLD.title, OLD.description);
+    END
+    """,
+    """
+    CREATE TRIGGER tasks_fts_update AFTER UPDATE OF title, description ON tasks
+    BEGIN
+        INSERT INTO tasks_fts (tasks_fts, rowid, title, description)
+        VALUES ('delete', OLD.id, OLD.title, OLD.description);
+        INSERT INTO tasks_fts (rowid, title, description) VALUES (NEW.id, NEW.title, NEW.description);
+    END
+    """,
+)
+
+POSTGRESQL_SEARCH_DDL = (
+    f"""
+    ALTER TABLE tasks ADD COLUMN IF NOT EXISTS search_vector tsvector GENERATED ALWAYS AS (
+        setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(title, '')), 'A')
+        || setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(description, '')), 'B')
+    ) STORED
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_tasks_search_vector ON tasks USING GIN (search_vector)",
+)
+
+
+def upgrade() -> None:
+    """Create the text index for the database in use and index the existing tasks."""
+    if op.get_bind().dialect.name == 'postgresql':
+        # The generated column is computed for existing rows as it is added
+        for statement in POSTGRESQL_SEARCH_DDL:
+            op.execute(statement)
+        return
+
+    # The application's create_all may have installed the triggers before this migration ran
+    for action in ('insert', 'update', 'delete'):
+        op.execute(f"DROP TRIGGER IF EXISTS tasks_fts_{action}")
+    for statement in SQLITE_SEARCH_DDL:
+        op.execute(statement)
+    op.execute("INSERT INTO tasks_fts (tasks_fts) VALUES ('rebuild')")
+
+
+def downgrade() -> None:
+    """Drop the text index."""
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute("DROP INDEX IF EXISTS ix_tasks_search_vector")
+        op.execute("ALTER TABLE tasks DROP COLUMN IF EXISTS search_vector")
+        return
+
+    for action in ('insert', 'update', 'delete'):
+        op.execute(f"DROP TRIGGER IF EXISTS tasks_fts_{action}")
+    op.execute("DROP TABLE IF EXISTS tasks_fts")
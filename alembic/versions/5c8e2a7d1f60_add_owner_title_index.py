@@ -0,0 +1,28 @@
+"""Add composite (owner_id, title, id) index for title filters and sorting
+
+Revision ID: 5c8e2a7d1f60
+Revises: 4e9b7f3a6d21
+Create Date: 2026-10-18 16:42:08.319554
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5c8e2a7d1f60'
+down_revision: Union[str, None] = '4e9b7f3a6d21'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Index titles per owner for GET /tasks?title=prefix:...&sort=title."""
+    op.create_index('ix_tasks_owner_id_title_id', 'tasks', ['owner_id', 'title', 'id'], unique=False, if_not_exists=True)
+
+
+def downgrade() -> None:
+    """Drop the title listing index."""
+    op.drop_index('ix_tasks_owner_id_title_id', table_name='tasks')
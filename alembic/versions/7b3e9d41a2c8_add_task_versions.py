@@ -0,0 +1,30 @@
+"""Add tasks.version and users.tasks_version for ETags
+
+Revision ID: 7b3e9d41a2c8
+Revises: c5acd90b9f94
+Create Date: 2026-10-18 12:41:07.318204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7b3e9d41a2c8'
+down_revision: Union[str, None] = 'c5acd90b9f94'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add the per-row task version and the per-user task collection version."""
+    op.add_column('tasks', sa.Column('version', sa.Integer(), nullable=False, server_default='1'))
+    op.add_column('users', sa.Column('tasks_version', sa.Integer(), nullable=False, server_default='0'))
+
+
+def downgrade() -> None:
+    """Drop the task version columns."""
+    op.drop_column('users', 'tasks_version')
+    op.drop_column('tasks', 'version')
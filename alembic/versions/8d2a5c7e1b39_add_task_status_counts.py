@@ -0,0 +1,138 @@
+"""Add task_status_counts maintained by triggers on tasks
+
+Revision ID: 8d2a5c7e1b39
+Revises: 3f1c6a8d92e4
+Create Date: 2026-10-18 14:02:16.470931
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8d2a5c7e1b39'
+down_revision: Union[str, None] = '3f1c6a8d92e4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SQLITE_TRIGGERS = (
+    """
+    CREATE TRIGGER tasks_status_count_insert AFTER INSERT ON tasks
+    BEGIN
+        INSERT INTO task_status_counts (owner_id, status, count) VALUES (NEW.owner_id, NEW.status, 1)
+        ON CONFLICT (owner_id, status) DO UPDATE SET count = count + 1;
+    END
+    """,
+    """
+    CREATE TRIGGER tasks_status_count_delete AFTER DELETE ON tasks
+    BEGIN
+        UPDATE task_status_counts SET count = count - 1
+        WHERE owner_id = OLD.owner_id AND status = OLD.status;
+    END
+    """,
+    """
+    CREATE TRIGGER tasks_status_count_update AFTER UPDATE OF owner_id, status ON tasks
+    WHEN OLD.owner_id IS NOT NEW.owner_id OR OLD.status IS NOT NEW.status
+    BEGIN
+        UPDATE task_status_counts SET count = count - 1
+        WHERE owner_id = OLD.owner_id AND status = OLD.status;
+        INSERT INTO task_status_counts (owner_id, status, count) VALUES (NEW.owner_id, NEW.status, 1)
+        ON CONFLICT (owner_id, status) DO UPDATE SET count = count + 1;
+    END
+    """,
+)
+
+POSTGRESQL_TRIGGERS = (
+    """
+    CREATE OR REPLACE FUNCTION tasks_status_count_apply() RETURNS trigger LANGUAGE plpgsql AS $$
+    BEGIN
+        -- Each counter gets its net change once, so one statement never updates a row twice
+        IF TG_OP = 'INSERT' THEN
+            INSERT INTO task_status_counts (owner_id, status, count)
+            SELECT owner_id, status, count(*) FROM new_rows GROUP BY owner_id, status
+            ON CONFLICT (owner_id, status) DO UPDATE SET count = task_status_counts.count + EXCLUDED.count;
+        ELSIF TG_OP = 'DELETE' THEN
+            INSERT INTO task_status_counts (owner_id, status, count)
+            SELECT owner_id, status, -count(*) FROM old_rows GROUP BY owner_id, status
+            ON CONFLICT (owner_id, status) DO UPDATE SET count = task_status_counts.count + EXCLUDED.count;
+        ELSE
+            INSERT INTO task_status_counts (owner_id, status, count)
+            SELECT owner_id, status, sum(delta) FROM (
+                SELECT o.owner_id, o.status, -1 AS delta
+                FROM old_rows o JOIN new_rows n ON n.id = o.id
+                WHERE o.owner_id <> n.owner_id OR o.status <> n.status
+                UNION ALL
+                SELECT n.owner_id, n.status, 1 AS delta
+                FROM old_rows o JOIN new_rows n ON n.id = o.id
+                WHERE o.owner_id <> n.owner_id OR o.status <> n.status
+            ) moves
+            GROUP BY owner_id, status
+            HAVING sum(delta) <> 0
+            ON CONFLICT (owner_id, status) DO UPDATE SET count = task_status_counts.count + EXCLUDED.count;
+        END IF;
+        RETURN NULL;
+    END
+    $$
+    """,
+    """
+    CREATE TRIGGER tasks_status_count_insert AFTER INSERT ON tasks
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION tasks_status_count_apply()
+    """,
+    """
+    CREATE TRIGGER tasks_status_count_delete AFTER DELETE ON tasks
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION tasks_status_count_apply()
+    """,
+    """
+    CREATE TRIGGER tasks_status_count_update AFTER UPDATE ON tasks
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION tasks_status_count_apply()
+    """,
+)
+
+
+def upgrade() -> None:
+    """Create the counter table, fill it from tasks and install the triggers that maintain it."""
+    dialect = op.get_bind().dialect.name
+    if dialect == 'postgresql':
+        status_type = postgresql.ENUM(name='taskstatus', create_type=False)
+    else:
+        status_type = sa.String(length=11)
+
+    # The application's create_all may have created the table before this migration ran
+    if not sa.inspect(op.get_bind()).has_table('task_status_counts'):
+        op.create_table(
+            'task_status_counts',
+            sa.Column('owner_id', sa.Integer(), nullable=False),
+            sa.Column('status', status_type, nullable=False),
+            sa.Column('count', sa.Integer(), nullable=False, server_default='0'),
+            sa.ForeignKeyConstraint(['owner_id'], ['users.id'], ondelete='CASCADE'),
+            sa.PrimaryKeyConstraint('owner_id', 'status'),
+        )
+    if dialect == 'postgresql':
+        op.execute("LOCK TABLE tasks IN SHARE ROW EXCLUSIVE MODE")
+    for action in ('insert', 'update', 'delete'):
+        on_table = " ON tasks" if dialect == 'postgresql' else ""
+        op.execute(f"DROP TRIGGER IF EXISTS tasks_status_count_{action}{on_table}")
+    for statement in POSTGRESQL_TRIGGERS if dialect == 'postgresql' else SQLITE_TRIGGERS:
+        op.execute(statement)
+    # Rebuilt once the triggers are in place, whatever the table already held
+    op.execute("DELETE FROM task_status_counts")
+    op.execute(
+        "INSERT INTO task_status_counts (owner_id, status, count) "
+        "SELECT owner_id, status, count(*) FROM tasks GROUP BY owner_id, status"
+    )
+
+
+def downgrade() -> None:
+    """Drop the triggers and the counter table."""
+    postgres = op.get_bind().dialect.name == 'postgresql'
+    for action in ('insert', 'update', 'delete'):
+        op.execute(f"DROP TRIGGER IF EXISTS tasks_status_count_{action}" + (" ON tasks" if postgres else ""))
+    if postgres:
+        op.execute("DROP FUNCTION IF EXISTS tasks_status_count_apply()")
+    op.drop_table('task_status_counts')
@@ -0,0 +1,63 @@
+"""Delete a user's tasks with ON DELETE CASCADE on tasks.owner_id
+
+Revision ID: 9e4b1d7c3a85
+Revises: 5c8e2a7d1f60
+Create Date: 2026-10-18 18:05:37.904126
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9e4b1d7c3a85'
+down_revision: Union[str, None] = '5c8e2a7d1f60'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+FOREIGN_KEY_NAME = 'tasks_owner_id_fkey'
+# SQLite reflects foreign keys without names; batch mode names them by this convention
+NAMING_CONVENTION = {'fk': 'fk_%(table_name)s_%(column_0_name)s_%(referred_table_name)s'}
+
+
+def owner_foreign_key_name() -> str:
+    for foreign_key in sa.inspect(op.get_bind()).get_foreign_keys('tasks'):
+        if foreign_key['constrained_columns'] == ['owner_id']:
+            return foreign_key['name'] or 'fk_tasks_owner_id_users'
+    raise RuntimeError('tasks.owner_id has no foreign key to replace')
+
+
+def replace_owner_foreign_key(ondelete: Union[str, None]) -> None:
+    """
+    Recreate the tasks.owner_id foreign key with the given ON DELETE action.
+    """
+    bind = op.get_bind()
+    # SQLite rebuilds the table, which drops its triggers (status counters, search index)
+    triggers = []
+    if bind.dialect.name == 'sqlite':
+        triggers = bind.execute(sa.text(
+            "SELECT sql FROM sqlite_master WHERE type = 'trigger' AND tbl_name = 'tasks'"
+        )).scalars().all()
+
+    name = owner_foreign_key_name()
+    with op.batch_alter_table('tasks', naming_convention=NAMING_CONVENTION) as batch_op:
+        batch_op.drop_constraint(name, type_='foreignkey')
+        batch_op.create_foreign_key(FOREIGN_KEY_NAME, 'users', ['owner_id'], ['id'], ondelete=ondelete)
+
+    for trigger in triggers:
+        op.execute(trigger)
+
+
+def upgrade() -> None:
+    """Cascade user deletes to tasks in the database, after removing rows already orphaned."""
+    # SQLite did not enforce foreign keys before, so deleted users may have left rows behind
+    for table in ('tasks', 'task_tombstones', 'task_status_counts'):
+        op.execute(f'DELETE FROM {table} WHERE owner_id NOT IN (SELECT id FROM users)')
+    replace_owner_foreign_key('CASCADE')
+
+
+def downgrade() -> None:
+    """Restore the plain foreign key; the ORM deletes a user's tasks again."""
+    replace_owner_foreign_key(None)
@@ -0,0 +1,28 @@
+"""Index task_tombstones.deleted_at for the tombstone retention purge
+
+Revision ID: a6f1c3e8b250
+Revises: d4a8c2e6f913
+Create Date: 2026-10-18 21:14:09.502317
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a6f1c3e8b250'
+down_revision: Union[str, None] = 'd4a8c2e6f913'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Let the periodic purge find tombstones past the retention window by deleted_at."""
+    op.create_index('ix_task_tombstones_deleted_at', 'task_tombstones', ['deleted_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Drop the deleted_at index."""
+    op.drop_index('ix_task_tombstones_deleted_at', table_name='task_tombstones')
@@ -0,0 +1,109 @@
+"""Scope the task full-text index by owner
+
+Revision ID: b2e7c4f9a1d6
+Revises: f8c1d5a9e3b7
+Create Date: 2026-10-19 00:12:37.846150
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b2e7c4f9a1d6'
+down_revision: Union[str, None] = 'f8c1d5a9e3b7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SQLITE_SEARCH_DDL = (
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS tasks_fts USING fts5(
+        title, description, owner_id UNINDEXED,
+        content='tasks', content_rowid='id', tokenize='porter unicode61'
+    )
+    """,
+    """
+    CREATE TRIGGER tasks_fts_insert AFTER INSERT ON tasks
+    BEGIN
+        INSERT INTO tasks_fts (rowid, title, description, owner_id)
+        VALUES (NEW.id, NEW.title, NEW.description, NEW.owner_id);
+    END
+    """,
+    """
+    CREATE TRIGGER tasks_fts_delete AFTER DELETE ON tasks
+    BEGIN
+        INSERT INTO tasks_fts (tasks_fts, rowid, title, description, owner_id)
+        VALUES ('delete', OLD.id, OLD.title, OLD.description, OLD.owner_id);
+    END
+    """,
+    """
+    CREATE TRIGGER tasks_fts_update AFTER UPDATE OF title, description, owner_id ON tasks
+    BEGIN
+        INSERT INTO tasks_fts (tasks_fts, rowid, title, description, owner_id)
+        VALUES ('delete', OLD.id, OLD.title, OLD.description, OLD.owner_id);
+        INSERT INTO tasks_fts (rowid, title, description, owner_id)
+        VALUES (NEW.id, NEW.title, NEW.description, NEW.owner_id);
+    END
+    """,
+)
+
+PREVIOUS_SQLITE_SEARCH_DDL = (
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS tasks_fts USING fts5(
+        title, description, content='tasks', content_rowid='id', tokenize='porter unicode61'
+    )
+    """,
+    """
+    CREATE TRIGGER tasks_fts_insert AFTER INSERT ON tasks
+    BEGIN
+        INSERT INTO tasks_fts (rowid, title, description) VALUES (NEW.id, NEW.title, NEW.description);
+    END
+    """,
+    """
+    CREATE TRIGGER tasks_fts_delete AFTER DELETE ON tasks
+    BEGIN
+        INSERT INTO tasks_fts (tasks_fts, rowid, title, description)
+        VALUES ('delete', OLD.id, OLD.title, OLD.description);
+    END
+    """,
+    """
+    CREATE TRIGGER tasks_fts_update AFTER UPDATE OF title, description ON tasks
+    BEGIN
+        INSERT INTO tasks_fts (tasks_fts, rowid, title, description)
+        VALUES ('delete', OLD.id, OLD.title, OLD.description);
+        INSERT INTO tasks_fts (rowid, title, description) VALUES (NEW.id, NEW.title, NEW.description);
+    END
+    """,
+)
+
+
+def replace_sqlite_index(statements) -> None:
+    # FTS5 columns cannot be altered: recreate the table and index every task again
+    for action in ('insert', 'update', 'delete'):
+        op.execute(f"DROP TRIGGER IF EXISTS tasks_fts_{action}")
+    op.execute("DROP TABLE IF EXISTS tasks_fts")
+    for statement in statements:
+        op.execute(statement)
+    op.execute("INSERT INTO tasks_fts (tasks_fts) VALUES ('rebuild')")
+
+
+def upgrade() -> None:
+    """Index the owner with the text, so a search only reads the owner's entries."""
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute("CREATE EXTENSION IF NOT EXISTS btree_gin")
+        op.execute(
+            "CREATE INDEX IF NOT EXISTS ix_tasks_owner_search_vector ON tasks USING GIN (owner_id, search_vector)"
+        )
+        op.execute("DROP INDEX IF EXISTS ix_tasks_search_vector")
+        return
+    replace_sqlite_index(SQLITE_SEARCH_DDL)
+
+
+def downgrade() -> None:
+    """Go back to the text index without the owner."""
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute("CREATE INDEX IF NOT EXISTS ix_tasks_search_vector ON tasks USING GIN (search_vector)")
+        op.execute("DROP INDEX IF EXISTS ix_tasks_owner_search_vector")
+        return
+    replace_sqlite_index(PREVIOUS_SQLITE_SEARCH_DDL)
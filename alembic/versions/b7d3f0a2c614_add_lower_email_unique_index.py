@@ -0,0 +1,36 @@
+"""Add unique lower(email) index for case-insensitive email uniqueness
+
+Revision ID: b7d3f0a2c614
+Revises: 9e4b1d7c3a85
+Create Date: 2026-10-18 19:12:44.270381
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7d3f0a2c614'
+down_revision: Union[str, None] = '9e4b1d7c3a85'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Lowercase stored emails and index lower(email) uniquely."""
+    # Emails that only differ in case from an older account's are renamed, not deleted:
+    # logins use usernames, so the account keeps working and its owner can set a new email
+    op.execute(
+        "UPDATE users SET email = 'duplicate-' || id || '.' || lower(email) "
+        "WHERE EXISTS (SELECT 1 FROM users AS kept "
+        "WHERE lower(kept.email) = lower(users.email) AND kept.id < users.id)"
+    )
+    op.execute("UPDATE users SET email = lower(email) WHERE email <> lower(email)")
+    op.create_index('ix_users_lower_email', 'users', [sa.text('lower(email)')], unique=True)
+
+
+def downgrade() -> None:
+    """Drop the lower(email) index; lowercased and renamed emails stay as they are."""
+    op.drop_index('ix_users_lower_email', table_name='users')
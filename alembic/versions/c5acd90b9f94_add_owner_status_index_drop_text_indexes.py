@@ -0,0 +1,35 @@
+"""Add composite (owner_id, status, id) index and drop text column indexes
+
+Revision ID: c5acd90b9f94
+Revises: e37660fa4c06
+Create Date: 2026-10-18 10:03:41.552907
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c5acd90b9f94'
+down_revision: Union[str, None] = 'e37660fa4c06'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Replace the unused title/description indexes with the status listing index."""
+    # Nothing filters on title or description equality, so these only slow down writes
+    op.drop_index('ix_tasks_title', table_name='tasks', if_exists=True)
+    op.drop_index('ix_tasks_description', table_name='tasks', if_exists=True)
+
+    op.create_index('ix_tasks_owner_id_status_id', 'tasks', ['owner_id', 'status', 'id'], unique=False, if_not_exists=True)
+
+
+def downgrade() -> None:
+    """Restore the single-column text indexes and drop the status listing index."""
+    op.drop_index('ix_tasks_owner_id_status_id', table_name='tasks')
+
+    op.create_index('ix_tasks_description', 'tasks', ['description'], unique=False)
+    op.create_index('ix_tasks_title', 'tasks', ['title'], unique=False)
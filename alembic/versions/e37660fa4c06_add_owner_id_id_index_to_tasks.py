@@ -0,0 +1,28 @@
+"""Add composite (owner_id, id) index to tasks
+
+Revision ID: e37660fa4c06
+Revises: f2ad0ab1d745
+Create Date: 2026-10-18 09:12:04.118352
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e37660fa4c06'
+down_revision: Union[str, None] = 'f2ad0ab1d745'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add the index backing keyset pagination of a user's tasks."""
+    op.create_index('ix_tasks_owner_id_id', 'tasks', ['owner_id', 'id'], unique=False, if_not_exists=True)
+
+
+def downgrade() -> None:
+    """Drop the keyset pagination index."""
+    op.drop_index('ix_tasks_owner_id_id', table_name='tasks', if_exists=True)
@@ -0,0 +1,98 @@
+"""Decrement task status counts on delete without inserting counter rows
+
+Revision ID: f8c1d5a9e3b7
+Revises: a6f1c3e8b250
+Create Date: 2026-10-18 23:41:52.118304
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f8c1d5a9e3b7'
+down_revision: Union[str, None] = 'a6f1c3e8b250'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+APPLY_FUNCTION = """
+CREATE OR REPLACE FUNCTION tasks_status_count_apply() RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    -- Each counter gets its net change once, so one statement never updates a row twice
+    IF TG_OP = 'INSERT' THEN
+        INSERT INTO task_status_counts (owner_id, status, count)
+        SELECT owner_id, status, count(*) FROM new_rows GROUP BY owner_id, status
+        ON CONFLICT (owner_id, status) DO UPDATE SET count = task_status_counts.count + EXCLUDED.count;
+    ELSIF TG_OP = 'DELETE' THEN
+        -- Only decrement existing counters: when the owner is deleted, its counters
+        -- may already be gone by cascade, and inserting one would break the foreign key
+        UPDATE task_status_counts AS counts SET count = counts.count - deleted.count
+        FROM (
+            SELECT owner_id, status, count(*) AS count FROM old_rows GROUP BY owner_id, status
+        ) AS deleted
+        WHERE counts.owner_id = deleted.owner_id AND counts.status = deleted.status;
+    ELSE
+        INSERT INTO task_status_counts (owner_id, status, count)
+        SELECT owner_id, status, sum(delta) FROM (
+            SELECT o.owner_id, o.status, -1 AS delta
+            FROM old_rows o JOIN new_rows n ON n.id = o.id
+            WHERE o.owner_id <> n.owner_id OR o.status <> n.status
+            UNION ALL
+            SELECT n.owner_id, n.status, 1 AS delta
+            FROM old_rows o JOIN new_rows n ON n.id = o.id
+            WHERE o.owner_id <> n.owner_id OR o.status <> n.status
+        ) moves
+        GROUP BY owner_id, status
+        HAVING sum(delta) <> 0
+        ON CONFLICT (owner_id, status) DO UPDATE SET count = task_status_counts.count + EXCLUDED.count;
+    END IF;
+    RETURN NULL;
+END
+$$
+"""
+
+PREVIOUS_APPLY_FUNCTION = """
+CREATE OR REPLACE FUNCTION tasks_status_count_apply() RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    -- Each counter gets its net change once, so one statement never updates a row twice
+    IF TG_OP = 'INSERT' THEN
+        INSERT INTO task_status_counts (owner_id, status, count)
+        SELECT owner_id, status, count(*) FROM new_rows GROUP BY owner_id, status
+        ON CONFLICT (owner_id, status) DO UPDATE SET count = task_status_counts.count + EXCLUDED.count;
+    ELSIF TG_OP = 'DELETE' THEN
+        INSERT INTO task_status_counts (owner_id, status, count)
+        SELECT owner_id, status, -count(*) FROM old_rows GROUP BY owner_id, status
+        ON CONFLICT (owner_id, status) DO UPDATE SET count = task_status_counts.count + EXCLUDED.count;
+    ELSE
+        INSERT INTO task_status_counts (owner_id, status, count)
+        SELECT owner_id, status, sum(delta) FROM (
+            SELECT o.owner_id, o.status, -1 AS delta
+            FROM old_rows o JOIN new_rows n ON n.id = o.id
+            WHERE o.owner_id <> n.owner_id OR o.status <> n.status
+            UNION ALL
+            SELECT n.owner_id, n.status, 1 AS delta
+            FROM old_rows o JOIN new_rows n ON n.id = o.id
+            WHERE o.owner_id <> n.owner_id OR o.status <> n.status
+        ) moves
+        GROUP BY owner_id, status
+        HAVING sum(delta) <> 0
+        ON CONFLICT (owner_id, status) DO UPDATE SET count = task_status_counts.count + EXCLUDED.count;
+    END IF;
+    RETURN NULL;
+END
+$$
+"""
+
+
+def upgrade() -> None:
+    """Replace the PostgreSQL counter function; SQLite triggers already only decrement."""
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute(APPLY_FUNCTION)
+
+
+def downgrade() -> None:
+    """Restore the previous PostgreSQL counter function."""
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute(PREVIOUS_APPLY_FUNCTION)
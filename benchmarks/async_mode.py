@@ -0,0 +1,99 @@
+"""
+Compare throughput and tail latency of the sync and async database modes.
+
+Usage:
+    python -m benchmarks.async_mode --mode sync --clients 500 --requests 20
+    python -m benchmarks.async_mode --mode async --clients 500 --requests 20
+
+Each mode runs in its own process because DATABASE_ASYNC is read at import time.
+Clients hit ``GET /tasks?limit=20`` and ``GET /tasks/{task_id}`` in-process (no network),
+so the numbers reflect request handling and database access, not socket overhead.
+Point DATABASE_URL at Postgres for representative results; SQLite serializes writers.
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def run(clients: int, requests_per_client: int, tasks: int):
+    from httpx import ASGITransport, AsyncClient, Limits
+    from sqlalchemy import insert
+
+    from src.main import app
+    from src.models import Task, User
+    from src.services.auth import create_access_token
+    from src.services.database import DATABASE_ASYNC, Base, SessionLocal, engine
+
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    with SessionLocal() as db:
+        user = User(username="bench_user", email="bench_user@example.com", hashed_password="unused")
+        db.add(user)
+        db.commit()
+        db.execute(insert(Task), [
+            {"title": f"Task {i}", "description": "Benchmark task", "owner_id": user.id}
+            for i in range(tasks)
+        ])
+        db.commit()
+        user_id = user.id
+
+    headers = {"Authorization": f"Bearer {create_access_token(data={'sub': 'bench_user'})}"}
+    transport = ASGITransport(app=app)
+    latencies = []
+
+    async with AsyncClient(
+        transport=transport,
+        base_url="http://bench",
+        headers=headers,
+        limits=Limits(max_connections=clients),
+    ) as client:
+        async def worker(worker_id: int):
+            for i in range(requests_per_client):
+                started = time.perf_counter()
+                if i % 2:
+                    response = await client.get(f"/tasks/{(worker_id + i) % tasks + 1}")
+                else:
+                    response = await client.get("/tasks", params={"limit": 20})
+                latencies.append(time.perf_counter() - started)
+                assert response.status_code == 200, response.text
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker(n) for n in range(clients)))
+        elapsed = time.perf_counter() - started
+
+    total = clients * requests_per_client
+    mode = "async" if DATABASE_ASYNC else "sync"
+    print(f"mode={mode} user={user_id} clients={clients} requests={total} elapsed={elapsed:.2f}s")
+    print(
+        f"throughput={total / elapsed:.0f} req/s "
+        f"p50={statistics.median(latencies) * 1000:.1f}ms "
+        f"p99={percentile(latencies, 99) * 1000:.1f}ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--mode", choices=["sync", "async"], default="sync")
+    parser.add_argument("--clients", type=int, default=500)
+    parser.add_argument("--requests", type=int, default=20, help="Requests per client")
+    parser.add_argument("--tasks", type=int, default=1000)
+    args = parser.parse_args()
+
+    os.environ.setdefault("DATABASE_URL", "sqlite:///./bench_async_mode.db")
+    os.environ["DATABASE_ASYNC"] = "true" if args.mode == "async" else "false"
+    asyncio.run(run(args.clients, args.requests, args.tasks))
+
+
+if __name__ == "__main__":
+    main()
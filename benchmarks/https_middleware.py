@@ -0,0 +1,109 @@
+"""
+Measure the per-request overhead of the HTTPS enforcement middleware.
+
+Usage:
+    python -m benchmarks.https_middleware --requests 20000
+
+Compares a bare app, the previous ``@app.middleware("http")`` implementation (run through
+Starlette's BaseHTTPMiddleware, re-reading ENVIRONMENT per request) and HTTPSOnlyMiddleware.
+Requests are HTTPS in production mode, i.e. the pass-through path every real request takes.
+The ASGI app is called directly, so the numbers exclude any client or network overhead.
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi import FastAPI, HTTPException, Request  # noqa: E402
+
+from src.middleware import HTTPSOnlyMiddleware  # noqa: E402
+
+
+def make_app():
+    app = FastAPI()
+
+    @app.get("/ping")
+    async def ping():
+        return {"status": "success"}
+
+    return app
+
+
+def make_legacy_app():
+    app = make_app()
+
+    @app.middleware("http")
+    async def enforce_https_in_production(request: Request, call_next):
+        environment = os.getenv("ENVIRONMENT", "development")
+        if environment not in ["development", "production"]:
+            raise ValueError(f"Invalid ENVIRONMENT value: {environment}")
+
+        if environment == "production" and request.url.scheme != "https":
+            raise HTTPException(
+                status_code=400,
+                detail="HTTPS is required for secure communication"
+            )
+        response = await call_next(request)
+        return response
+
+    return app
+
+
+def make_asgi_app():
+    app = make_app()
+    app.add_middleware(HTTPSOnlyMiddleware, environment="production")
+    return app
+
+
+async def call(app, scope):
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    await app(dict(scope), receive, send)
+
+
+async def measure(app, requests: int) -> float:
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "https",
+        "path": "/ping",
+        "raw_path": b"/ping",
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"host", b"bench")],
+        "client": ("127.0.0.1", 12345),
+        "server": ("bench", 443),
+    }
+    # Warm up: builds the middleware stack and route caches
+    for _ in range(200):
+        await call(app, scope)
+    started = time.perf_counter()
+    for _ in range(requests):
+        await call(app, scope)
+    return (time.perf_counter() - started) / requests * 1_000_000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=20000)
+    args = parser.parse_args()
+
+    os.environ["ENVIRONMENT"] = "production"
+    apps = {"none": make_app(), "legacy": make_legacy_app(), "asgi": make_asgi_app()}
+    results = {name: asyncio.run(measure(app, args.requests)) for name, app in apps.items()}
+    for name, per_request in results.items():
+        overhead = per_request - results["none"]
+        print(f"middleware={name:<6} {per_request:7.1f} us/request  overhead={overhead:+6.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+Measure latency of an unrelated endpoint while a burst of logins is in flight.
+
+Usage:
+    python -m benchmarks.login_storm --mode pool --logins 200 --probes 200
+    python -m benchmarks.login_storm --mode inline   # bcrypt on the event loop (old behavior)
+
+The app runs in-process against a throwaway SQLite database; the probe endpoint is
+``GET /protected``, which only decodes the JWT and looks up the user.
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DATABASE_URL", "sqlite:///./bench_login_storm.db")
+
+from httpx import ASGITransport, AsyncClient  # noqa: E402
+
+from src.main import app  # noqa: E402
+from src.models import User  # noqa: E402
+from src.services import hashing  # noqa: E402
+from src.services.auth import create_access_token  # noqa: E402
+from src.services.database import Base, SessionLocal, engine  # noqa: E402
+
+USERNAME = "storm_user"
+PASSWORD = "password123"
+
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def setup_database():
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    with SessionLocal() as db:
+        db.add(User(
+            username=USERNAME,
+            email=f"{USERNAME}@example.com",
+            hashed_password=hashing.pwd_context.hash(PASSWORD),
+        ))
+        db.commit()
+
+
+def use_inline_hashing():
+    """Restore the old behavior of verifying bcrypt hashes on the event loop."""
+    async def verify_inline(plain_password, hashed_password):
+        return hashing.pwd_context.verify(plain_password, hashed_password)
+
+    hashing.verify_password = verify_inline
+
+
+async def run(mode: str, logins: int, probes: int, probe_interval: float):
+    if mode == "inline":
+        use_inline_hashing()
+    else:
+        # Start the worker processes before measuring
+        await hashing.hash_password("warmup")
+
+    token = create_access_token(data={"sub": USERNAME})
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://bench") as client:
+        async def login():
+            response = await client.post("/token", data={"username": USERNAME, "password": PASSWORD})
+            return response.status_code
+
+        async def probe():
+            started = time.perf_counter()
+            await client.get("/protected", headers={"Authorization": f"Bearer {token}"})
+            return time.perf_counter() - started
+
+        async def probe_loop():
+            latencies = []
+            for _ in range(probes):
+                latencies.append(await probe())
+                await asyncio.sleep(probe_interval)
+            return latencies
+
+        started = time.perf_counter()
+        login_results, latencies = await asyncio.gather(
+            asyncio.gather(*(login() for _ in range(logins))),
+            probe_loop(),
+        )
+        elapsed = time.perf_counter() - started
+
+    statuses = {code: login_results.count(code) for code in set(login_results)}
+    print(f"mode={mode} logins={logins} elapsed={elapsed:.2f}s login statuses={statuses}")
+    print(
+        "probe latency ms: "
+        f"p50={statistics.median(latencies) * 1000:.1f} "
+        f"p99={percentile(latencies, 99) * 1000:.1f} "
+        f"max={max(latencies) * 1000:.1f}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--mode", choices=["pool", "inline"], default="pool")
+    parser.add_argument("--logins", type=int, default=100)
+    parser.add_argument("--probes", type=int, default=100)
+    parser.add_argument("--probe-interval", type=float, default=0.01)
+    args = parser.parse_args()
+
+    setup_database()
+    try:
+        asyncio.run(run(args.mode, args.logins, args.probes, args.probe_interval))
+    finally:
+        hashing.shutdown_executor()
+
+
+if __name__ == "__main__":
+    main()
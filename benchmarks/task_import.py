@@ -0,0 +1,90 @@
+"""
+Measure time and memory of importing a large task upload.
+
+Usage:
+    python -m benchmarks.task_import --rows 100000 --format csv
+    python -m benchmarks.task_import --rows 100000 --format ndjson
+
+The upload is generated on the fly and streamed to ``POST /tasks/import`` in-process, so
+peak RSS growth reflects the server side only. Point DATABASE_URL at Postgres to measure
+the COPY path; SQLite uses multi-row INSERTs.
+"""
+import argparse
+import asyncio
+import os
+import resource
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DATABASE_URL", "sqlite:///./bench_task_import.db")
+
+import orjson  # noqa: E402
+from httpx import ASGITransport, AsyncClient  # noqa: E402
+
+from src.main import app  # noqa: E402
+from src.models import User  # noqa: E402
+from src.services.auth import create_access_token  # noqa: E402
+from src.services.database import Base, SessionLocal, engine  # noqa: E402
+
+USERNAME = "bench_user"
+CHUNK_ROWS = 1000
+
+
+def setup_database():
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    with SessionLocal() as db:
+        db.add(User(username=USERNAME, email="bench_user@example.com", hashed_password="unused"))
+        db.commit()
+
+
+async def generate_upload(rows: int, upload_format: str):
+    if upload_format == "csv":
+        yield b"title,description,status\n"
+    for start in range(0, rows, CHUNK_ROWS):
+        numbers = range(start, min(rows, start + CHUNK_ROWS))
+        if upload_format == "csv":
+            yield "".join(f'"Task {n}, imported",Benchmark row,pending\n' for n in numbers).encode()
+        else:
+            yield b"".join(
+                orjson.dumps({"title": f"Task {n}", "description": "Benchmark row", "status": "pending"}) + b"\n"
+                for n in numbers
+            )
+
+
+async def run(rows: int, upload_format: str):
+    headers = {"Authorization": f"Bearer {create_access_token(data={'sub': USERNAME})}"}
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://bench", headers=headers, timeout=None
+    ) as client:
+        # Warm up routing, validation and the connection pool before measuring
+        await client.post("/tasks/import", params={"format": "ndjson"}, content=b'{"title": "warm-up"}\n')
+
+        peak_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        started = time.perf_counter()
+        response = await client.post(
+            "/tasks/import", params={"format": upload_format}, content=generate_upload(rows, upload_format)
+        )
+        elapsed = time.perf_counter() - started
+        peak_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    assert response.status_code == 201, response.text
+    report = response.json()["data"]
+    print(f"format={upload_format} rows={rows} imported={report['imported']} failed={report['failed']}")
+    print(f"elapsed={elapsed:.2f}s throughput={rows / elapsed:.0f} rows/s "
+          f"peak_rss_growth={(peak_after - peak_before) / 1024:.1f}MB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--format", choices=["ndjson", "csv"], default="csv")
+    args = parser.parse_args()
+
+    setup_database()
+    asyncio.run(run(args.rows, args.format))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""
+Measure serialization of a large task list response.
+
+Usage:
+    python -m benchmarks.task_list_response --tasks 10000 --rounds 20
+
+Builds the ``GET /tasks`` envelope from already loaded tasks and runs it through FastAPI's
+response serialization and the response class, for two paths:
+
+- ``any``: dict payloads in an untyped ``ResponseModel`` rendered by ``JSONResponse``
+  (the previous behavior);
+- ``typed``: ``TaskData`` payloads validated against the route's ``ResponseModel[TaskList]``
+  and rendered by the app's default ``ORJSONResponse``.
+
+It then times complete ``GET /tasks`` requests in-process, which also include the query.
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DATABASE_URL", "sqlite:///./bench_task_list.db")
+
+from fastapi.responses import JSONResponse, ORJSONResponse  # noqa: E402
+from fastapi.routing import serialize_response  # noqa: E402
+from fastapi.utils import create_model_field  # noqa: E402
+from httpx import ASGITransport, AsyncClient  # noqa: E402
+from sqlalchemy import insert  # noqa: E402
+
+from src.main import app  # noqa: E402
+from src.models import Task, User  # noqa: E402
+from src.routers.task import serialize_task  # noqa: E402
+from src.schemas.response import ResponseModel  # noqa: E402
+from src.services.auth import create_access_token  # noqa: E402
+from src.services.database import Base, SessionLocal, engine  # noqa: E402
+
+USERNAME = "bench_user"
+
+
+def setup_database(tasks: int):
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    with SessionLocal() as db:
+        user = User(username=USERNAME, email="bench_user@example.com", hashed_password="unused")
+        db.add(user)
+        db.commit()
+        db.execute(insert(Task), [
+            {"title": f"Task {i}", "description": "Benchmark task description", "owner_id": user.id}
+            for i in range(tasks)
+        ])
+        db.commit()
+        return user.id
+
+
+def legacy_payload(task: Task) -> dict:
+    return {"id": task.id, "title": task.title, "status": task.status, "description": task.description}
+
+
+async def render(field, response_class, build_payload, tasks) -> bytes:
+    content = ResponseModel(
+        status="success",
+        message="Tasks retrieved successfully.",
+        data=[build_payload(task) for task in tasks],
+    )
+    return response_class(await serialize_response(field=field, response_content=content)).body
+
+
+async def time_serialization(rounds: int, user_id: int):
+    route = next(r for r in app.routes if getattr(r, "path", None) == "/tasks" and "GET" in r.methods)
+    paths = {
+        "any": (create_model_field("Response", ResponseModel), JSONResponse, legacy_payload),
+        "typed": (route.response_field, ORJSONResponse, serialize_task),
+    }
+    with SessionLocal() as db:
+        tasks = db.query(Task).filter(Task.owner_id == user_id).all()
+        bodies = {}
+        for name, (field, response_class, build_payload) in paths.items():
+            bodies[name] = await render(field, response_class, build_payload, tasks)
+            samples = []
+            for _ in range(rounds):
+                started = time.perf_counter()
+                await render(field, response_class, build_payload, tasks)
+                samples.append(time.perf_counter() - started)
+            print(f"serialize path={name:<5} median={statistics.median(samples) * 1000:7.1f}ms "
+                  f"bytes={len(bodies[name])}")
+
+
+async def time_requests(rounds: int):
+    headers = {"Authorization": f"Bearer {create_access_token(data={'sub': USERNAME})}"}
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://bench", headers=headers) as client:
+        await client.get("/tasks")
+        samples = []
+        for _ in range(rounds):
+            started = time.perf_counter()
+            response = await client.get("/tasks")
+            samples.append(time.perf_counter() - started)
+            assert response.status_code == 200, response.text
+    print(f"GET /tasks        median={statistics.median(samples) * 1000:7.1f}ms "
+          f"items={len(response.json()['data'])}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tasks", type=int, default=10000)
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    user_id = setup_database(args.tasks)
+    asyncio.run(time_serialization(args.rounds, user_id))
+    asyncio.run(time_requests(args.rounds))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+Measure the cost of idle task event streams and the latency of fanning out one change.
+
+Usage:
+    python -m benchmarks.task_stream --connections 5000
+
+Every connection is a ``GET /tasks/stream`` driven through the ASGI app in-process, so
+the numbers cover request handling and the event bus, not sockets. One task update is
+then made through ``PUT /tasks/{task_id}`` and timed until every stream has received it.
+"""
+import argparse
+import asyncio
+import os
+import resource
+import sys
+import threading
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DATABASE_URL", "sqlite:///./bench_task_stream.db")
+
+from httpx import ASGITransport, AsyncClient  # noqa: E402
+
+from src.main import app  # noqa: E402
+from src.models import Task, User  # noqa: E402
+from src.services.auth import create_access_token  # noqa: E402
+from src.services.database import Base, SessionLocal, engine  # noqa: E402
+
+USERNAME = "bench_user"
+
+
+def setup_database() -> int:
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    with SessionLocal() as db:
+        user = User(username=USERNAME, email="bench_user@example.com", hashed_password="unused")
+        db.add(user)
+        db.commit()
+        task = Task(title="Streamed", description="Benchmark task", owner_id=user.id)
+        db.add(task)
+        db.commit()
+        return task.id
+
+
+async def open_stream(token: str, received: asyncio.Queue, closed: asyncio.Event):
+    request_sent = False
+
+    async def receive():
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await closed.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        if message["type"] == "http.response.body" and message.get("body"):
+            received.put_nowait(message["body"])
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/tasks/stream",
+        "raw_path": b"/tasks/stream",
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"host", b"bench"), (b"authorization", f"Bearer {token}".encode())],
+        "client": ("127.0.0.1", 12345),
+        "server": ("bench", 80),
+    }
+    await app(scope, receive, send)
+
+
+async def run(connections: int, task_id: int):
+    token = create_access_token(data={"sub": USERNAME})
+    closed = asyncio.Event()
+    queues = [asyncio.Queue() for _ in range(connections)]
+
+    peak_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    started = time.perf_counter()
+    streams = [asyncio.create_task(open_stream(token, queue, closed)) for queue in queues]
+    for queue in queues:
+        await queue.get()
+    opened = time.perf_counter() - started
+    peak_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://bench") as client:
+        started = time.perf_counter()
+        response = await client.put(
+            f"/tasks/{task_id}", json={"title": "Updated"}, headers={"Authorization": f"Bearer {token}"}
+        )
+        assert response.status_code == 200, response.text
+        for queue in queues:
+            assert b"event: updated" in await queue.get()
+        fan_out = time.perf_counter() - started
+
+    print(f"connections={connections} threads={threading.active_count()} open={opened:.2f}s")
+    print(f"rss_per_connection={(peak_after - peak_before) / connections:.1f}KB "
+          f"update_to_last_delivery={fan_out * 1000:.1f}ms")
+
+    closed.set()
+    await asyncio.gather(*streams)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--connections", type=int, default=5000)
+    args = parser.parse_args()
+
+    task_id = setup_database()
+    asyncio.run(run(args.connections, task_id))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,16 @@
 import os
 import logging
 
-from fastapi import FastAPI, Request, HTTPException
+from fastapi import FastAPI, HTTPException
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
-from src.routers import task_router, user_router, auth_router
+from src.middleware import HTTPSOnlyMiddleware, RequestMetricsMiddleware, resolve_environment
+from src.routers import task_router, user_router, auth_router, metrics_router
 from src.services.database import Base, engine
+from src.services.hashing import shutdown_executor
+from src.services.idempotency import start_idempotency_key_purge, stop_idempotency_key_purge
+from src.services.task_sync import start_tombstone_purge, stop_tombstone_purge
 
 
 logging.basicConfig(
@@ -15,7 +19,11 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-app = FastAPI()
+# Resolved once at startup; an invalid value fails fast instead of on every request
+ENVIRONMENT = resolve_environment()
+
+# orjson renders response bodies several times faster than the stdlib json module
+app = FastAPI(default_response_class=ORJSONResponse)
 
 app.add_middleware(
     CORSMiddleware,
@@ -25,28 +33,38 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Enforce HTTPS in production; X-Forwarded-Proto is honored from TRUSTED_PROXIES only
+app.add_middleware(
+    HTTPSOnlyMiddleware,
+    environment=ENVIRONMENT,
+    trusted_proxies=os.getenv("TRUSTED_PROXIES", ""),
+)
+
+# Outermost, so latency covers the other middleware; set SERVER_TIMING=false to omit the header
+app.add_middleware(
+    RequestMetricsMiddleware,
+    server_timing=os.getenv("SERVER_TIMING", "true").lower() in ("1", "true", "yes"),
+)
+
 # Create the database tables
 Base.metadata.create_all(bind=engine)
 
+# Stop the password hashing worker processes with the application
+app.add_event_handler("shutdown", shutdown_executor)
+
+# Delete expired Idempotency-Key responses every IDEMPOTENCY_PURGE_INTERVAL_SECONDS
+app.add_event_handler("startup", start_idempotency_key_purge)
+app.add_event_handler("shutdown", stop_idempotency_key_purge)
+
+# Delete task tombstones older than TOMBSTONE_RETENTION_SECONDS every TOMBSTONE_PURGE_INTERVAL_SECONDS
+app.add_event_handler("startup", start_tombstone_purge)
+app.add_event_handler("shutdown", stop_tombstone_purge)
+
 # Include routers
 app.include_router(auth_router, tags=["Authentication"])
 app.include_router(user_router, tags=["Users"])
 app.include_router(task_router, tags=["Tasks"])
-
-# Enforce HTTPS in production
-@app.middleware("http")
-async def enforce_https_in_production(request: Request, call_next):
-    environment = os.getenv("ENVIRONMENT", "development")
-    if environment not in ["development", "production"]:
-        raise ValueError(f"Invalid ENVIRONMENT value: {environment}")
-
-    if environment == "production" and request.url.scheme != "https":
-        raise HTTPException(
-            status_code=400,
-            detail="HTTPS is required for secure communication"
-        )
-    response = await call_next(request)
-    return response
+app.include_router(metrics_router, tags=["Metrics"])
 
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request, exc):
@@ -0,0 +1,4 @@
+from .https import HTTPSOnlyMiddleware, resolve_environment, parse_trusted_proxies
+from .metrics import RequestMetricsMiddleware
+
+__all__ = ["HTTPSOnlyMiddleware", "RequestMetricsMiddleware", "resolve_environment", "parse_trusted_proxies"]
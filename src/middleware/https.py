@@ -0,0 +1,105 @@
+import ipaddress
+import logging
+import os
+from typing import Optional, Tuple, Union
+
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+)
+logger = logging.getLogger(__name__)
+
+ENVIRONMENTS = ("development", "production")
+
+IPNetwork = Union[ipaddress.IPv4Network, ipaddress.IPv6Network]
+
+
+def resolve_environment(value: Optional[str] = None) -> str:
+    """
+    Validate the ``ENVIRONMENT`` setting once, at startup.
+    """
+    environment = value if value is not None else os.getenv("ENVIRONMENT", "development")
+    if environment not in ENVIRONMENTS:
+        raise ValueError(f"Invalid ENVIRONMENT value: {environment}")
+    return environment
+
+
+def parse_trusted_proxies(value: Optional[str] = None) -> Tuple[bool, Tuple[IPNetwork, ...]]:
+    """
+    Parse ``TRUSTED_PROXIES``: comma-separated addresses or CIDR networks, or ``*`` for any peer.
+
+    Returns ``(trust_all, networks)``.
+    """
+    value = value if value is not None else os.getenv("TRUSTED_PROXIES", "")
+    entries = [entry.strip() for entry in value.split(",") if entry.strip()]
+    if "*" in entries:
+        return True, ()
+    return False, tuple(ipaddress.ip_network(entry, strict=False) for entry in entries)
+
+
+class HTTPSOnlyMiddleware:
+    """
+    Reject plain-HTTP requests in production with a 400 in the API's error format.
+
+    This is a raw ASGI middleware, so it adds no task or body streaming to requests the
+    way ``@app.middleware("http")`` does. ``X-Forwarded-Proto`` is only honored when the
+    immediate peer is a trusted proxy.
+    """
+
+    def __init__(
+            self,
+            app: ASGIApp,
+            environment: str = "development",
+            trusted_proxies: str = "",
+    ):
+        self.app = app
+        self.enforce = resolve_environment(environment) == "production"
+        self.trust_all, self.trusted_networks = parse_trusted_proxies(trusted_proxies)
+
+    def is_trusted_proxy(self, host: Optional[str]) -> bool:
+        if self.trust_all:
+            return True
+        if host is None or not self.trusted_networks:
+            return False
+        try:
+            address = ipaddress.ip_address(host)
+        except ValueError:
+            return False
+        return any(address in network for network in self.trusted_networks)
+
+    def request_scheme(self, scope: Scope) -> str:
+        scheme = scope.get("scheme", "http")
+        client = scope.get("client")
+        if not self.is_trusted_proxy(client[0] if client else None):
+            return scheme
+        for name, value in scope["headers"]:
+            if name == b"x-forwarded-proto":
+                # Proxies append to the list; the last entry was set by the proxy we trust
+                return value.decode("latin-1").split(",")[-1].strip().lower()
+        return scheme
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if not self.enforce or scope["type"] not in ("http", "websocket"):
+            await self.app(scope, receive, send)
+            return
+
+        if self.request_scheme(scope) in ("https", "wss"):
+            await self.app(scope, receive, send)
+            return
+
+        logger.error(f"HTTPS required at {scope.get('path')}")
+        if scope["type"] == "websocket":
+            # Closing before accept makes the server reject the handshake with a 403
+            await send({"type": "websocket.close", "code": 1008})
+            return
+        response = JSONResponse(
+            status_code=400,
+            content={
+                "status": "error",
+                "message": "HTTPS is required for secure communication",
+            },
+        )
+        await response(scope, receive, send)
@@ -0,0 +1,77 @@
+import time
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.services.metrics import (
+    REQUEST_DB_QUERIES,
+    REQUEST_DB_SECONDS,
+    REQUEST_DURATION_SECONDS,
+    REQUESTS_TOTAL,
+    RESPONSE_SIZE_BYTES,
+    RequestStats,
+    current_request_stats,
+)
+
+# Label for requests that matched no route, so unknown paths cannot grow the label set
+UNMATCHED_ROUTE = "unmatched"
+
+# Any other method is labelled OTHER, so arbitrary method tokens cannot grow it either
+HTTP_METHODS = frozenset({"GET", "HEAD", "POST", "PUT", "PATCH", "DELETE", "OPTIONS", "CONNECT", "TRACE"})
+OTHER_METHOD = "OTHER"
+
+
+def server_timing_header(stats: RequestStats, elapsed: float) -> str:
+    return (
+        f'db;dur={stats.db_seconds * 1000:.1f};desc="queries: {stats.db_queries}", '
+        f"total;dur={elapsed * 1000:.1f}"
+    )
+
+
+class RequestMetricsMiddleware:
+    """
+    Record latency, SQL statement count, DB time and response size per route template.
+
+    The route is read from ``scope["route"]``, which FastAPI sets once routing has matched,
+    so metrics are labelled ``/tasks/{task_id}`` rather than by concrete path. When
+    ``server_timing`` is on, responses carry the DB time and the time to the response start
+    in a ``Server-Timing`` header.
+    """
+
+    def __init__(self, app: ASGIApp, server_timing: bool = True):
+        self.app = app
+        self.server_timing = server_timing
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        stats = RequestStats()
+        token = current_request_stats.set(stats)
+        status_code = 500
+        response_size = 0
+
+        async def send_with_metrics(message: Message) -> None:
+            nonlocal status_code, response_size
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                if self.server_timing:
+                    headers = MutableHeaders(scope=message)
+                    headers.append("Server-Timing", server_timing_header(stats, time.perf_counter() - started))
+            elif message["type"] == "http.response.body":
+                response_size += len(message.get("body", b""))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_metrics)
+        finally:
+            current_request_stats.reset(token)
+            route = getattr(scope.get("route"), "path", UNMATCHED_ROUTE)
+            method = scope["method"] if scope["method"] in HTTP_METHODS else OTHER_METHOD
+            REQUESTS_TOTAL.inc(method, route, str(status_code))
+            REQUEST_DURATION_SECONDS.labels(method, route).observe(time.perf_counter() - started)
+            REQUEST_DB_QUERIES.labels(method, route).observe(stats.db_queries)
+            REQUEST_DB_SECONDS.labels(method, route).observe(stats.db_seconds)
+            RESPONSE_SIZE_BYTES.labels(method, route).observe(response_size)
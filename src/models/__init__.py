@@ -1,4 +1,7 @@
-from .task import Task, TaskStatus
+from .idempotency_key import IdempotencyKey
+from .task import Task, TaskStatus, TaskTombstone
+from .task_status_count import TaskStatusCount
+from . import task_search  # noqa: F401 - registers the full-text index DDL
 from .user import User
 
-__all__ = ["User", "Task", "TaskStatus"]
+__all__ = ["User", "Task", "TaskStatus", "TaskTombstone", "TaskStatusCount", "IdempotencyKey"]
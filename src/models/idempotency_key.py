@@ -0,0 +1,31 @@
+from datetime import datetime
+from typing import Any, Optional
+
+from sqlalchemy import JSON, DateTime, ForeignKey, Integer, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.services.database import Base
+
+
+class IdempotencyKey(Base):
+    """
+    Response of the first request sent with an ``Idempotency-Key``, replayed to retries.
+
+    The row is inserted before the request's writes and in the same transaction, so a
+    concurrent retry blocks on the primary key until the first request commits or rolls
+    back. Committed rows always carry a response.
+    """
+    __tablename__ = "idempotency_keys"
+
+    owner_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    # Method and route template, e.g. "POST /tasks": a key only replays on the endpoint it was used on
+    endpoint: Mapped[str] = mapped_column(String, primary_key=True)
+    key: Mapped[str] = mapped_column(String, primary_key=True)
+    # Hash of the request body; reusing a key for a different body is rejected
+    fingerprint: Mapped[str] = mapped_column(String, nullable=False)
+    status_code: Mapped[Optional[int]] = mapped_column(Integer)
+    response: Mapped[Optional[Any]] = mapped_column(JSON)
+    # Expired keys are deleted by the periodic purge, served by this index
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now(), index=True
+    )
@@ -1,21 +1,65 @@
-from sqlalchemy import ForeignKey, Integer, String, Enum, event
+from datetime import datetime
+
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, Enum, event, func
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 from src.enums.task_status import TaskStatus
 from src.services.database import Base
 
 class Task(Base):
     __tablename__ = "tasks"
+    __table_args__ = (
+        # Serves keyset pagination of a user's tasks: WHERE owner_id = ? AND id > ?
+        Index("ix_tasks_owner_id_id", "owner_id", "id"),
+        # Serves listing by status: WHERE owner_id = ? AND status = ? ORDER BY id
+        Index("ix_tasks_owner_id_status_id", "owner_id", "status", "id"),
+        # Serves title filters and sorting: WHERE owner_id = ? AND title >= ? ORDER BY title, id
+        Index("ix_tasks_owner_id_title_id", "owner_id", "title", "id"),
+        # Serves delta sync: WHERE owner_id = ? AND revision > ? ORDER BY revision
+        Index("ix_tasks_owner_id_revision", "owner_id", "revision"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
-    title: Mapped[str] = mapped_column(String, index=True, nullable=False)
-    description: Mapped[str] = mapped_column(String, index=True)
-    owner_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"), nullable=False)
+    title: Mapped[str] = mapped_column(String, nullable=False)
+    description: Mapped[str] = mapped_column(String)
+    owner_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     status: Mapped[TaskStatus] = mapped_column(Enum(TaskStatus), default=TaskStatus.PENDING, nullable=False)  # Pass enum, not .value
+    # Incremented on every update of the row; single-task ETags and If-Match preconditions use it
+    version: Mapped[int] = mapped_column(Integer, nullable=False, default=1, server_default="1")
+    # Owner's tasks_version at the last write of the row; delta sync returns rows past a revision
+    revision: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now()
+    )
 
 
     # Relationship to user
     owner = relationship("User", back_populates="todos")
 
+    # ORM flushes update and delete rows only at the version they were loaded with, and raise
+    # StaleDataError otherwise. Statements written without the ORM unit of work (single-task
+    # routes, bulk endpoints) compare and increment the version themselves.
+    __mapper_args__ = {"version_id_col": version}
+
+
+class TaskTombstone(Base):
+    """
+    Marker left by a deleted task, so delta sync can tell clients to drop it.
+    """
+    __tablename__ = "task_tombstones"
+    __table_args__ = (
+        Index("ix_task_tombstones_owner_id_revision", "owner_id", "revision"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    task_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    owner_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    revision: Mapped[int] = mapped_column(Integer, nullable=False)
+    # Tombstones past the retention window are deleted by the periodic purge, served by this index
+    deleted_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now(), index=True
+    )
+
+
 @event.listens_for(Task, "before_insert")
 def debug_before_insert(mapper, connection, target):
     print(f"Task being inserted: {target.title}, {target.status}")
\ No newline at end of file
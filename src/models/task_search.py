@@ -0,0 +1,108 @@
+from sqlalchemy import DDL, Connection, event, text
+
+from src.models.task import Task
+from src.services.database import Base
+
+# Full-text index over task titles and descriptions. It is not mapped: the ORM never reads
+# it, and only src.services.task_search queries it.
+
+# Stemming configuration shared by both databases: PostgreSQL's english text search
+# configuration, SQLite FTS5's porter tokenizer
+SEARCH_CONFIG = "english"
+
+# SQLite: an external-content FTS5 table over tasks, kept in sync by triggers. It carries
+# the owner so searches filter on it within the index; it is not tokenized.
+SQLITE_SEARCH_DDL = (
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS tasks_fts USING fts5(
+        title, description, owner_id UNINDEXED,
+        content='tasks', content_rowid='id', tokenize='porter unicode61'
+    )
+    """,
+    """
+    CREATE TRIGGER tasks_fts_insert AFTER INSERT ON tasks
+    BEGIN
+        INSERT INTO tasks_fts (rowid, title, description, owner_id)
+        VALUES (NEW.id, NEW.title, NEW.description, NEW.owner_id);
+    END
+    """,
+    """
+    CREATE TRIGGER tasks_fts_delete AFTER DELETE ON tasks
+    BEGIN
+        INSERT INTO tasks_fts (tasks_fts, rowid, title, description, owner_id)
+        VALUES ('delete', OLD.id, OLD.title, OLD.description, OLD.owner_id);
+    END
+    """,
+    """
+    CREATE TRIGGER tasks_fts_update AFTER UPDATE OF title, description, owner_id ON tasks
+    BEGIN
+        INSERT INTO tasks_fts (tasks_fts, rowid, title, description, owner_id)
+        VALUES ('delete', OLD.id, OLD.title, OLD.description, OLD.owner_id);
+        INSERT INTO tasks_fts (rowid, title, description, owner_id)
+        VALUES (NEW.id, NEW.title, NEW.description, NEW.owner_id);
+    END
+    """,
+)
+
+# PostgreSQL: a generated tsvector column, so every write path including COPY maintains it,
+# with the title weighted above the description, and a GIN index on the owner and the
+# vector (btree_gin), so a search only reads the owner's entries
+POSTGRESQL_SEARCH_DDL = (
+    "CREATE EXTENSION IF NOT EXISTS btree_gin",
+    f"""
+    ALTER TABLE tasks ADD COLUMN IF NOT EXISTS search_vector tsvector GENERATED ALWAYS AS (
+        setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(title, '')), 'A')
+        || setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(description, '')), 'B')
+    ) STORED
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_tasks_owner_search_vector ON tasks USING GIN (owner_id, search_vector)",
+    # The index without the owner, from before searches were scoped in the index
+    "DROP INDEX IF EXISTS ix_tasks_search_vector",
+)
+
+SQLITE_SEARCH_OBJECTS = ("tasks_fts",) + tuple(f"tasks_fts_{action}" for action in ("insert", "delete", "update"))
+
+
+def install_search_index(connection: Connection) -> None:
+    """
+    Create the text index if any part of it is missing or it predates the owner column,
+    and index the existing tasks.
+
+    Safe to run on every start: with the index in place it only reads the catalog.
+    """
+    dialect = connection.dialect.name
+    if dialect == "sqlite":
+        installed = dict(connection.execute(text(
+            "SELECT name, sql FROM sqlite_master "
+            "WHERE type IN ('table', 'trigger') AND tbl_name IN ('tasks', 'tasks_fts')"
+        )).all())
+        if set(SQLITE_SEARCH_OBJECTS) <= set(installed) and "owner_id" in installed["tasks_fts"]:
+            return
+        for action in ("insert", "delete", "update"):
+            connection.execute(text(f"DROP TRIGGER IF EXISTS tasks_fts_{action}"))
+        # The FTS5 columns cannot be altered; the table is rebuilt below either way
+        connection.execute(text("DROP TABLE IF EXISTS tasks_fts"))
+        for statement in SQLITE_SEARCH_DDL:
+            connection.execute(text(statement))
+        # Index the rows written while the triggers were missing
+        connection.execute(text("INSERT INTO tasks_fts (tasks_fts) VALUES ('rebuild')"))
+    elif dialect == "postgresql":
+        installed = connection.execute(text(
+            "SELECT 1 FROM pg_indexes WHERE tablename = 'tasks' AND indexname = 'ix_tasks_owner_search_vector'"
+        )).first()
+        if installed is not None:
+            return
+        # The generated column is computed for existing rows as it is added
+        for statement in POSTGRESQL_SEARCH_DDL:
+            connection.execute(text(statement))
+
+
+# Runs after every ``Base.metadata.create_all``, including the one at startup against an
+# existing database whose tables it skips, so the index cannot be left out
+@event.listens_for(Base.metadata, "after_create")
+def install_search_index_after_create(target, connection: Connection, **kw) -> None:
+    install_search_index(connection)
+
+
+# The FTS5 table outlives a dropped tasks table and would keep indexing its old rows
+event.listen(Task.__table__, "after_drop", DDL("DROP TABLE IF EXISTS tasks_fts").execute_if(dialect="sqlite"))
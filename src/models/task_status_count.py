@@ -0,0 +1,146 @@
+from sqlalchemy import Connection, Enum, ForeignKey, Integer, event, text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.enums.task_status import TaskStatus
+from src.models.task import Task
+from src.services.database import Base
+
+
+class TaskStatusCount(Base):
+    """
+    Number of tasks per owner and status, maintained by triggers on ``tasks``.
+
+    Every write path (ORM, bulk statements, COPY, cascades) goes through the triggers,
+    so the counts stay exact without application code having to remember them.
+    """
+    __tablename__ = "task_status_counts"
+
+    owner_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    status: Mapped[TaskStatus] = mapped_column(Enum(TaskStatus), primary_key=True)
+    count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+
+
+# SQLite has no statement-level triggers: adjust the counters row by row
+SQLITE_TRIGGERS = (
+    """
+    CREATE TRIGGER tasks_status_count_insert AFTER INSERT ON tasks
+    BEGIN
+        INSERT INTO task_status_counts (owner_id, status, count) VALUES (NEW.owner_id, NEW.status, 1)
+        ON CONFLICT (owner_id, status) DO UPDATE SET count = count + 1;
+    END
+    """,
+    """
+    CREATE TRIGGER tasks_status_count_delete AFTER DELETE ON tasks
+    BEGIN
+        UPDATE task_status_counts SET count = count - 1
+        WHERE owner_id = OLD.owner_id AND status = OLD.status;
+    END
+    """,
+    """
+    CREATE TRIGGER tasks_status_count_update AFTER UPDATE OF owner_id, status ON tasks
+    WHEN OLD.owner_id IS NOT NEW.owner_id OR OLD.status IS NOT NEW.status
+    BEGIN
+        UPDATE task_status_counts SET count = count - 1
+        WHERE owner_id = OLD.owner_id AND status = OLD.status;
+        INSERT INTO task_status_counts (owner_id, status, count) VALUES (NEW.owner_id, NEW.status, 1)
+        ON CONFLICT (owner_id, status) DO UPDATE SET count = count + 1;
+    END
+    """,
+)
+
+# PostgreSQL aggregates each statement's transition tables, so a bulk INSERT, UPDATE,
+# DELETE or COPY touches every affected counter once instead of once per row
+POSTGRESQL_TRIGGERS = (
+    """
+    CREATE OR REPLACE FUNCTION tasks_status_count_apply() RETURNS trigger LANGUAGE plpgsql AS $$
+    BEGIN
+        -- Each counter gets its net change once, so one statement never updates a row twice
+        IF TG_OP = 'INSERT' THEN
+            INSERT INTO task_status_counts (owner_id, status, count)
+            SELECT owner_id, status, count(*) FROM new_rows GROUP BY owner_id, status
+            ON CONFLICT (owner_id, status) DO UPDATE SET count = task_status_counts.count + EXCLUDED.count;
+        ELSIF TG_OP = 'DELETE' THEN
+            -- Only decrement existing counters: when the owner is deleted, its counters
+            -- may already be gone by cascade, and inserting one would break the foreign key
+            UPDATE task_status_counts AS counts SET count = counts.count - deleted.count
+            FROM (
+                SELECT owner_id, status, count(*) AS count FROM old_rows GROUP BY owner_id, status
+            ) AS deleted
+            WHERE counts.owner_id = deleted.owner_id AND counts.status = deleted.status;
+        ELSE
+            INSERT INTO task_status_counts (owner_id, status, count)
+            SELECT owner_id, status, sum(delta) FROM (
+                SELECT o.owner_id, o.status, -1 AS delta
+                FROM old_rows o JOIN new_rows n ON n.id = o.id
+                WHERE o.owner_id <> n.owner_id OR o.status <> n.status
+                UNION ALL
+                SELECT n.owner_id, n.status, 1 AS delta
+                FROM old_rows o JOIN new_rows n ON n.id = o.id
+                WHERE o.owner_id <> n.owner_id OR o.status <> n.status
+            ) moves
+            GROUP BY owner_id, status
+            HAVING sum(delta) <> 0
+            ON CONFLICT (owner_id, status) DO UPDATE SET count = task_status_counts.count + EXCLUDED.count;
+        END IF;
+        RETURN NULL;
+    END
+    $$
+    """,
+    """
+    CREATE TRIGGER tasks_status_count_insert AFTER INSERT ON tasks
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION tasks_status_count_apply()
+    """,
+    """
+    CREATE TRIGGER tasks_status_count_delete AFTER DELETE ON tasks
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION tasks_status_count_apply()
+    """,
+    """
+    CREATE TRIGGER tasks_status_count_update AFTER UPDATE ON tasks
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION tasks_status_count_apply()
+    """,
+)
+
+TRIGGER_NAMES = tuple(f"tasks_status_count_{action}" for action in ("insert", "delete", "update"))
+
+
+def install_status_count_triggers(connection: Connection) -> None:
+    """
+    Install the counter triggers if any is missing, then rebuild the counts from tasks.
+
+    Safe to run on every start: with the triggers in place it only reads the catalog.
+    Counts are rebuilt after the triggers exist, so writes made meanwhile are not lost.
+    """
+    dialect = connection.dialect.name
+    if dialect == "sqlite":
+        statements = SQLITE_TRIGGERS
+        installed = "SELECT name FROM sqlite_master WHERE type = 'trigger' AND tbl_name = 'tasks'"
+    elif dialect == "postgresql":
+        statements = POSTGRESQL_TRIGGERS
+        installed = "SELECT tgname FROM pg_trigger WHERE tgrelid = 'tasks'::regclass"
+    else:
+        return
+    if set(TRIGGER_NAMES) <= set(connection.execute(text(installed)).scalars()):
+        return
+
+    if dialect == "postgresql":
+        # Block task writes until the counts are rebuilt
+        connection.execute(text("LOCK TABLE tasks IN SHARE ROW EXCLUSIVE MODE"))
+    for name in TRIGGER_NAMES:
+        connection.execute(text(f"DROP TRIGGER IF EXISTS {name}" + (" ON tasks" if dialect == "postgresql" else "")))
+    for statement in statements:
+        connection.execute(text(statement))
+    connection.execute(text("DELETE FROM task_status_counts"))
+    connection.execute(text(
+        "INSERT INTO task_status_counts (owner_id, status, count) "
+        "SELECT owner_id, status, count(*) FROM tasks GROUP BY owner_id, status"
+    ))
+
+
+# Runs after every ``Base.metadata.create_all``, including the one at startup against an
+# existing database whose tables it skips, so the triggers cannot be left out
+@event.listens_for(Base.metadata, "after_create")
+def install_status_count_triggers_after_create(target, connection: Connection, **kw) -> None:
+    install_status_count_triggers(connection)
@@ -1,5 +1,5 @@
-from sqlalchemy import Boolean, Integer, String
-from sqlalchemy.orm import relationship, Mapped, mapped_column
+from sqlalchemy import Boolean, Index, Integer, String, func
+from sqlalchemy.orm import relationship, Mapped, mapped_column, validates
 
 from src.services.database import Base
 
@@ -13,6 +13,20 @@ class User(Base):
     hashed_password: Mapped[str] = mapped_column(String, nullable=False)
     disabled: Mapped[bool] = mapped_column(Boolean, default=False)
     is_admin: Mapped[bool] = mapped_column(Boolean, default=False)
+    # Incremented whenever any of the user's tasks is created, updated or deleted
+    tasks_version: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
 
-    # Relationship to user
-    todos = relationship("Task", back_populates="owner", cascade="all, delete-orphan")
+    # Relationship to user. Deleting a user leaves its tasks to the database's ON DELETE
+    # CASCADE instead of loading and deleting them one by one
+    todos = relationship("Task", back_populates="owner", cascade="all, delete-orphan", passive_deletes=True)
+
+    @validates("email")
+    def normalize_email(self, key: str, email: str) -> str:
+        """
+        Store emails lowercased, so they match the lower(email) index they are looked up by.
+        """
+        return email.lower() if email is not None else email
+
+
+# Emails are unique regardless of case; duplicate checks compare lower(email) to use it
+Index("ix_users_lower_email", func.lower(User.email), unique=True)
@@ -1,13 +1,13 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
-from passlib.context import CryptContext
 from fastapi.security import OAuth2PasswordRequestForm
 from typing import Optional
 import logging
 import os
 
-from src.services.dependencies import get_db, get_current_user
+from src.services.dependencies import get_db, get_current_user, run_db
 from src.services.auth import create_access_token
+from src.services import hashing
 from src.models.user import User
 from src.schemas.user import CurrentUser
 from src.schemas.response import ResponseModel
@@ -17,13 +17,10 @@ router = APIRouter()
 logger = logging.getLogger("auth")
 logger.setLevel(logging.INFO)
 
-# Password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
 # Helper function to verify the user's password
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify that a plain password matches a hashed password."""
-    return pwd_context.verify(plain_password, hashed_password)
+    return hashing.verify_password_sync(plain_password, hashed_password)
 
 
 # Helper function to get a user by username
@@ -34,7 +31,7 @@ def get_user_by_username(db: Session, username: str) -> Optional[User]:
 # New function to hash a password before storing it
 def get_password_hash(password: str) -> str:
     """Hash a password using bcrypt."""
-    return pwd_context.hash(password)
+    return hashing.hash_password_sync(password)
 
 # New function to create a user with hashed password
 def create_user(db: Session, username: str, email: str, password: str, is_admin: bool = False):
@@ -62,9 +59,9 @@ async def login_for_access_token(
     if os.getenv("ENVIRONMENT") == "development":
         logger.debug(f"Login attempt for username: {form_data.username}")
 
-    # Validate user credentials
-    user = get_user_by_username(db, form_data.username)
-    if not user or not verify_password(form_data.password, user.hashed_password):
+    # Validate user credentials; the query goes through run_db and bcrypt through the hashing pool
+    user = await run_db(db, get_user_by_username, form_data.username)
+    if not user or not await hashing.verify_password(form_data.password, user.hashed_password):
         logger.warning(f"Invalid credentials for username: {form_data.username}")
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
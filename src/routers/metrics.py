@@ -0,0 +1,106 @@
+from fastapi import APIRouter, Depends
+from fastapi.responses import PlainTextResponse
+
+from src.schemas.response import ResponseModel
+from src.schemas.user import CurrentUser
+from src.services.database import POOL_WAIT_SECONDS, pool_stats
+from src.services.dependencies import get_current_admin
+from src.services.metrics import REQUEST_FAMILIES, render_histogram
+from src.services.idempotency import idempotency_cache_stats
+from src.services.user_cache import user_cache_stats
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def render_prometheus_metrics() -> str:
+    """
+    Render request, connection pool, user cache and idempotency cache metrics in the Prometheus text format.
+    """
+    lines = []
+    for family in REQUEST_FAMILIES:
+        lines.extend(family.render())
+
+    pool = pool_stats()
+    lines.extend([
+        "# HELP db_pool_wait_seconds Time spent waiting for a pooled connection.",
+        "# TYPE db_pool_wait_seconds histogram",
+        *render_histogram("db_pool_wait_seconds", POOL_WAIT_SECONDS),
+        "# HELP db_pool_timeouts_total Checkouts that gave up after the pool timeout.",
+        "# TYPE db_pool_timeouts_total counter",
+        f"db_pool_timeouts_total {pool['timeouts']}",
+    ])
+    for key in ("checked_out", "overflow"):
+        if key in pool:
+            lines.extend([
+                f"# HELP db_pool_{key} Connections currently {key.replace('_', ' ')} of the pool.",
+                f"# TYPE db_pool_{key} gauge",
+                f"db_pool_{key} {pool[key]}",
+            ])
+
+    cache = user_cache_stats()
+    for key in ("hits", "misses", "evictions"):
+        lines.extend([
+            f"# HELP user_cache_{key}_total Authenticated-user cache {key}.",
+            f"# TYPE user_cache_{key}_total counter",
+            f"user_cache_{key}_total {cache[key]}",
+        ])
+
+    cache = idempotency_cache_stats()
+    for key in ("hits", "misses", "evictions"):
+        lines.extend([
+            f"# HELP idempotency_cache_{key}_total Idempotency-Key response cache {key}.",
+            f"# TYPE idempotency_cache_{key}_total counter",
+            f"idempotency_cache_{key}_total {cache[key]}",
+        ])
+    return "\n".join(lines) + "\n"
+
+
+@router.get("/metrics",
+            response_class=PlainTextResponse,
+            summary="Prometheus metrics",
+)
+async def get_prometheus_metrics() -> PlainTextResponse:
+    """
+    Expose per-route latency, SQL statement counts, DB time and response sizes for this worker.
+
+    Public so that Prometheus can scrape it without a user token: it only holds aggregate
+    counters per route template, never user data or IDs. Keep it off the public network
+    at the proxy.
+    """
+    return PlainTextResponse(render_prometheus_metrics(), media_type=PROMETHEUS_CONTENT_TYPE)
+
+
+@router.get("/metrics/user-cache",
+            response_model=ResponseModel,
+            summary="Authenticated-user cache statistics",
+)
+async def get_user_cache_metrics(current_user: CurrentUser = Depends(get_current_admin)) -> ResponseModel:
+    """
+    Report size and hit/miss counters of the authenticated-user cache for this worker (admins only).
+    """
+    return ResponseModel(
+        status="success",
+        message="User cache statistics retrieved successfully.",
+        data=user_cache_stats()
+    )
+
+
+@router.get("/metrics/pool",
+            response_model=ResponseModel,
+            summary="Database connection pool statistics",
+)
+async def get_pool_metrics(current_user: CurrentUser = Depends(get_current_admin)) -> ResponseModel:
+    """
+    Report checked-out connections, overflow, timeouts and checkout wait times for this worker (admins only).
+    """
+    return ResponseModel(
+        status="success",
+        message="Connection pool statistics retrieved successfully.",
+        data=pool_stats()
+    )
@@ -1,12 +1,38 @@
-from fastapi import APIRouter, Depends, status, HTTPException, Path
+from typing import List, Literal, NoReturn, Optional, Union
+
+from fastapi import APIRouter, Depends, status, HTTPException, Header, Path, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 from src.models import Task, User
-from src.schemas import TaskCreate, TaskUpdate
+from src.schemas import (
+    TaskBulkCreate,
+    TaskBulkDelete,
+    TaskBulkUpdate,
+    TaskChanges,
+    TaskCreate,
+    TaskData,
+    TaskImportReport,
+    TaskPage,
+    TaskStats,
+    TaskUpdate,
+)
 from src.schemas.response import ResponseModel
 from src.schemas.user import CurrentUser
-from src.services.dependencies import get_db, get_current_user
-from src.services.crud import get_item_by_id, create_item
+from src.services.dependencies import get_db, get_current_user, with_db_session
+from src.services.idempotency import claim_idempotency_key, commit_idempotent, idempotent_request
+from src.services.etag import etag_matches, if_match_versions, make_etag, not_modified, set_etag, version_etag
+from src.services.owned_tasks import delete_owned_task, get_owned_task, get_task_owner, update_owned_task
+from src.services.pagination import MAX_PAGE_SIZE, keyset_order_by, paginate_keyset
+from src.services.task_bulk import bulk_create_tasks, bulk_delete_tasks, bulk_update_tasks
+from src.services.task_events import RESYNC, publish_task_event, stream_task_events
+from src.services.task_export import EXPORT_MEDIA_TYPES, stream_task_export
+from src.services.task_filters import TaskListing, parse_task_listing
+from src.services.task_import import import_task_upload
+from src.services.task_search import search_tasks
+from src.services.task_stats import get_task_stats
+from src.services.task_sync import decode_sync_token, get_task_changes
+from src.services.task_versions import bump_tasks_version, get_tasks_version
 from src.enums.task_status import TaskStatus
 
 import logging
@@ -20,37 +46,105 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+
+def build_task_query(
+        db: Session,
+        owner_id: int,
+        task_status: Optional[str] = None,
+        listing: Optional[TaskListing] = None,
+):
+    """
+    Build the listing query for a user's tasks in ID order, optionally filtered by status
+    or by compiled listing parameters, which may also change the order.
+
+    The filters line up with the ``(owner_id, id)``, ``(owner_id, status, id)`` and
+    ``(owner_id, title, id)`` composite indexes; keep them in sync with ``Task.__table_args__``.
+    Ordering by ID keeps full listings stable and lets SQLite pick the index that returns
+    rows in order.
+    """
+    query = db.query(Task).filter(Task.owner_id == owner_id)
+    if task_status is not None:
+        query = query.filter(Task.status == task_status)
+    if listing is not None:
+        return query.filter(*listing.filters).order_by(*keyset_order_by(Task.id, listing.order))
+    return query.order_by(Task.id)
+
+
+# Listing routes return the full list, or a page when cursor pagination is requested
+TaskList = Union[List[TaskData], TaskPage]
+
+
+def serialize_task(task: Task) -> TaskData:
+    """
+    Build the response payload for a single task.
+    """
+    return TaskData(id=task.id, title=task.title, status=task.status, description=task.description)
+
+
+def build_task_page(tasks: list, next_cursor: Optional[str]) -> TaskPage:
+    """
+    Build the response payload for one page of tasks in cursor mode.
+    """
+    return TaskPage(items=[serialize_task(task) for task in tasks], next_cursor=next_cursor)
+
+
+def task_collection_etag(db: Session, owner_id: int) -> str:
+    """
+    Build the ETag shared by every listing of the owner's tasks from the collection version.
+
+    Only the version is read, so an unchanged collection is revalidated without loading
+    any task rows. The listing parameters are part of the URL, which caches key on.
+    """
+    return make_etag("tasks", owner_id, get_tasks_version(db, owner_id))
+
+
+def task_etag(task: Task) -> str:
+    return version_etag(task.version)
+
 # Helper function for task validation
-def validate_task_existence(task_id: int, db: Session, current_user: CurrentUser) -> Task:
+def raise_task_access_error(task_id: int, db: Session, current_user: CurrentUser) -> NoReturn:
     """
-    Ensure that a task exists and belongs to the current user.
+    Raise 404 or 403 for a task that an owner-filtered statement did not match, or 412
+    if the owner's task exists and only an If-Match version condition failed.
+
+    Only failed lookups pay for this extra query; successful reads and writes filter by
+    ``(id, owner_id)`` in their single statement.
     """
-    task = get_item_by_id(Task, task_id, db)
-    if not task:
+    owner_id = get_task_owner(db, task_id)
+    if owner_id is None:
         logger.warning(f"Task with ID '{task_id}' not found.")
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Task with ID '{task_id}' not found."
+            detail=f"Task with ID {task_id} not found"
         )
-    if task.owner_id != current_user.id:
-        logger.warning(f"Unauthorized access: Task ID '{task_id}' is not owned by User ID '{current_user.id}'.")
+    if owner_id == current_user.id:
+        logger.warning(f"Precondition failed: Task ID '{task_id}' was modified by another request.")
         raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You are not authorized to access this task."
+            status_code=status.HTTP_412_PRECONDITION_FAILED,
+            detail="Task has been modified since it was fetched; fetch it again before writing."
         )
-    return task
+    logger.warning(f"Unauthorized access: Task ID '{task_id}' is not owned by User ID '{current_user.id}'.")
+    raise HTTPException(
+        status_code=status.HTTP_403_FORBIDDEN,
+        detail="You are not authorized to access this task."
+    )
 
 
 @router.post("/tasks",
              response_model=ResponseModel,
              status_code=status.HTTP_201_CREATED,
              summary="Create a Task")
+@with_db_session
 def create_task(
         task: TaskCreate,
+        idempotency_key: Optional[str] = Header(None),
         db: Session = Depends(get_db)
 ) -> ResponseModel:
     """
     Create a new task for the authenticated user.
+
+    With an ``Idempotency-Key`` header, retries of a successful request replay its response
+    instead of creating the task again.
     """
     owner = db.query(User).filter_by(id=task.owner_id).first()
     if not owner:
@@ -75,6 +169,11 @@ def create_task(
             detail=f"Invalid task status: '{task.status}'. Allowed values are: 'pending', 'in-progress', 'completed'."
         )
 
+    idempotency = idempotent_request(idempotency_key, task.owner_id, "POST /tasks", task)
+    replay = claim_idempotency_key(db, idempotency)
+    if replay is not None:
+        return replay
+
     task_data = {
         "title": task.title,
         "description": task.description,
@@ -82,27 +181,153 @@ def create_task(
         "status": task_status.value,
     }
 
-    new_task = create_item(Task, task_data, db)
-    logger.info(f"Task '{new_task.title}' created successfully with ID {new_task.id} and status: {new_task.status}")
-    return ResponseModel(
+    # The version bump, the task and the stored response for retries commit together
+    task_data["revision"] = bump_tasks_version(db, task.owner_id)
+    new_task = Task(**task_data)
+    db.add(new_task)
+    db.flush()
+    # Read before the commit expires the task, which would reload it
+    created = serialize_task(new_task)
+    result = ResponseModel(
         status="success",
         message="Task created successfully.",
-        data={"id": new_task.id, "title": new_task.title, "status": new_task.status}
+        data={"id": created["id"], "title": created["title"], "status": created["status"]}
+    )
+    commit_idempotent(db, idempotency, status.HTTP_201_CREATED, result)
+    publish_task_event(task.owner_id, "created", created)
+    logger.info(f"Task '{created['title']}' created successfully with ID {created['id']} and status: {created['status']}")
+    return result
+
+
+# Bulk routes are registered before "/tasks/{task_id}" so "bulk" is not parsed as a task ID
+@router.post("/tasks/bulk",
+             response_model=ResponseModel,
+             status_code=status.HTTP_201_CREATED,
+             summary="Create tasks in bulk")
+@with_db_session
+def create_tasks_bulk(
+        payload: TaskBulkCreate,
+        db: Session = Depends(get_db),
+        current_user: CurrentUser = Depends(get_current_user)
+) -> ResponseModel:
+    """
+    Create many tasks for the authenticated user in a single statement and transaction.
+    """
+    results = bulk_create_tasks(db, current_user.id, payload.items)
+    for result in results:
+        publish_task_event(current_user.id, "created", TaskData(
+            id=result["id"],
+            title=result["title"],
+            status=result["status"],
+            description=payload.items[result["index"]].description or "",
+        ))
+    logger.info(f"Bulk created {len(results)} tasks for User ID '{current_user.id}'.")
+    return ResponseModel(
+        status="success",
+        message="Tasks created successfully.",
+        data=results
+    )
+
+
+@router.patch("/tasks/bulk",
+              response_model=ResponseModel,
+              summary="Update tasks in bulk")
+@with_db_session
+def update_tasks_bulk(
+        payload: TaskBulkUpdate,
+        db: Session = Depends(get_db),
+        current_user: CurrentUser = Depends(get_current_user)
+) -> ResponseModel:
+    """
+    Update many of the authenticated user's tasks in a single statement and transaction.
+    """
+    results = bulk_update_tasks(db, current_user.id, payload.items)
+    for result in results:
+        if result["result"] == "updated":
+            publish_task_event(current_user.id, "updated", TaskData(
+                id=result["id"], title=result["title"], status=result["status"], description=result["description"]
+            ))
+    updated = sum(1 for result in results if result["result"] == "updated")
+    logger.info(f"Bulk updated {updated}/{len(results)} tasks for User ID '{current_user.id}'.")
+    return ResponseModel(
+        status="success",
+        message=f"{updated} of {len(results)} tasks updated.",
+        data=results
+    )
+
+
+@router.delete("/tasks/bulk",
+               response_model=ResponseModel,
+               summary="Delete tasks in bulk")
+@with_db_session
+def delete_tasks_bulk(
+        payload: TaskBulkDelete,
+        db: Session = Depends(get_db),
+        current_user: CurrentUser = Depends(get_current_user)
+) -> ResponseModel:
+    """
+    Delete many of the authenticated user's tasks in a single statement and transaction.
+    """
+    results = bulk_delete_tasks(db, current_user.id, payload.ids)
+    for result in results:
+        if result["result"] == "deleted":
+            publish_task_event(current_user.id, "deleted", {"id": result["id"]})
+    deleted = sum(1 for result in results if result["result"] == "deleted")
+    logger.info(f"Bulk deleted {deleted}/{len(results)} tasks for User ID '{current_user.id}'.")
+    return ResponseModel(
+        status="success",
+        message=f"{deleted} of {len(results)} tasks deleted.",
+        data=results
     )
 
 
 @router.get("/tasks",
-            response_model=ResponseModel,
+            response_model=ResponseModel[TaskList],
             summary="Get all tasks"
             )
+@with_db_session
 def get_tasks(
+        response: Response,
+        limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE, description="Page size; enables cursor pagination"),
+        cursor: Optional[str] = Query(None, description="Opaque cursor returned as next_cursor by the previous page"),
+        status_filter: Optional[str] = Query(
+            None, alias="status", description="Status filter: 'pending', 'eq:pending' or 'in:pending,in-progress'"
+        ),
+        title_filter: Optional[str] = Query(
+            None, alias="title", description="Title filter: 'Groceries', 'eq:Groceries' or 'prefix:Gro'"
+        ),
+        sort: Optional[str] = Query(None, description="Sort field, '-' for descending: id, -id, title, -title"),
+        if_none_match: Optional[str] = Header(None),
         db: Session = Depends(get_db),
         current_user: CurrentUser = Depends(get_current_user)
 ) -> ResponseModel:
     """
     Retrieve all tasks belonging to the authenticated user.
+
+    ``status``, ``title`` and ``sort`` filter and order the listing; only combinations an
+    index serves are accepted. Passing ``limit`` or ``cursor`` switches to cursor pagination,
+    which returns ``{"items": [...], "next_cursor": ...}`` instead of the full list. Responses
+    carry an ETag; a matching ``If-None-Match`` gets ``304 Not Modified``.
     """
-    tasks = db.query(Task).filter(Task.owner_id == current_user.id).all()
+    listing = parse_task_listing(status_filter, title_filter, sort)
+
+    etag = task_collection_etag(db, current_user.id)
+    if etag_matches(if_none_match, etag):
+        logger.info(f"Tasks of User ID '{current_user.id}' not modified.")
+        return not_modified(etag)
+    set_etag(response, etag)
+
+    query = build_task_query(db, current_user.id, listing=listing)
+    if limit is not None or cursor is not None:
+        tasks, next_cursor = paginate_keyset(query, Task.id, current_user.id, limit, cursor, listing.order)
+        logger.info(f"Retrieved a page of {len(tasks)} tasks for User ID '{current_user.id}'.")
+        return ResponseModel(
+            status="success",
+            message="Tasks retrieved successfully.",
+            data=build_task_page(tasks, next_cursor)
+        )
+
+    tasks = query.all()
     if not tasks:
         logger.info(f"No tasks found for User ID '{current_user.id}'.")
         return ResponseModel(
@@ -111,7 +336,7 @@ def get_tasks(
             data=[]
         )
 
-    task_data = [{"id": task.id, "title": task.title, "status": task.status, "description": task.description} for task in tasks]
+    task_data = [serialize_task(task) for task in tasks]
     logger.info(f"Retrieved {len(tasks)} tasks for User ID '{current_user.id}'.")
     return ResponseModel(
         status="success",
@@ -120,64 +345,257 @@ def get_tasks(
     )
 
 
+@router.post("/tasks/import",
+             response_model=ResponseModel[TaskImportReport],
+             status_code=status.HTTP_201_CREATED,
+             summary="Import tasks from NDJSON or CSV",
+             openapi_extra={
+                 "requestBody": {
+                     "required": True,
+                     "content": {
+                         "application/x-ndjson": {"schema": {"type": "string", "format": "binary"}},
+                         "text/csv": {"schema": {"type": "string", "format": "binary"}},
+                     },
+                 }
+             },
+)
+async def import_tasks(
+        request: Request,
+        import_format: Literal["ndjson", "csv"] = Query("ndjson", alias="format", description="Upload format"),
+        db: Session = Depends(get_db),
+        current_user: CurrentUser = Depends(get_current_user)
+) -> ResponseModel:
+    """
+    Create tasks for the authenticated user from the raw request body.
+
+    The body uses the same formats as ``/tasks/export``; CSV needs a header row with
+    at least a ``title`` column. Rows are validated and inserted in batches as the
+    upload arrives, and invalid rows are reported by line number instead of failing
+    the import.
+    """
+    report = await import_task_upload(db, current_user.id, request.stream(), import_format)
+    if report["imported"]:
+        # One event instead of one per row; clients fetch the new tasks through /tasks/changes
+        publish_task_event(current_user.id, RESYNC)
+    logger.info(
+        f"Imported {report['imported']} tasks ({report['failed']} rows failed) for User ID '{current_user.id}'."
+    )
+    return ResponseModel(
+        status="success",
+        message=f"{report['imported']} tasks imported, {report['failed']} rows failed.",
+        data=report
+    )
+
+
+# Registered before "/tasks/{task_id}" so "export", "stream", "search", "stats" and "changes"
+# are not parsed as task IDs
+@router.get("/tasks/export",
+            response_class=StreamingResponse,
+            summary="Export all tasks as NDJSON or CSV",
+)
+async def export_tasks(
+        export_format: Literal["ndjson", "csv"] = Query("ndjson", alias="format", description="Output format"),
+        current_user: CurrentUser = Depends(get_current_user)
+) -> StreamingResponse:
+    """
+    Stream every task of the authenticated user, one batch of rows per chunk.
+
+    Rows are read through a server-side cursor and written as they arrive, so memory
+    use does not grow with the number of tasks.
+    """
+    logger.info(f"Exporting tasks as {export_format} for User ID '{current_user.id}'.")
+    return StreamingResponse(
+        stream_task_export(current_user.id, export_format),
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="tasks.{export_format}"'},
+    )
+
+
+@router.get("/tasks/stream",
+            response_class=StreamingResponse,
+            summary="Stream task changes as Server-Sent Events",
+)
+async def stream_tasks(
+        last_event_id: Optional[str] = Header(None, description="ID of the last event received, to resume"),
+        current_user: CurrentUser = Depends(get_current_user)
+) -> StreamingResponse:
+    """
+    Push ``created``, ``updated`` and ``deleted`` events for the authenticated user's tasks.
+
+    Reconnecting with ``Last-Event-ID`` replays the events missed in between. A
+    ``resync`` event means they are no longer available; fetch ``/tasks/changes``.
+    """
+    logger.info(f"Streaming task events for User ID '{current_user.id}'.")
+    return StreamingResponse(
+        stream_task_events(current_user.id, last_event_id),
+        media_type="text/event-stream",
+        # Proxies must neither cache nor buffer the stream
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.get("/tasks/search",
+            response_model=ResponseModel[TaskPage],
+            summary="Search tasks by title and description",
+)
+@with_db_session
+def search_tasks_route(
+        q: str = Query(..., min_length=1, max_length=200, description="Words to search for"),
+        limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE, description="Page size"),
+        cursor: Optional[str] = Query(None, description="Opaque cursor returned as next_cursor by the previous page"),
+        db: Session = Depends(get_db),
+        current_user: CurrentUser = Depends(get_current_user)
+) -> ResponseModel:
+    """
+    Full-text search over the authenticated user's tasks, best matches first.
+
+    Every word must match, in any form (``running`` matches ``run``); title matches
+    rank above description matches. Results are paged with ``limit`` and ``cursor``.
+    """
+    tasks, next_cursor = search_tasks(db, current_user.id, q, limit, cursor)
+    logger.info(f"Search matched {len(tasks)} tasks on this page for User ID '{current_user.id}'.")
+    return ResponseModel(
+        status="success",
+        message="Tasks retrieved successfully.",
+        data=build_task_page(tasks, next_cursor)
+    )
+
+
+@router.get("/tasks/stats",
+            response_model=ResponseModel[TaskStats],
+            summary="Get task counts per status",
+)
+@with_db_session
+def get_tasks_stats(
+        db: Session = Depends(get_db),
+        current_user: CurrentUser = Depends(get_current_user)
+) -> ResponseModel:
+    """
+    Return how many tasks the authenticated user has in each status.
+
+    Counts come from a counter table that triggers on ``tasks`` keep up to date, so
+    the cost does not grow with the number of tasks.
+    """
+    stats = get_task_stats(db, current_user.id)
+    logger.info(f"Retrieved task stats for User ID '{current_user.id}': {stats['total']} tasks.")
+    return ResponseModel(
+        status="success",
+        message="Task stats retrieved successfully.",
+        data=stats
+    )
+
+
+@router.get("/tasks/changes",
+            response_model=ResponseModel[TaskChanges],
+            summary="Get task changes since a sync token",
+)
+@with_db_session
+def get_tasks_changes(
+        since: Optional[str] = Query(None, description="sync_token of the previous sync; omit for a full sync"),
+        limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE, description="Maximum number of changes"),
+        db: Session = Depends(get_db),
+        current_user: CurrentUser = Depends(get_current_user)
+) -> ResponseModel:
+    """
+    Return the tasks created or updated and the task IDs deleted since ``since``.
+
+    Store the returned ``sync_token`` and pass it as ``since`` next time. Without
+    ``since`` every task is returned, with a token to start syncing from. While
+    ``has_more`` is true, call again at once with the new token for the next page.
+    Tokens older than the tombstone retention window get ``410``: run a full sync.
+    """
+    token = decode_sync_token(since, current_user.id) if since else None
+    changes = get_task_changes(db, current_user.id, token, limit)
+    logger.info(
+        f"Synced {len(changes['changed'])} changed and {len(changes['deleted'])} deleted tasks "
+        f"for User ID '{current_user.id}'."
+    )
+    return ResponseModel(
+        status="success",
+        message="Task changes retrieved successfully.",
+        data=changes
+    )
+
+
 @router.get("/tasks/{task_id}",
-            response_model=ResponseModel,
+            response_model=ResponseModel[TaskData],
             summary="Get a Task by ID",
 )
+@with_db_session
 def get_task(
         task_id: int,
+        response: Response,
+        if_none_match: Optional[str] = Header(None),
         db: Session = Depends(get_db),
         current_user: CurrentUser = Depends(get_current_user)
 ) -> ResponseModel:
     """
     Retrieve a Task by its unique ID.
+
+    The ETag follows the task's version, so ``If-None-Match`` revalidation skips serialization.
     """
     # Fetch the task from the database
-    task = validate_task_existence(task_id, db, current_user)
+    task = get_owned_task(db, task_id, current_user.id)
+    if task is None:
+        raise_task_access_error(task_id, db, current_user)
+    etag = task_etag(task)
+    if etag_matches(if_none_match, etag):
+        logger.info(f"Task with ID '{task_id}' not modified.")
+        return not_modified(etag)
+    set_etag(response, etag)
     logger.info(f"Task with ID '{task_id}' retrieved successfully.")
     return ResponseModel(
         status="success",
         message="Task retrieved successfully.",
-        data={"id": task.id, "title": task.title, "status": task.status, "description": task.description}
+        data=serialize_task(task)
     )
 
 
 @router.put("/tasks/{task_id}",
-            response_model=ResponseModel,
+            response_model=ResponseModel[TaskData],
             summary="Update a Task",
 )
+@with_db_session
 def update_task(
         task_id: int,
         task_update: TaskUpdate,
+        response: Response,
+        if_match: Optional[str] = Header(None),
         db: Session = Depends(get_db),
         current_user: CurrentUser = Depends(get_current_user)
 ) -> ResponseModel:
     """
     Update an existing task by its unique ID.
-    """
-    task = validate_task_existence(task_id, db, current_user)
 
-    if not any([task_update.title, task_update.description, task_update.status]):
+    The change is one ``UPDATE ... RETURNING`` filtered by ID and owner, after the
+    collection version bump. With ``If-Match`` set to the task's ETag the update only
+    applies to that version, and a task changed in the meantime gets ``412``.
+    """
+    values = {
+        column: getattr(task_update, column)
+        for column in ("title", "description", "status")
+        if getattr(task_update, column)
+    }
+    if not values:
+        # A missing or foreign task still takes precedence over the empty update
+        if get_owned_task(db, task_id, current_user.id) is None:
+            raise_task_access_error(task_id, db, current_user)
         logger.warning(f"No valid fields provided for update on Task ID '{task_id}'.")
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="No valid fields provided for update."
         )
 
-    if task_update.title:
-        task.title = task_update.title
-    if task_update.description:
-        task.description = task_update.description
-    if task_update.status:
-        task.status = task_update.status
-
-    db.commit()
-    db.refresh(task)
+    task = update_owned_task(db, task_id, current_user.id, values, if_match_versions(if_match))
+    if task is None:
+        raise_task_access_error(task_id, db, current_user)
+    set_etag(response, task_etag(task))
+    publish_task_event(current_user.id, "updated", serialize_task(task))
     logger.info(f"Task with ID '{task.title}' updated successfully.")
     return ResponseModel(
         status="success",
         message="Task updated successfully.",
-        data={"id": task.id, "title": task.title, "status": task.status, "description": task.description}
+        data=serialize_task(task)
     )
 
 
@@ -185,18 +603,22 @@ def update_task(
                response_model=ResponseModel,
                summary="Delete task",
 )
+@with_db_session
 def delete_task(
         task_id: int,
+        if_match: Optional[str] = Header(None),
         db: Session = Depends(get_db),
         current_user: CurrentUser = Depends(get_current_user)
 ):
     """
     Delete an existing task by its unique ID.
+
+    The task is removed with one ``DELETE ... RETURNING`` filtered by ID and owner, and
+    by version when ``If-Match`` is given, as for updates.
     """
-    # Validation that the task exists
-    task = validate_task_existence(task_id, db, current_user)
-    db.delete(task)
-    db.commit()
+    if not delete_owned_task(db, task_id, current_user.id, if_match_versions(if_match)):
+        raise_task_access_error(task_id, db, current_user)
+    publish_task_event(current_user.id, "deleted", {"id": task_id})
     logger.info(f"Task ID '{task_id}' deleted successfully by user ID '{current_user.id}'")
     return ResponseModel(
         status="success",
@@ -206,16 +628,24 @@ def delete_task(
 
 
 @router.get("/tasks/status/{task_status}",
-            response_model=ResponseModel,
+            response_model=ResponseModel[TaskList],
             summary="Get all tasks by status",
 )
+@with_db_session
 def get_tasks_by_status(
+        response: Response,
         task_status: str = Path(..., description="The status to filter task by"),
+        limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE, description="Page size; enables cursor pagination"),
+        cursor: Optional[str] = Query(None, description="Opaque cursor returned as next_cursor by the previous page"),
+        if_none_match: Optional[str] = Header(None),
         db: Session = Depends(get_db),
         current_user: CurrentUser = Depends(get_current_user)
 ) -> ResponseModel:
     """
     Retrieve all tasks with a specific status.
+
+    Passing ``limit`` or ``cursor`` switches to cursor pagination, and ETags work as
+    for ``GET /tasks``.
     """
     if task_status not in [s.value for s in TaskStatus]:
         logger.warning(f"Invalid task status '{task_status}'.")
@@ -224,7 +654,23 @@ def get_tasks_by_status(
             detail=f"Invalid task status: '{task_status}'."
         )
 
-    tasks = db.query(Task).filter(Task.status == task_status, Task.owner_id == current_user.id).all()
+    etag = task_collection_etag(db, current_user.id)
+    if etag_matches(if_none_match, etag):
+        logger.info(f"Tasks with status '{task_status}' not modified.")
+        return not_modified(etag)
+    set_etag(response, etag)
+
+    query = build_task_query(db, current_user.id, task_status)
+    if limit is not None or cursor is not None:
+        tasks, next_cursor = paginate_keyset(query, Task.id, current_user.id, limit, cursor)
+        logger.info(f"Found a page of {len(tasks)} tasks for status '{task_status}'")
+        return ResponseModel(
+            status="success",
+            message="Tasks retrieved successfully.",
+            data=build_task_page(tasks, next_cursor)
+        )
+
+    tasks = query.all()
 
     if not tasks:
         logger.info(f"No tasks found for status '{task_status}'")
@@ -234,7 +680,7 @@ def get_tasks_by_status(
             data=[]
         )
 
-    task_data = [{"id": task.id, "title": task.title, "status": task.status, "description": task.description} for task in tasks]
+    task_data = [serialize_task(task) for task in tasks]
     logger.info(f"Found tasks for status '{task_status}': {len(tasks)}")
     return ResponseModel(
         status="success",
@@ -1,15 +1,29 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import List, Literal, Optional, Union
+
+from fastapi import APIRouter, BackgroundTasks, Depends, Header, HTTPException, Query, Response, status
 from sqlalchemy.orm import Session
-from sqlalchemy import or_
+from sqlalchemy import insert
 
 from src.models import User
-from src.schemas import UserCreate , UserUpdate
+from src.schemas import UserCreate , UserData, UserFields, UserPage, UserUpdate
 from src.schemas.response import ResponseModel
 from src.schemas.user import CurrentUser
 from src.services import get_current_user
-from src.services.dependencies import get_db
-from src.services.task import get_password_hash
-from src.services.crud import get_item_by_id, create_item
+from src.services.dependencies import get_current_admin, get_db, run_db, with_db_session
+from src.services.hashing import hash_password
+from src.services.idempotency import (
+    IdempotentRequest,
+    cached_response,
+    claim_idempotency_key,
+    commit_idempotent,
+    idempotent_request,
+)
+from src.services.crud import get_item_by_id, reject_duplicates
+from src.services.etag import etag_matches, not_modified, payload_etag, set_etag
+from src.services.pagination import MAX_PAGE_SIZE, keyset_order_by, paginate_keyset
+from src.services.user_listing import parse_user_listing
+from src.services.user_cache import invalidate_user
+from src.services.user_purge import run_user_purge
 
 import logging
 
@@ -39,21 +53,58 @@ def validate_user_existence(
     return user
 
 
+# The user listing returns the full list, or a page when cursor pagination is requested
+UserList = Union[List[UserFields], UserPage]
+
+
 @router.get(
     "/users",
-    response_model=ResponseModel,
+    response_model=ResponseModel[UserList],
     summary="Get all users"
 )
-async def get_all_users(
+@with_db_session
+def get_all_users(
+        response: Response,
+        limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE, description="Page size; enables cursor pagination"),
+        cursor: Optional[str] = Query(None, description="Opaque cursor returned as next_cursor by the previous page"),
+        fields: Optional[str] = Query(None, description="Comma-separated fields to return: id, username, email"),
+        username: Optional[str] = Query(None, description="Username filter: 'alice', 'eq:alice' or 'prefix:al'"),
+        if_none_match: Optional[str] = Header(None),
         db: Session = Depends(get_db),
-        current_user: CurrentUser = Depends(get_current_user),
+        current_user: CurrentUser = Depends(get_current_admin),
 ) -> ResponseModel:
     """
-    Fetch all users from the database.
+    Fetch all users from the database (admins only).
+
+    Only the columns named in ``fields`` are selected (the ID always is), never the
+    password hash. ``username=prefix:...`` is a range search over the unique username
+    index and returns users in username order; otherwise users come in ID order. Passing
+    ``limit`` or ``cursor`` switches to cursor pagination, as for ``GET /tasks``.
+
+    Users have no version counter, so the ETag is a hash of the payload; a match still
+    skips building and sending the response body.
     """
     logger.info(f"Fetching users requested by: {current_user.username}")
+    listing = parse_user_listing(fields, username)
+    query = db.query(*listing.select_columns).filter(*listing.filters) \
+        .order_by(*keyset_order_by(User.id, listing.order))
 
-    users = db.query(User).all()
+    if limit is not None or cursor is not None:
+        rows, next_cursor = paginate_keyset(query, User.id, current_user.id, limit, cursor, listing.order)
+        users_data = UserPage(items=[listing.serialize(row) for row in rows], next_cursor=next_cursor)
+        etag = payload_etag(users_data)
+        if etag_matches(if_none_match, etag):
+            logger.info("Users not modified")
+            return not_modified(etag)
+        set_etag(response, etag)
+        logger.info(f"Found a page of {len(rows)} user(s).")
+        return ResponseModel(
+            status="success",
+            message="Users retrieved successfully",
+            data=users_data
+        )
+
+    users = query.all()
 
     if not users:
         logger.info("No users found")
@@ -63,8 +114,13 @@ async def get_all_users(
             data=[]
         )
 
-    # Construct response data from user records
-    users_data = [{"id": user.id, "username": user.username, "email": user.email} for user in users]
+    # Construct response data from the selected columns
+    users_data = [listing.serialize(user) for user in users]
+    etag = payload_etag(users_data)
+    if etag_matches(if_none_match, etag):
+        logger.info("Users not modified")
+        return not_modified(etag)
+    set_etag(response, etag)
     logger.info(f"Found {len(users)} user(s).")
     return ResponseModel(
         status="success",
@@ -74,17 +130,21 @@ async def get_all_users(
 
 
 @router.post("/user",
-             response_model=ResponseModel,
+             response_model=ResponseModel[UserData],
              status_code=status.HTTP_201_CREATED,
              summary="Create a User",
 )
-def create_user(
+async def create_user(
         user: UserCreate,
+        idempotency_key: Optional[str] = Header(None),
         db: Session = Depends(get_db),
         current_user: CurrentUser = Depends(get_current_user)
     ) -> ResponseModel:
     """
     Register a new user (requires authentication).
+
+    With an ``Idempotency-Key`` header, retries of a successful request replay its response
+    instead of creating the user again.
     """
     logger.info(f"User creation requested by admin: {current_user.username} (ID: {getattr(current_user, 'id', 'unknown')})")
 
@@ -96,23 +156,34 @@ def create_user(
             detail=f"User '{current_user.username}' is not authorized to create users."
         )
 
-    # Check if username or email already exists
-    existing_user = db.query(User).filter(
-        or_(
-            User.username == user.username,
-            User.email.ilike(user.email)
-        )
-    ).first()
+    # Only a hash of the request is stored, but the password stays out of it all the same
+    idempotency = idempotent_request(
+        idempotency_key, current_user.id, "POST /user", user.model_dump(exclude={"password"})
+    )
+    # Replay a cached response before spending a password hash on it
+    replay = cached_response(idempotency)
+    if replay is not None:
+        return replay
 
-    if existing_user:
-        logger.warning(f"Create user failed: Username '{user.username}' or Email '{user.email}' already exists")
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Username or Email already exists"
-        )
+    # Hash the password in the hashing pool, outside of the database session
+    hashed_password = await hash_password(user.password)
+    return await run_db(db, save_new_user, user, hashed_password, idempotency)
+
+
+def save_new_user(
+        db: Session,
+        user: UserCreate,
+        hashed_password: str,
+        idempotency: Optional[IdempotentRequest] = None,
+) -> ResponseModel:
+    """
+    Insert a new user with an already hashed password.
+    """
+    replay = claim_idempotency_key(db, idempotency)
+    if replay is not None:
+        return replay
 
-    # Hash the password and prepare user data
-    hashed_password = get_password_hash(user.password)
+    # Prepare user data
     user_data = {
         "username": user.username,
         "email": user.email.lower(),
@@ -120,26 +191,29 @@ def create_user(
         "disabled": user.disabled,
     }
 
-    # Insert user into the database
-    new_user = create_item(User, user_data, db)
-    logger.info(f"User '{new_user.username}' created successfully with ID {new_user.id}")
-    return ResponseModel(
-        status="success",
-        message=f"User created successfully",
-        data={
-            "id": new_user.id,
-            "username": new_user.username,
-            "email": new_user.email
-        }
-    )
+    # Insert user into the database; the unique username and lower(email) indexes reject
+    # duplicates, including concurrent signups
+    with reject_duplicates(db, "Username or Email already exists"):
+        user_id = db.execute(insert(User).values(**user_data).returning(User.id)).scalar_one()
+        result = ResponseModel(
+            status="success",
+            message=f"User created successfully",
+            data=UserData(id=user_id, username=user_data["username"], email=user_data["email"])
+        )
+        commit_idempotent(db, idempotency, status.HTTP_201_CREATED, result)
+    logger.info(f"User '{user.username}' created successfully with ID {user_id}")
+    return result
 
 
 @router.get("/users/{user_id}",
-            response_model=ResponseModel,
+            response_model=ResponseModel[UserData],
             summary="Get a User by ID",
 )
+@with_db_session
 def get_user(
         user_id: int,
+        response: Response,
+        if_none_match: Optional[str] = Header(None),
         db: Session = Depends(get_db),
         current_user: CurrentUser = Depends(get_current_user)
     ) -> ResponseModel:
@@ -148,19 +222,25 @@ def get_user(
     """
     logger.info(f"Retrieve user: {current_user}")
     user = validate_user_existence(db, user_id)
+    user_data = UserData(id=user.id, username=user.username, email=user.email)
+    etag = payload_etag(user_data)
+    if etag_matches(if_none_match, etag):
+        logger.info(f"User with ID '{user_id}' not modified")
+        return not_modified(etag)
+    set_etag(response, etag)
     logger.info(f"User with ID '{user_id}' retrieved successfully")
     return ResponseModel(
         status="success",
         message="User retrieved successfully",
-        data={"id": user.id, "username": user.username, "email": user.email},
+        data=user_data,
     )
 
 
 @router.put("/users/{user_id}",
-            response_model=ResponseModel,
+            response_model=ResponseModel[UserData],
             summary="Update a User",
 )
-def update_user(
+async def update_user(
         user_id: int,
         user_update: UserUpdate,
         db: Session = Depends(get_db),
@@ -170,6 +250,21 @@ def update_user(
     Update a user details by their unique ID.
     """
     logger.info(f"Update the user: {current_user}")
+
+    # Hash a new password in the hashing pool, outside of the database session
+    hashed_password = await hash_password(user_update.password) if user_update.password else None
+    return await run_db(db, apply_user_update, user_id, user_update, hashed_password)
+
+
+def apply_user_update(
+        db: Session,
+        user_id: int,
+        user_update: UserUpdate,
+        hashed_password: Optional[str]
+) -> ResponseModel:
+    """
+    Apply an update to a user; a new password must already be hashed.
+    """
     user = validate_user_existence(db, user_id)
 
     # Added validation for empty update payload
@@ -180,22 +275,6 @@ def update_user(
             detail="No valid fields provided for update."
         )
 
-    # Improved duplicate validation logic
-    if user_update.username or user_update.email:
-        duplicate_check = db.query(User).filter(
-            or_(
-                User.username == user_update.username,
-                User.email == user_update.email
-            ),
-            User.id != user_id,
-        ).first()
-        if duplicate_check:
-            logger.warning(f"Duplicate user '{user_update.username}' or Email '{user_update.email}' already exists")
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Username or Email already exists"
-            )
-
     # Apply updates to the user
     if user_update.username:
         user.username = user_update.username
@@ -203,37 +282,70 @@ def update_user(
         user.email = user_update.email
     if user_update.disabled is not None:
         user.disabled = user_update.disabled
-    if user_update.password:
-        user.hashed_password = get_password_hash(user_update.password)
+    if hashed_password:
+        user.hashed_password = hashed_password
 
-    db.commit()
+    # A username or email taken by another user fails the unique indexes
+    with reject_duplicates(db, "Username or Email already exists"):
+        db.commit()
+    invalidate_user(user_id)
     db.refresh(user)
 
     logger.info(f"User with ID '{user_id}' updated successfully.")
     return ResponseModel(
         status="success",
         message="User updated successfully",
-        data={"id": user.id, "username": user.username, "email": user.email},
+        data=UserData(id=user.id, username=user.username, email=user.email),
     )
 
 
+async def purge_user_in_background(user_id: int) -> None:
+    purged = await run_user_purge(user_id)
+    logger.info(f"User with ID '{user_id}' purged in the background with {purged} tasks.")
+
+
 @router.delete("/users/{user_id}",
                response_model=ResponseModel,
                summary="Delete a User",
 )
+@with_db_session
 def delete_user(
         user_id: int,
+        response: Response,
+        background_tasks: BackgroundTasks,
+        mode: Literal["immediate", "background"] = Query(
+            "immediate", description="'background' disables the user now and purges its tasks in chunks"
+        ),
         db: Session = Depends(get_db),
         current_user: CurrentUser = Depends(get_current_user)
 ) -> ResponseModel:
     """
     Delete a user by their unique ID.
+
+    The user's tasks go with it through ON DELETE CASCADE, without being loaded. For
+    very large accounts ``mode=background`` returns ``202 Accepted`` at once: the user
+    is disabled, then its tasks are deleted in chunks and the user last.
     """
     logger.info(f"Delete user: {current_user}")
     user = validate_user_existence(db, user_id)
 
+    if mode == "background":
+        # A disabled user can no longer authenticate while the purge runs
+        user.disabled = True
+        db.commit()
+        invalidate_user(user_id)
+        background_tasks.add_task(purge_user_in_background, user_id)
+        response.status_code = status.HTTP_202_ACCEPTED
+        logger.info(f"User with ID '{user_id}' disabled and scheduled for purge.")
+        return ResponseModel(
+            status="success",
+            message=f"User with ID '{user_id}' is being deleted",
+            data=None
+        )
+
     db.delete(user)
     db.commit()
+    invalidate_user(user_id)
 
     logger.info(f"User with ID '{user_id}' deleted successfully.")
     return ResponseModel(
@@ -1,13 +1,42 @@
-from .task import TaskCreate, TaskRead, TaskUpdate
-from .user import UserCreate, UserRead, UserUpdate
+from .task import (
+    TaskBulkCreate,
+    TaskBulkDelete,
+    TaskBulkUpdate,
+    TaskBulkUpdateItem,
+    TaskChange,
+    TaskChanges,
+    TaskCreate,
+    TaskData,
+    TaskImportError,
+    TaskImportReport,
+    TaskPage,
+    TaskRead,
+    TaskStats,
+    TaskUpdate,
+)
+from .user import UserCreate, UserData, UserFields, UserPage, UserRead, UserUpdate
 from .response import ResponseModel
 
 __all__ = [
     "UserCreate",
+    "UserData",
+    "UserFields",
+    "UserPage",
     "UserRead",
     "UserUpdate",
+    "TaskChange",
+    "TaskChanges",
     "TaskCreate",
+    "TaskData",
+    "TaskImportError",
+    "TaskImportReport",
+    "TaskPage",
     "TaskRead",
+    "TaskStats",
     "TaskUpdate",
+    "TaskBulkCreate",
+    "TaskBulkUpdate",
+    "TaskBulkUpdateItem",
+    "TaskBulkDelete",
     "ResponseModel"
 ]
@@ -1,7 +1,14 @@
 from pydantic import BaseModel
-from typing import Optional, Any
+from typing import Generic, Optional, TypeVar
 
-class ResponseModel(BaseModel):
+DataT = TypeVar("DataT")
+
+
+class ResponseModel(BaseModel, Generic[DataT]):
+    """
+    Response envelope. Parametrize it with the payload type, e.g. ``ResponseModel[TaskData]``,
+    so the payload is serialized from its schema; a bare ``ResponseModel`` accepts ``Any``.
+    """
     status: str
     message: str
-    data: Optional[Any] = None
\ No newline at end of file
+    data: Optional[DataT] = None
@@ -1,8 +1,14 @@
-from typing import Optional
-from pydantic import BaseModel
+import os
+from datetime import datetime
+from typing import Dict, List, Optional
+from pydantic import BaseModel, Field
+from typing_extensions import TypedDict
 from src.enums.task_status import TaskStatus
 from src.schemas.user import UserRead
 
+# Upper bound on the number of items accepted by a single bulk request
+BULK_MAX_ITEMS = int(os.getenv("BULK_MAX_ITEMS", "1000"))
+
 class TaskBase(BaseModel):
     title: str
     description: Optional[str] = None
@@ -25,3 +31,75 @@ class TaskUpdate(TaskBase):
     title: Optional[str] = None
     description: Optional[str] = None
     status: Optional[TaskStatus] = None
+
+
+# Response payloads are TypedDicts: routes build plain dicts, which pydantic validates and
+# serializes from the schema, with no model instances or Any type inference per item.
+class TaskData(TypedDict):
+    id: int
+    title: str
+    status: TaskStatus
+    description: Optional[str]
+
+
+class TaskPage(TypedDict):
+    """
+    One page of tasks in cursor mode; ``next_cursor`` is None on the last page.
+    """
+    items: List[TaskData]
+    next_cursor: Optional[str]
+
+
+class TaskChange(TaskData):
+    revision: int
+    updated_at: datetime
+
+
+class TaskChanges(TypedDict):
+    """
+    One page of the delta since a sync token: tasks written and task IDs deleted, plus the token to send next.
+    """
+    changed: List[TaskChange]
+    deleted: List[int]
+    sync_token: str
+    # True when the sync continues: call again at once with sync_token
+    has_more: bool
+
+
+class TaskStats(TypedDict):
+    """
+    Number of tasks per status (every status is listed, zero or not) and in total.
+    """
+    counts: Dict[TaskStatus, int]
+    total: int
+
+
+class TaskImportError(TypedDict):
+    line: int
+    detail: str
+
+
+class TaskImportReport(TypedDict):
+    """
+    Outcome of an import; ``errors_truncated`` is set when more rows failed than are listed.
+    """
+    imported: int
+    failed: int
+    errors: List[TaskImportError]
+    errors_truncated: bool
+
+
+class TaskBulkUpdateItem(TaskUpdate):
+    id: int
+
+
+class TaskBulkCreate(BaseModel):
+    items: List[TaskBase] = Field(..., min_length=1, max_length=BULK_MAX_ITEMS)
+
+
+class TaskBulkUpdate(BaseModel):
+    items: List[TaskBulkUpdateItem] = Field(..., min_length=1, max_length=BULK_MAX_ITEMS)
+
+
+class TaskBulkDelete(BaseModel):
+    ids: List[int] = Field(..., min_length=1, max_length=BULK_MAX_ITEMS)
@@ -1,5 +1,6 @@
-from typing import Optional
+from typing import List, Optional
 from pydantic import BaseModel, EmailStr, constr
+from typing_extensions import TypedDict
 
 class UserBase(BaseModel):
     username: constr(
@@ -29,6 +30,32 @@ class UserRead(UserBase):
         from_attributes = True
 
 
+class UserData(TypedDict):
+    """
+    User payload returned by the user endpoints.
+    """
+    id: int
+    username: str
+    email: str
+
+
+class UserFields(TypedDict, total=False):
+    """
+    User payload of the user listing, limited to the fields requested with ``fields=``.
+    """
+    id: int
+    username: str
+    email: str
+
+
+class UserPage(TypedDict):
+    """
+    One page of users in cursor mode; ``next_cursor`` is None on the last page.
+    """
+    items: List[UserFields]
+    next_cursor: Optional[str]
+
+
 class UserUpdate(BaseModel):
     username: Optional[constr(
         min_length=3,
@@ -1,3 +1,6 @@
+from contextlib import contextmanager
+
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
 
@@ -26,6 +29,19 @@ def create_item(model, data, db: Session):
             detail=f"Failed to create {model.__name__}: {str(e)}"
         )
 
+# Turn a unique constraint violation in the block into a 400, after rolling back.
+# Writing and catching is one round trip and, unlike a SELECT first, holds under concurrency
+@contextmanager
+def reject_duplicates(db: Session, detail: str):
+    try:
+        yield
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=detail
+        )
+
 # Delete an item by ID
 def delete_item(model, item_id: int, db: Session):
     item = get_item_by_id(model, item_id, db)
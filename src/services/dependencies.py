@@ -1,14 +1,20 @@
+import functools
 import os
 import logging
+from typing import Callable, Optional, TypeVar, Union
 
+import anyio
 from fastapi import Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError, jwt
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from src.schemas.user import CurrentUser
-from src.services.database import SessionLocal
+from src.services.database import DB_MAX_OVERFLOW, DB_POOL_SIZE, AsyncSessionLocal, SessionLocal
 from src.models.user import User
+from src.services import user_cache
 
 logging.basicConfig(
     level=logging.INFO,
@@ -22,21 +28,93 @@ oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
 SECRET_KEY = os.getenv("SECRET_KEY", "your-default-secret-key")
 ALGORITHM = "HS256"
 
+T = TypeVar("T")
+
+# Sessions are closed under their own limiter: if closing shared the request threadpool,
+# threads blocked on pool checkout could starve the very close() calls that return
+# connections to the pool. It admits one close per connection the pool can hand out, so
+# teardown never queues behind other requests' closes.
+_session_close_limiter = anyio.CapacityLimiter(DB_POOL_SIZE + max(DB_MAX_OVERFLOW, 0))
+
 
 # Dependency for creating a new database session for each request
-def get_db() -> Session:
+async def get_db() -> Union[Session, AsyncSession]:
+    """
+    Yield an AsyncSession in async mode (``DATABASE_ASYNC``), otherwise a sync Session.
+
+    Route code should not branch on the type: wrap routes with ``with_db_session``
+    or call ``run_db``, which hand a sync Session to plain ORM code in both modes.
+    """
+    if AsyncSessionLocal is not None:
+        async with AsyncSessionLocal() as db:
+            yield db
+        return
+
     db = SessionLocal()
     try:
         yield db
     finally:
-        db.close()
+        await anyio.to_thread.run_sync(db.close, limiter=_session_close_limiter)
+
+
+async def run_db(db: Union[Session, AsyncSession], fn: Callable[..., T], *args, **kwargs) -> T:
+    """
+    Run sync ORM code ``fn(session, *args, **kwargs)`` against the request session.
+
+    In async mode it runs via ``AsyncSession.run_sync`` on the event loop, awaiting the
+    async driver; in sync mode it runs in the threadpool as FastAPI does for sync routes.
+    """
+    if isinstance(db, AsyncSession):
+        return await db.run_sync(fn, *args, **kwargs)
+    return await run_in_threadpool(fn, db, *args, **kwargs)
+
+
+def with_db_session(func: Callable[..., T]) -> Callable[..., T]:
+    """
+    Turn a sync route or dependency taking ``db`` into an async one that uses ``run_db``.
+
+    The body must only block on the database; CPU-bound work such as password hashing
+    has to be awaited outside of it.
+    """
+    @functools.wraps(func)
+    async def wrapper(*args, db: Union[Session, AsyncSession], **kwargs):
+        return await run_db(db, lambda session: func(*args, db=session, **kwargs))
+
+    return wrapper
+
+
+def load_current_user(db: Session, username: str) -> Optional[CurrentUser]:
+    """
+    Fetch a user by username and return it as a CurrentUser.
+    """
+    user = db.query(User).filter_by(username=username).first()
+    current_user = None
+    if user is not None:
+        current_user = CurrentUser(
+            id=user.id,
+            username=user.username,
+            email=user.email,
+            disabled=user.disabled,
+            is_admin=user.is_admin
+        )
+    # End the read transaction so the connection goes back to the pool instead of being
+    # held while the route waits for a worker thread; the route checks out a new one.
+    # This expires ``user``, so it must not be touched afterwards.
+    db.rollback()
+    return current_user
 
 
 # Dependency for getting the current authenticated user
-def get_current_user(
+async def get_current_user(
         token: str = Depends(oauth2_scheme),
         db: Session = Depends(get_db)
 ) -> CurrentUser:
+    # Serve repeat requests for the same token without decoding it or querying the database
+    cached_user = user_cache.get_cached_user(token)
+    if cached_user is not None:
+        return cached_user
+
+    generation = user_cache.current_generation()
     try:
         # Decode the JWT token
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
@@ -47,23 +125,31 @@ def get_current_user(
             )
 
         # Fetch the user by username
-        user = db.query(User).filter_by(username=username).first()
-        if user is None:
+        current_user = await run_db(db, load_current_user, username)
+        if current_user is None:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found"
             )
+        if current_user.disabled:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED, detail="User is disabled"
+            )
 
-        # Validate and return the user with UserRead schema
-        return CurrentUser(
-            id=user.id,
-            username=user.username,
-            email=user.email,
-            disabled=user.disabled,
-            is_admin=user.is_admin
-        )
+        user_cache.cache_user(token, current_user, generation, payload.get("exp"))
+        return current_user
     except JWTError as e:
         logger.error(f"JWT Error: {e}")
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Could not validate credentials",
         )
+
+
+# Dependency for routes only administrators may call
+async def get_current_admin(current_user: CurrentUser = Depends(get_current_user)) -> CurrentUser:
+    if not current_user.is_admin:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=f"User '{current_user.username}' is not authorized to view this resource."
+        )
+    return current_user
@@ -0,0 +1,71 @@
+import hashlib
+import re
+from typing import Any, List, Optional
+
+import orjson
+from fastapi import Response, status
+
+# Responses are per user, so shared caches must not store them; clients revalidate every time
+CACHE_CONTROL = "private, no-cache"
+
+VERSION_ETAG = re.compile(r'"v([0-9]+)"')
+
+
+def make_etag(*parts: Any) -> str:
+    """
+    Build a strong ETag from the values that identify one version of a representation.
+    """
+    digest = hashlib.blake2b(repr(parts).encode("utf-8"), digest_size=16).hexdigest()
+    return f'"{digest}"'
+
+
+def version_etag(version: int) -> str:
+    """
+    Build the strong ETag of a row from its version counter, so If-Match maps back to a version.
+    """
+    return f'"v{version}"'
+
+
+def payload_etag(data: Any) -> str:
+    """
+    Build a strong ETag from the payload itself, for resources without a version counter.
+    """
+    body = orjson.dumps(data, option=orjson.OPT_SORT_KEYS)
+    return f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Evaluate an If-None-Match header against the current ETag (weak comparison, RFC 9110).
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (candidate.strip() for candidate in if_none_match.split(","))
+    return any(candidate.removeprefix("W/") == etag for candidate in candidates)
+
+
+def if_match_versions(if_match: Optional[str]) -> Optional[List[int]]:
+    """
+    Return the row versions an If-Match header accepts, or None if any version will do
+    (no header, or ``*``).
+
+    If-Match uses strong comparison (RFC 9110): weak and unknown validators never match.
+    """
+    if not if_match or if_match.strip() == "*":
+        return None
+    candidates = (VERSION_ETAG.fullmatch(candidate.strip()) for candidate in if_match.split(","))
+    return [int(match.group(1)) for match in candidates if match]
+
+
+def set_etag(response: Response, etag: str) -> None:
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = CACHE_CONTROL
+
+
+def not_modified(etag: str) -> Response:
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers={"ETag": etag, "Cache-Control": CACHE_CONTROL},
+    )
@@ -0,0 +1,51 @@
+from typing import Optional, Sequence, Tuple
+
+from fastapi import HTTPException, status
+
+# A filter value is ``<operator>:<operand>``; a value without a known operator is an equality match
+OPERATORS = ("eq", "in", "prefix")
+
+
+def bad_listing_request(detail: str) -> HTTPException:
+    return HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=detail)
+
+
+def split_operator(field: str, raw: str, allowed: Sequence[str]) -> Tuple[str, str]:
+    """
+    Split a filter value into its operator and operand, checking the field allows the operator.
+    """
+    operator, separator, operand = raw.partition(":")
+    if not separator or operator not in OPERATORS:
+        return "eq", raw
+    if operator not in allowed:
+        raise bad_listing_request(
+            f"Operator '{operator}' is not supported for '{field}'; use one of: {', '.join(allowed)}."
+        )
+    return operator, operand
+
+
+def prefix_upper_bound(prefix: str) -> Optional[str]:
+    """
+    Return the smallest string above every string starting with ``prefix``, if there is one.
+    """
+    while prefix and prefix[-1] == chr(0x10FFFF):
+        prefix = prefix[:-1]
+    if not prefix:
+        return None
+    return prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+
+def prefix_conditions(field: str, column, prefix: str) -> list:
+    """
+    Match values of ``column`` starting with ``prefix`` as a range an index on it can search.
+    """
+    if not prefix:
+        raise bad_listing_request(f"A {field} prefix cannot be empty.")
+
+    # LIKE keeps the match an exact, case-sensitive prefix under collations that sort case
+    # or punctuation variants into the same range
+    conditions = [column >= prefix, column.startswith(prefix, autoescape=True)]
+    upper_bound = prefix_upper_bound(prefix)
+    if upper_bound is not None:
+        conditions.append(column < upper_bound)
+    return conditions
@@ -0,0 +1,100 @@
+import asyncio
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Optional
+
+from fastapi import HTTPException, status
+from passlib.context import CryptContext
+
+logger = logging.getLogger(__name__)
+
+# Password hashing context
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+# bcrypt is CPU bound, so hashing runs in worker processes rather than on the event loop
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", str(os.cpu_count() or 1)))
+
+# Operations allowed to be running or queued before new ones are rejected with 429
+PASSWORD_HASH_MAX_PENDING = int(
+    os.getenv("PASSWORD_HASH_MAX_PENDING", str(PASSWORD_HASH_WORKERS * 4))
+)
+
+_executor: Optional[ProcessPoolExecutor] = None
+_executor_lock = threading.Lock()
+_pending_slots = threading.BoundedSemaphore(PASSWORD_HASH_MAX_PENDING)
+
+
+def _hash(password: str) -> str:
+    return pwd_context.hash(password)
+
+
+def _verify(plain_password: str, hashed_password: str) -> bool:
+    return pwd_context.verify(plain_password, hashed_password)
+
+
+def get_executor() -> ProcessPoolExecutor:
+    """
+    Return the shared password hashing process pool, creating it on first use.
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            # "spawn" avoids forking a process that already runs server threads
+            _executor = ProcessPoolExecutor(
+                max_workers=PASSWORD_HASH_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            logger.info(f"Started password hashing pool with {PASSWORD_HASH_WORKERS} workers.")
+        return _executor
+
+
+def shutdown_executor() -> None:
+    """
+    Stop the password hashing process pool if it was started.
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=True, cancel_futures=True)
+            _executor = None
+
+
+def _submit(fn, *args) -> Future:
+    # Reserve a pending slot without waiting so bursts turn into 429s instead of a growing queue
+    if not _pending_slots.acquire(blocking=False):
+        logger.warning("Password hashing pool is saturated; rejecting request.")
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many authentication requests in progress. Please retry shortly.",
+            headers={"Retry-After": "1"},
+        )
+    try:
+        future = get_executor().submit(fn, *args)
+    except Exception:
+        _pending_slots.release()
+        raise
+    future.add_done_callback(lambda _: _pending_slots.release())
+    return future
+
+
+async def hash_password(password: str) -> str:
+    """Hash a password using bcrypt without blocking the event loop."""
+    return await asyncio.wrap_future(_submit(_hash, password))
+
+
+async def verify_password(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password against a bcrypt hash without blocking the event loop."""
+    return await asyncio.wrap_future(_submit(_verify, plain_password, hashed_password))
+
+
+def hash_password_sync(password: str) -> str:
+    """Hash a password in the pool from synchronous code (e.g. threadpool routes)."""
+    return _submit(_hash, password).result()
+
+
+def verify_password_sync(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password in the pool from synchronous code (e.g. threadpool routes)."""
+    return _submit(_verify, plain_password, hashed_password).result()
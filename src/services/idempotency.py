@@ -0,0 +1,225 @@
+import asyncio
+import hashlib
+import logging
+import os
+from datetime import datetime, timedelta, timezone
+from typing import Any, NamedTuple, Optional
+
+import orjson
+from fastapi import HTTPException, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from src.models import IdempotencyKey
+from src.services.cache import TTLCache
+from src.services.database import AsyncSessionLocal, SessionLocal
+
+logger = logging.getLogger(__name__)
+
+# Retries are replayed for this long after the first request; older keys are purged
+IDEMPOTENCY_KEY_TTL_SECONDS = float(os.getenv("IDEMPOTENCY_KEY_TTL_SECONDS", str(24 * 60 * 60)))
+IDEMPOTENCY_PURGE_INTERVAL_SECONDS = float(os.getenv("IDEMPOTENCY_PURGE_INTERVAL_SECONDS", "600"))
+# Recent responses are also kept in memory, so most retries are replayed without a query
+IDEMPOTENCY_CACHE_MAX_SIZE = int(os.getenv("IDEMPOTENCY_CACHE_MAX_SIZE", "10000"))
+IDEMPOTENCY_KEY_MAX_LENGTH = 255
+
+REPLAYED_HEADER = "Idempotent-Replayed"
+
+_cache = TTLCache(maxsize=IDEMPOTENCY_CACHE_MAX_SIZE, ttl=IDEMPOTENCY_KEY_TTL_SECONDS)
+
+
+class IdempotentRequest(NamedTuple):
+    """
+    A request sent with an ``Idempotency-Key``, scoped to its owner and endpoint.
+    """
+    owner_id: int
+    endpoint: str
+    key: str
+    fingerprint: str
+
+    @property
+    def cache_key(self) -> tuple:
+        return self.owner_id, self.endpoint, self.key
+
+
+def idempotent_request(key: Optional[str], owner_id: int, endpoint: str, body: Any) -> Optional[IdempotentRequest]:
+    """
+    Return the idempotent request for an ``Idempotency-Key`` header, or None without one.
+
+    ``body`` is what identifies the request; leave out secrets such as passwords, since
+    only its hash is stored.
+    """
+    if key is None:
+        return None
+    if not key or len(key) > IDEMPOTENCY_KEY_MAX_LENGTH:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Idempotency-Key must be 1 to {IDEMPOTENCY_KEY_MAX_LENGTH} characters."
+        )
+    canonical = orjson.dumps(jsonable_encoder(body), option=orjson.OPT_SORT_KEYS)
+    return IdempotentRequest(owner_id, endpoint, key, hashlib.sha256(canonical).hexdigest())
+
+
+def expires_in(created_at: datetime) -> float:
+    # SQLite returns naive timestamps, stored in UTC by CURRENT_TIMESTAMP
+    if created_at.tzinfo is None:
+        created_at = created_at.replace(tzinfo=timezone.utc)
+    return IDEMPOTENCY_KEY_TTL_SECONDS - (datetime.now(timezone.utc) - created_at).total_seconds()
+
+
+def replay_response(request: IdempotentRequest, fingerprint: str, status_code: int, content: Any) -> ORJSONResponse:
+    if fingerprint != request.fingerprint:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="Idempotency-Key was already used for a different request."
+        )
+    logger.info(f"Replaying response for Idempotency-Key '{request.key}' on {request.endpoint}")
+    return ORJSONResponse(status_code=status_code, content=content, headers={REPLAYED_HEADER: "true"})
+
+
+def cached_response(request: Optional[IdempotentRequest]) -> Optional[ORJSONResponse]:
+    """
+    Return the response to replay from the in-memory cache, without a query.
+    """
+    if request is None:
+        return None
+    cached = _cache.get(request.cache_key)
+    return replay_response(request, *cached) if cached is not None else None
+
+
+def claim_idempotency_key(db: Session, request: Optional[IdempotentRequest]) -> Optional[ORJSONResponse]:
+    """
+    Start an idempotent request, before any of its writes: return the stored response to
+    replay if the key was used already, otherwise insert the key in the current transaction.
+
+    The insert is the only statement on a first request. A retry that misses the in-memory
+    cache fails it on the primary key, which also waits for a concurrent first request to
+    commit, and then reads the stored response.
+    """
+    replay = cached_response(request)
+    if request is None or replay is not None:
+        return replay
+
+    values = {
+        "owner_id": request.owner_id,
+        "endpoint": request.endpoint,
+        "key": request.key,
+        "fingerprint": request.fingerprint,
+    }
+    try:
+        db.execute(insert(IdempotencyKey).values(**values))
+        return None
+    except IntegrityError as error:
+        db.rollback()
+        conflict = error
+
+    stored = db.execute(
+        select(IdempotencyKey.fingerprint, IdempotencyKey.status_code,
+               IdempotencyKey.response, IdempotencyKey.created_at)
+        .where(
+            IdempotencyKey.owner_id == request.owner_id,
+            IdempotencyKey.endpoint == request.endpoint,
+            IdempotencyKey.key == request.key,
+        )
+    ).one_or_none()
+    if stored is None:
+        # Not a key conflict, e.g. the owner does not exist
+        raise conflict
+    response = (stored.fingerprint, stored.status_code, stored.response)
+    if expires_in(stored.created_at) > 0:
+        _cache.set(request.cache_key, response, ttl=expires_in(stored.created_at))
+        return replay_response(request, *response)
+
+    # Expired but not purged yet: the key is free again
+    db.execute(delete(IdempotencyKey).where(
+        IdempotencyKey.owner_id == request.owner_id,
+        IdempotencyKey.endpoint == request.endpoint,
+        IdempotencyKey.key == request.key,
+    ))
+    db.execute(insert(IdempotencyKey).values(**values))
+    return None
+
+
+def commit_idempotent(db: Session, request: Optional[IdempotentRequest], status_code: int, response: Any) -> None:
+    """
+    Store the response of a claimed request with its writes, and commit them together.
+    """
+    if request is None:
+        db.commit()
+        return
+    content = jsonable_encoder(response)
+    db.execute(
+        update(IdempotencyKey)
+        .where(
+            IdempotencyKey.owner_id == request.owner_id,
+            IdempotencyKey.endpoint == request.endpoint,
+            IdempotencyKey.key == request.key,
+        )
+        .values(status_code=status_code, response=content)
+    )
+    db.commit()
+    _cache.set(request.cache_key, (request.fingerprint, status_code, content))
+
+
+def purge_expired_keys(db: Session) -> int:
+    """
+    Delete expired idempotency keys and return how many, using the created_at index.
+    """
+    cutoff = datetime.now(timezone.utc) - timedelta(seconds=IDEMPOTENCY_KEY_TTL_SECONDS)
+    purged = db.execute(
+        delete(IdempotencyKey).where(IdempotencyKey.created_at < cutoff)
+        .execution_options(synchronize_session=False)
+    ).rowcount
+    db.commit()
+    return purged
+
+
+async def run_idempotency_key_purge() -> int:
+    """
+    Purge expired keys in their own session, in either database mode.
+    """
+    if AsyncSessionLocal is not None:
+        async with AsyncSessionLocal() as db:
+            return await db.run_sync(purge_expired_keys)
+
+    def purge() -> int:
+        with SessionLocal() as db:
+            return purge_expired_keys(db)
+
+    return await run_in_threadpool(purge)
+
+
+async def purge_idempotency_keys_periodically() -> None:
+    while True:
+        await asyncio.sleep(IDEMPOTENCY_PURGE_INTERVAL_SECONDS)
+        try:
+            purged = await run_idempotency_key_purge()
+            if purged:
+                logger.info(f"Purged {purged} expired idempotency keys")
+        except Exception:
+            logger.exception("Purging expired idempotency keys failed")
+
+
+_purge_task: Optional[asyncio.Task] = None
+
+
+async def start_idempotency_key_purge() -> None:
+    global _purge_task
+    _purge_task = asyncio.create_task(purge_idempotency_keys_periodically())
+
+
+async def stop_idempotency_key_purge() -> None:
+    if _purge_task is not None:
+        _purge_task.cancel()
+
+
+def clear_idempotency_cache() -> None:
+    _cache.clear()
+
+
+def idempotency_cache_stats() -> dict:
+    return _cache.stats()
@@ -0,0 +1,179 @@
+import bisect
+import threading
+import time
+from contextvars import ContextVar
+from typing import Dict, List, Optional, Sequence, Tuple
+
+# Default latency buckets in seconds, from sub-millisecond queries to pool timeouts
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# Buckets for SQL statements per request and response sizes in bytes
+QUERY_COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100)
+SIZE_BUCKETS = (100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+
+
+class Histogram:
+    """
+    Thread-safe cumulative histogram with fixed upper bounds, Prometheus style.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self._counts = [0] * (len(self.buckets) + 1)
+        self._sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._sum += value
+
+    def snapshot(self) -> dict:
+        """
+        Return cumulative bucket counts keyed by upper bound ("+Inf" last), plus count and sum.
+        """
+        with self._lock:
+            counts = list(self._counts)
+            total = self._sum
+        cumulative = {}
+        running = 0
+        for bound, count in zip([*map(str, self.buckets), "+Inf"], counts):
+            running += count
+            cumulative[bound] = running
+        return {"buckets": cumulative, "count": running, "sum": total}
+
+
+def escape_label_value(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def format_labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{escape_label_value(value)}"' for name, value in labels.items()) + "}"
+
+
+def render_histogram(name: str, histogram: Histogram, labels: Optional[Dict[str, str]] = None) -> List[str]:
+    """
+    Render the sample lines of one histogram in the Prometheus text format.
+    """
+    labels = labels or {}
+    snapshot = histogram.snapshot()
+    lines = [
+        f"{name}_bucket{format_labels({**labels, 'le': bound})} {count}"
+        for bound, count in snapshot["buckets"].items()
+    ]
+    lines.append(f"{name}_sum{format_labels(labels)} {snapshot['sum']}")
+    lines.append(f"{name}_count{format_labels(labels)} {snapshot['count']}")
+    return lines
+
+
+class HistogramFamily:
+    """
+    One histogram per combination of label values, rendered under a single metric name.
+    """
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str],
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = buckets
+        self._children: Dict[Tuple[str, ...], Histogram] = {}
+        self._lock = threading.Lock()
+
+    def labels(self, *values: str) -> Histogram:
+        child = self._children.get(values)
+        if child is None:
+            with self._lock:
+                child = self._children.setdefault(values, Histogram(self.buckets))
+        return child
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        for values, child in sorted(self._children.items()):
+            lines.extend(render_histogram(self.name, child, dict(zip(self.labelnames, values))))
+        return lines
+
+
+class CounterFamily:
+    """
+    Monotonic counters per combination of label values.
+    """
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str]):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *values: str, amount: float = 1) -> None:
+        with self._lock:
+            self._values[values] = self._values.get(values, 0) + amount
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            items = sorted(self._values.items())
+        for values, value in items:
+            lines.append(f"{self.name}{format_labels(dict(zip(self.labelnames, values)))} {value}")
+        return lines
+
+
+# Per-route request metrics, recorded by src.middleware.RequestMetricsMiddleware
+REQUESTS_TOTAL = CounterFamily(
+    "http_requests_total", "Requests by method, route template and status code.",
+    ("method", "route", "status"),
+)
+REQUEST_DURATION_SECONDS = HistogramFamily(
+    "http_request_duration_seconds", "Time until the response was fully sent.",
+    ("method", "route"),
+)
+REQUEST_DB_QUERIES = HistogramFamily(
+    "http_request_db_queries", "SQL statements executed per request.",
+    ("method", "route"), QUERY_COUNT_BUCKETS,
+)
+REQUEST_DB_SECONDS = HistogramFamily(
+    "http_request_db_seconds", "Time spent executing SQL statements per request.",
+    ("method", "route"),
+)
+RESPONSE_SIZE_BYTES = HistogramFamily(
+    "http_response_size_bytes", "Response body size.",
+    ("method", "route"), SIZE_BUCKETS,
+)
+
+REQUEST_FAMILIES = (
+    REQUESTS_TOTAL,
+    REQUEST_DURATION_SECONDS,
+    REQUEST_DB_QUERIES,
+    REQUEST_DB_SECONDS,
+    RESPONSE_SIZE_BYTES,
+)
+
+
+class RequestStats:
+    """
+    Database work done on behalf of the current request.
+    """
+    __slots__ = ("db_queries", "db_seconds")
+
+    def __init__(self):
+        self.db_queries = 0
+        self.db_seconds = 0.0
+
+
+# Set by the metrics middleware for each request. The object itself is shared with the
+# threadpool and greenlets that run the request's queries, so they can add to it.
+current_request_stats: ContextVar[Optional[RequestStats]] = ContextVar("current_request_stats", default=None)
+
+
+def record_query(started: float) -> None:
+    """
+    Add a statement that started at ``started`` (``time.perf_counter()``) to the current request.
+    """
+    stats = current_request_stats.get()
+    if stats is not None:
+        stats.db_queries += 1
+        stats.db_seconds += time.perf_counter() - started
@@ -0,0 +1,93 @@
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session
+
+from src.models import Task, TaskTombstone
+from src.services.task_versions import bump_tasks_version
+
+# Columns single-task routes respond with; version feeds the task's ETag
+TASK_COLUMNS = (Task.id, Task.title, Task.status, Task.description, Task.version)
+
+
+def get_task_owner(db: Session, task_id: int) -> Optional[int]:
+    """
+    Return the owner of a task, or None if it does not exist.
+
+    Only needed when an owner-filtered statement matched nothing, to tell 404 and 403
+    from a failed version precondition.
+    """
+    return db.execute(select(Task.owner_id).where(Task.id == task_id)).scalar_one_or_none()
+
+
+def get_owned_task(db: Session, task_id: int, owner_id: int) -> Optional[Row]:
+    """
+    Return the owner's task with a single SELECT filtered by ``(id, owner_id)``, or None.
+    """
+    return db.execute(
+        select(*TASK_COLUMNS).where(*owned_task_filter(task_id, owner_id))
+    ).one_or_none()
+
+
+def owned_task_filter(task_id: int, owner_id: int, versions: Optional[List[int]] = None) -> list:
+    """
+    Match the owner's task, and with ``versions`` only while it is at one of them.
+
+    Comparing the version in the statement itself makes concurrent writers lock-free: of
+    two writers holding the same version, the second matches nothing instead of clobbering.
+    """
+    conditions = [Task.id == task_id, Task.owner_id == owner_id]
+    if versions is not None:
+        conditions.append(Task.version.in_(versions))
+    return conditions
+
+
+def update_owned_task(
+        db: Session,
+        task_id: int,
+        owner_id: int,
+        values: Dict[str, Any],
+        versions: Optional[List[int]] = None,
+) -> Optional[Row]:
+    """
+    Apply ``values`` to the owner's task with one ``UPDATE ... RETURNING`` and commit.
+
+    Returns the updated task, or None after rolling back if the owner has no such task
+    at one of ``versions``.
+    """
+    revision = bump_tasks_version(db, owner_id)
+    updated = db.execute(
+        update(Task)
+        .where(*owned_task_filter(task_id, owner_id, versions))
+        .values(**values, version=Task.version + 1, revision=revision)
+        .returning(*TASK_COLUMNS)
+        .execution_options(synchronize_session=False)
+    ).one_or_none()
+    # Nothing matched: drop the version bump so cached listings stay valid
+    if updated is None:
+        db.rollback()
+        return None
+    db.commit()
+    return updated
+
+
+def delete_owned_task(db: Session, task_id: int, owner_id: int, versions: Optional[List[int]] = None) -> bool:
+    """
+    Delete the owner's task with one ``DELETE ... RETURNING``, leave a tombstone for delta
+    sync and commit. Returns False after rolling back if the owner has no such task at
+    one of ``versions``.
+    """
+    revision = bump_tasks_version(db, owner_id)
+    deleted = db.execute(
+        delete(Task)
+        .where(*owned_task_filter(task_id, owner_id, versions))
+        .returning(Task.id)
+        .execution_options(synchronize_session=False)
+    ).scalar_one_or_none()
+    if deleted is None:
+        db.rollback()
+        return False
+    db.execute(insert(TaskTombstone).values(task_id=task_id, owner_id=owner_id, revision=revision))
+    db.commit()
+    return True
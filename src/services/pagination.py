@@ -0,0 +1,130 @@
+import base64
+import binascii
+import json
+import operator
+import os
+from typing import Any, Callable, List, NamedTuple, Optional, Tuple, TypeVar
+
+from fastapi import HTTPException, status
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import Query
+
+# Page size bounds for keyset (cursor) pagination
+DEFAULT_PAGE_SIZE = int(os.getenv("DEFAULT_PAGE_SIZE", "100"))
+MAX_PAGE_SIZE = int(os.getenv("MAX_PAGE_SIZE", "1000"))
+
+T = TypeVar("T")
+
+
+class KeysetOrder(NamedTuple):
+    """
+    A listing order other than ascending key: an optional leading column, then the key.
+    """
+    # Bound into cursors, so a cursor only continues the ordering it was issued for
+    name: str
+    column: Any = None
+    descending: bool = False
+
+
+def encode_token(owner_id: int, **fields: Any) -> str:
+    """
+    Encode ``fields`` as an opaque URL-safe token bound to ``owner_id``.
+    """
+    raw = json.dumps({"o": owner_id, **fields}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_token(token: str, owner_id: int, parse: Callable[[dict], T], name: str = "pagination cursor") -> T:
+    """
+    Decode a token from ``encode_token`` and return ``parse`` applied to its fields.
+
+    Malformed tokens, including fields ``parse`` rejects, and tokens issued to another
+    owner are answered with ``400``.
+    """
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        token_owner = int(payload["o"])
+        value = parse(payload)
+    except (binascii.Error, ValueError, KeyError, TypeError, AttributeError, IndexError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid {name}."
+        )
+    if token_owner != owner_id:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"{name.capitalize()} does not belong to the current user."
+        )
+    return value
+
+
+# Encode the position after the last returned row as an opaque cursor
+def encode_cursor(owner_id: int, last_id: int, order: Optional[KeysetOrder] = None, last_value: Any = None) -> str:
+    fields = {"i": last_id}
+    if order is not None:
+        fields["s"] = order.name
+        if order.column is not None:
+            fields["v"] = last_value
+    return encode_token(owner_id, **fields)
+
+
+# Decode a cursor and make sure it was issued for the same owner and ordering
+def decode_cursor(cursor: str, owner_id: int, order: Optional[KeysetOrder] = None) -> Tuple[int, Any]:
+    last_id, cursor_order, last_value = decode_token(
+        cursor, owner_id, lambda payload: (int(payload["i"]), payload.get("s"), payload.get("v"))
+    )
+    if cursor_order != (order.name if order is not None else None):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Pagination cursor was issued for a different sort order."
+        )
+    return last_id, last_value
+
+
+def keyset_order_by(key_column, order: Optional[KeysetOrder] = None) -> list:
+    """
+    Return the ORDER BY clauses of a keyset listing: the order's column, then the key.
+    """
+    if order is None:
+        return [key_column]
+    columns = [column for column in (order.column, key_column) if column is not None]
+    return [column.desc() if order.descending else column for column in columns]
+
+
+# Fetch one page of a query ordered by an ascending unique key column
+def paginate_keyset(
+        query: Query,
+        key_column,
+        owner_id: int,
+        limit: Optional[int],
+        cursor: Optional[str],
+        order: Optional[KeysetOrder] = None,
+) -> Tuple[List[Any], Optional[str]]:
+    """
+    Return up to ``limit`` rows after ``cursor`` and the cursor of the next page.
+
+    The query must already be filtered by owner so that the
+    ``(owner_id, key)`` composite index can serve every page at the same cost.
+    With an ``order``, an ``(owner_id, column, key)`` index has to serve it instead.
+    """
+    limit = limit or DEFAULT_PAGE_SIZE
+    if cursor:
+        last_id, last_value = decode_cursor(cursor, owner_id, order)
+        after = operator.lt if order is not None and order.descending else operator.gt
+        if order is not None and order.column is not None:
+            query = query.filter(or_(
+                after(order.column, last_value),
+                and_(order.column == last_value, after(key_column, last_id)),
+            ))
+        else:
+            query = query.filter(after(key_column, last_id))
+
+    # Fetch one extra row to find out whether another page exists
+    rows = query.order_by(None).order_by(*keyset_order_by(key_column, order)).limit(limit + 1).all()
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last_value = getattr(rows[-1], order.column.key) if order is not None and order.column is not None else None
+        next_cursor = encode_cursor(owner_id, getattr(rows[-1], key_column.key), order, last_value)
+    return rows, next_cursor
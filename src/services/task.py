@@ -1,16 +1,14 @@
 from fastapi import HTTPException
-from passlib.context import CryptContext
 from sqlalchemy.orm import Session
 
 from src.models import Task, User
 from src.schemas import TaskCreate, TaskUpdate, UserCreate
-
-# Password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+from src.services.crud import reject_duplicates
+from src.services.hashing import hash_password_sync
 
 
 def get_password_hash(password: str) -> str:
-    return pwd_context.hash(password)
+    return hash_password_sync(password)
 
 
 # Task CRUD operations
@@ -50,10 +48,6 @@ def delete_todo(db: Session, todo_id: int, user_id: int):
 
 
 def create_user(db: Session, user: UserCreate):
-    existing_user = db.query(User).filter_by(username=user.username).first()
-    if existing_user is not None:
-        raise HTTPException(status_code=400, detail="Username already taken")
-
     hashed_password = get_password_hash(user.password)
     db_user = User(
         username=user.username,
@@ -62,7 +56,9 @@ def create_user(db: Session, user: UserCreate):
         disabled=user.disabled,
     )
     db.add(db_user)
-    db.commit()
+    # The unique username and email indexes reject a taken username or email
+    with reject_duplicates(db, "Username or Email already exists"):
+        db.commit()
     db.refresh(db_user)
     return db_user
 
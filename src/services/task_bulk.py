@@ -0,0 +1,142 @@
+from typing import List
+
+from fastapi import HTTPException, status
+from sqlalchemy import case, delete, insert, literal, update
+from sqlalchemy.orm import Session
+
+from src.enums.task_status import TaskStatus
+from src.models import Task, TaskTombstone
+from src.schemas import TaskBulkUpdateItem
+from src.schemas.task import TaskBase
+from src.services.task_versions import bump_tasks_version
+
+# Columns that a bulk update may change
+UPDATABLE_COLUMNS = ("title", "description", "status")
+
+
+def ensure_unique_ids(ids: List[int]) -> None:
+    """
+    Reject bulk requests that reference the same task more than once.
+    """
+    if len(set(ids)) != len(ids):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Each task ID may only appear once per bulk request."
+        )
+
+
+def bulk_create_tasks(db: Session, owner_id: int, items: List[TaskBase]) -> List[dict]:
+    """
+    Insert all items for the owner in a single multi-row INSERT and return one result per item.
+    """
+    revision = bump_tasks_version(db, owner_id)
+    rows = [
+        {
+            "title": item.title,
+            # tasks.description is NOT NULL; one missing value must not fail the whole batch
+            "description": item.description or "",
+            "owner_id": owner_id,
+            "status": item.status or TaskStatus.PENDING,
+            "revision": revision,
+        }
+        for item in items
+    ]
+    created = db.execute(
+        insert(Task).returning(Task.id, Task.title, Task.status, sort_by_parameter_order=True),
+        rows,
+    ).all()
+    db.commit()
+    return [
+        {"index": index, "id": row.id, "title": row.title, "status": row.status, "result": "created"}
+        for index, row in enumerate(created)
+    ]
+
+
+def bulk_update_tasks(db: Session, owner_id: int, items: List[TaskBulkUpdateItem]) -> List[dict]:
+    """
+    Apply per-item changes with a single ``UPDATE ... WHERE id IN (...)`` using CASE expressions.
+    """
+    ensure_unique_ids([item.id for item in items])
+
+    results = {}
+    changes = {}
+    for item in items:
+        values = {column: getattr(item, column) for column in UPDATABLE_COLUMNS if getattr(item, column)}
+        if values:
+            changes[item.id] = values
+        else:
+            results[item.id] = {"id": item.id, "result": "error", "detail": "No valid fields provided for update."}
+
+    if changes:
+        revision = bump_tasks_version(db, owner_id)
+        # Only touch columns that at least one item changes; other rows keep their current value
+        assignments = {}
+        for column in UPDATABLE_COLUMNS:
+            column_attr = getattr(Task, column)
+            # Bind with the column type so values go through the same conversion as ORM writes
+            whens = {
+                task_id: literal(values[column], column_attr.type)
+                for task_id, values in changes.items()
+                if column in values
+            }
+            if whens:
+                assignments[column] = case(whens, value=Task.id, else_=column_attr)
+
+        updated = db.execute(
+            update(Task)
+            .where(Task.id.in_(changes), Task.owner_id == owner_id)
+            .values(**assignments, version=Task.version + 1, revision=revision)
+            .returning(Task.id, Task.title, Task.status, Task.description)
+            .execution_options(synchronize_session=False)
+        ).all()
+        # Nothing matched: drop the version bump so cached listings stay valid
+        if updated:
+            db.commit()
+        else:
+            db.rollback()
+
+        for row in updated:
+            results[row.id] = {
+                "id": row.id,
+                "title": row.title,
+                "status": row.status,
+                "description": row.description,
+                "result": "updated",
+            }
+
+    return [
+        results.get(item.id, {"id": item.id, "result": "not_found", "detail": f"Task with ID '{item.id}' not found."})
+        for item in items
+    ]
+
+
+def bulk_delete_tasks(db: Session, owner_id: int, ids: List[int]) -> List[dict]:
+    """
+    Delete the owner's tasks with a single ``DELETE ... WHERE id IN (...)`` and leave
+    tombstones for delta sync.
+    """
+    ensure_unique_ids(ids)
+
+    revision = bump_tasks_version(db, owner_id)
+    deleted = set(
+        db.execute(
+            delete(Task)
+            .where(Task.id.in_(ids), Task.owner_id == owner_id)
+            .returning(Task.id)
+            .execution_options(synchronize_session=False)
+        ).scalars()
+    )
+    if deleted:
+        db.execute(insert(TaskTombstone), [
+            {"task_id": task_id, "owner_id": owner_id, "revision": revision} for task_id in deleted
+        ])
+        db.commit()
+    else:
+        db.rollback()
+
+    return [
+        {"id": task_id, "result": "deleted"}
+        if task_id in deleted
+        else {"id": task_id, "result": "not_found", "detail": f"Task with ID '{task_id}' not found."}
+        for task_id in ids
+    ]
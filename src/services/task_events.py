@@ -0,0 +1,201 @@
+import asyncio
+import itertools
+import os
+import secrets
+import threading
+from collections import OrderedDict, deque
+from typing import AsyncIterator, Deque, Dict, List, NamedTuple, Optional, Set, Tuple
+
+import orjson
+
+# Events kept per user for resuming with Last-Event-ID, and users with a buffer
+TASK_EVENTS_BUFFER_SIZE = int(os.getenv("TASK_EVENTS_BUFFER_SIZE", "100"))
+TASK_EVENTS_MAX_USERS = int(os.getenv("TASK_EVENTS_MAX_USERS", "10000"))
+# Events queued for one connection before it is told to resync instead
+TASK_EVENTS_QUEUE_SIZE = int(os.getenv("TASK_EVENTS_QUEUE_SIZE", "1000"))
+# Idle connections get a comment line this often, so proxies do not time them out
+TASK_EVENTS_HEARTBEAT_SECONDS = float(os.getenv("TASK_EVENTS_HEARTBEAT_SECONDS", "15"))
+
+# Event type telling a client to refetch through GET /tasks/changes instead of applying events
+RESYNC = "resync"
+
+
+class TaskEvent(NamedTuple):
+    seq: int
+    type: str
+    data: Optional[dict]
+
+
+class _UserBuffer:
+    __slots__ = ("events", "dropped_through")
+
+    def __init__(self, size: int, dropped_through: int):
+        self.events: Deque[TaskEvent] = deque(maxlen=size)
+        # Highest sequence number no longer in ``events``; resuming from before it loses events
+        self.dropped_through = dropped_through
+
+
+class Subscription:
+    """
+    One connection's queue of events, filled from any thread through its event loop.
+    """
+
+    def __init__(self, owner_id: int, queue_size: int):
+        self.owner_id = owner_id
+        self.loop = asyncio.get_running_loop()
+        self.queue: "asyncio.Queue[TaskEvent]" = asyncio.Queue(maxsize=queue_size)
+
+    def deliver(self, event: TaskEvent) -> None:
+        # Runs on the subscription's loop
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            # A slow reader must not buffer without bound: drop its backlog and have it resync
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(TaskEvent(event.seq, RESYNC, None))
+
+
+class TaskEventBus:
+    """
+    In-process publish/subscribe of task changes, per user.
+
+    Publishers may run in the threadpool or on the event loop; subscribers are asyncio
+    queues, so an idle connection costs a queue and a suspended task, not a thread.
+    Event IDs are ``<bus id>-<sequence>``; the bus ID changes with every process, so
+    IDs from another worker or before a restart lead to a resync instead of lost events.
+    """
+
+    def __init__(self, buffer_size: int = TASK_EVENTS_BUFFER_SIZE, max_users: int = TASK_EVENTS_MAX_USERS,
+                 queue_size: int = TASK_EVENTS_QUEUE_SIZE):
+        self.bus_id = secrets.token_hex(4)
+        self.buffer_size = buffer_size
+        self.max_users = max_users
+        self.queue_size = queue_size
+        self._seq = itertools.count(1)
+        self._last_seq = 0
+        self._buffers: "OrderedDict[int, _UserBuffer]" = OrderedDict()
+        # Highest sequence number in any evicted user buffer
+        self._evicted_through = 0
+        self._subscribers: Dict[int, Set[Subscription]] = {}
+        self._lock = threading.Lock()
+
+    def event_id(self, seq: int) -> str:
+        return f"{self.bus_id}-{seq}"
+
+    def publish(self, owner_id: int, event_type: str, data: Optional[dict] = None) -> None:
+        """
+        Record an event for the owner and hand it to the owner's open connections.
+
+        Call it after the change is committed.
+        """
+        with self._lock:
+            self._last_seq = seq = next(self._seq)
+            event = TaskEvent(seq, event_type, data)
+            buffer = self._buffers.get(owner_id)
+            if buffer is None:
+                # Events of an earlier, evicted buffer of this user are gone too
+                buffer = self._buffers[owner_id] = _UserBuffer(self.buffer_size, self._evicted_through)
+                while len(self._buffers) > self.max_users:
+                    _, evicted = self._buffers.popitem(last=False)
+                    if evicted.events:
+                        self._evicted_through = max(self._evicted_through, evicted.events[-1].seq)
+            else:
+                self._buffers.move_to_end(owner_id)
+            if len(buffer.events) == buffer.events.maxlen:
+                buffer.dropped_through = buffer.events[0].seq
+            buffer.events.append(event)
+
+            # Scheduled under the lock so every connection receives events in sequence order
+            for subscription in self._subscribers.get(owner_id, ()):
+                try:
+                    subscription.loop.call_soon_threadsafe(subscription.deliver, event)
+                except RuntimeError:
+                    # The subscriber's loop is closed; it is unsubscribed when its stream ends
+                    pass
+
+    def subscribe(self, owner_id: int, last_event_id: Optional[str] = None) -> Tuple[Subscription, List[TaskEvent], str]:
+        """
+        Register a connection and return it with the events to replay after ``last_event_id``
+        and the ID of the last event published before it was registered.
+
+        The replay is a single resync event when the events after ``last_event_id`` are
+        no longer buffered, or the ID was issued by another process.
+        """
+        subscription = Subscription(owner_id, self.queue_size)
+        with self._lock:
+            backlog = self._backlog(owner_id, last_event_id)
+            self._subscribers.setdefault(owner_id, set()).add(subscription)
+            position = self.event_id(self._last_seq)
+        return subscription, backlog, position
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            subscribers = self._subscribers.get(subscription.owner_id)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._subscribers[subscription.owner_id]
+
+    def subscriber_count(self) -> int:
+        with self._lock:
+            return sum(len(subscribers) for subscribers in self._subscribers.values())
+
+    def _backlog(self, owner_id: int, last_event_id: Optional[str]) -> List[TaskEvent]:
+        # Caller holds the lock
+        if last_event_id is None:
+            return []
+        bus_id, _, seq = last_event_id.partition("-")
+        if bus_id != self.bus_id or not seq.isdigit() or int(seq) > self._last_seq:
+            return [TaskEvent(self._last_seq, RESYNC, None)]
+        seq = int(seq)
+        buffer = self._buffers.get(owner_id)
+        dropped_through = buffer.dropped_through if buffer is not None else self._evicted_through
+        if seq < dropped_through:
+            return [TaskEvent(self._last_seq, RESYNC, None)]
+        if buffer is None:
+            return []
+        return [event for event in buffer.events if event.seq > seq]
+
+
+task_event_bus = TaskEventBus()
+
+
+def publish_task_event(owner_id: int, event_type: str, data: Optional[dict] = None) -> None:
+    task_event_bus.publish(owner_id, event_type, data)
+
+
+def format_event(bus: TaskEventBus, event: TaskEvent) -> bytes:
+    data = orjson.dumps(event.data) if event.data is not None else b"{}"
+    return b"id: %s\nevent: %s\ndata: %s\n\n" % (bus.event_id(event.seq).encode(), event.type.encode(), data)
+
+
+async def stream_task_events(
+        owner_id: int,
+        last_event_id: Optional[str] = None,
+        bus: Optional[TaskEventBus] = None,
+        heartbeat_seconds: float = TASK_EVENTS_HEARTBEAT_SECONDS,
+) -> AsyncIterator[bytes]:
+    """
+    Yield the owner's task events in the SSE wire format until the client disconnects.
+    """
+    bus = bus or task_event_bus
+    subscription, backlog, position = bus.subscribe(owner_id, last_event_id)
+    try:
+        if backlog:
+            yield b"retry: 3000\n\n"
+        else:
+            # An ID without data sets the client's Last-Event-ID, so even a connection that
+            # drops before its first event resumes from here
+            yield b"retry: 3000\nid: %s\n\n" % position.encode()
+        for event in backlog:
+            yield format_event(bus, event)
+        while True:
+            try:
+                event = await asyncio.wait_for(subscription.queue.get(), heartbeat_seconds)
+            except asyncio.TimeoutError:
+                yield b": heartbeat\n\n"
+                continue
+            yield format_event(bus, event)
+    finally:
+        bus.unsubscribe(subscription)
@@ -0,0 +1,94 @@
+import csv
+import io
+import os
+from typing import AsyncIterator, Iterator, Sequence, Union
+
+import orjson
+from sqlalchemy import select
+
+from src.models import Task
+from src.services.database import AsyncSessionLocal, SessionLocal
+
+# Rows fetched per round trip from the server-side cursor, and written per response chunk
+EXPORT_BATCH_SIZE = int(os.getenv("EXPORT_BATCH_SIZE", "1000"))
+
+EXPORT_FIELDS = ("id", "title", "status", "description")
+
+EXPORT_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+
+def build_export_query(owner_id: int):
+    """
+    Select only the exported columns, so rows are plain tuples rather than ORM instances.
+    """
+    columns = [getattr(Task, field) for field in EXPORT_FIELDS]
+    return (
+        select(*columns)
+        .where(Task.owner_id == owner_id)
+        .order_by(Task.id)
+        .execution_options(yield_per=EXPORT_BATCH_SIZE)
+    )
+
+
+def format_ndjson(rows: Sequence) -> bytes:
+    return b"".join(orjson.dumps(row._asdict()) + b"\n" for row in rows)
+
+
+def format_csv(rows: Sequence) -> bytes:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(
+        (row.id, row.title, row.status.value, row.description) for row in rows
+    )
+    return buffer.getvalue().encode("utf-8")
+
+
+def csv_header() -> bytes:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerow(EXPORT_FIELDS)
+    return buffer.getvalue().encode("utf-8")
+
+
+FORMATTERS = {"ndjson": format_ndjson, "csv": format_csv}
+
+
+def iter_task_export(owner_id: int, export_format: str) -> Iterator[bytes]:
+    """
+    Yield the owner's tasks one batch per chunk, reading them through a server-side cursor.
+
+    The generator owns its session: FastAPI closes request dependencies before a
+    StreamingResponse starts sending.
+    """
+    formatter = FORMATTERS[export_format]
+    if export_format == "csv":
+        yield csv_header()
+    with SessionLocal() as db:
+        result = db.execute(build_export_query(owner_id))
+        for rows in result.partitions():
+            yield formatter(rows)
+
+
+async def aiter_task_export(owner_id: int, export_format: str) -> AsyncIterator[bytes]:
+    """
+    Async mode counterpart of ``iter_task_export``, streaming through ``AsyncSession.stream``.
+    """
+    formatter = FORMATTERS[export_format]
+    if export_format == "csv":
+        yield csv_header()
+    async with AsyncSessionLocal() as db:
+        result = await db.stream(build_export_query(owner_id))
+        async for rows in result.partitions():
+            yield formatter(rows)
+
+
+def stream_task_export(owner_id: int, export_format: str) -> Union[Iterator[bytes], AsyncIterator[bytes]]:
+    """
+    Return the export body iterator for the configured database mode.
+
+    StreamingResponse runs a sync iterator in the threadpool, one batch per step.
+    """
+    if AsyncSessionLocal is not None:
+        return aiter_task_export(owner_id, export_format)
+    return iter_task_export(owner_id, export_format)
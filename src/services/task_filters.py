@@ -0,0 +1,81 @@
+from typing import List, NamedTuple, Optional, Tuple
+
+from src.enums.task_status import TaskStatus
+from src.models import Task
+from src.services.filters import bad_listing_request, prefix_conditions, split_operator
+from src.services.pagination import KeysetOrder
+
+# Operators allowed per filterable field. Only what an index in ``Task.__table_args__`` can
+# serve is listed: status by (owner_id, status, id), title by (owner_id, title, id)
+FILTER_OPERATORS = {
+    "status": ("eq", "in"),
+    "title": ("eq", "prefix"),
+}
+
+# Sortable fields and their leading sort column; ties are broken by ID in the same direction.
+# ``id`` is served by the (owner_id, id) index and ``title`` by (owner_id, title, id)
+SORT_COLUMNS = {
+    "id": None,
+    "title": Task.title,
+}
+DEFAULT_SORT = "id"
+
+
+class TaskListing(NamedTuple):
+    """
+    Compiled listing parameters: filter expressions and the keyset order, None for ascending ID.
+    """
+    filters: List
+    order: Optional[KeysetOrder] = None
+
+
+def compile_status_filter(raw: str) -> list:
+    operator, operand = split_operator("status", raw, FILTER_OPERATORS["status"])
+    values = operand.split(",") if operator == "in" else [operand]
+    for value in values:
+        if value not in [s.value for s in TaskStatus]:
+            raise bad_listing_request(f"Invalid task status: '{value}'.")
+    statuses = [TaskStatus(value) for value in values]
+    if len(statuses) == 1:
+        return [Task.status == statuses[0]]
+    return [Task.status.in_(statuses)]
+
+
+def compile_title_filter(raw: str) -> Tuple[str, list]:
+    operator, operand = split_operator("title", raw, FILTER_OPERATORS["title"])
+    if operator == "eq":
+        return operator, [Task.title == operand]
+    return operator, prefix_conditions("title", Task.title, operand)
+
+
+def parse_task_listing(
+        status_filter: Optional[str] = None,
+        title_filter: Optional[str] = None,
+        sort: Optional[str] = None,
+) -> TaskListing:
+    """
+    Compile the ``status``, ``title`` and ``sort`` query parameters of a task listing.
+
+    Anything outside the allowlists is rejected with 400, including combinations no index
+    serves in order: a title prefix is a range over the title index, so it has to sort by title.
+    """
+    sort = sort or DEFAULT_SORT
+    descending = sort.startswith("-")
+    sort_field = sort[1:] if descending else sort
+    if sort_field not in SORT_COLUMNS:
+        raise bad_listing_request(
+            f"Cannot sort by '{sort_field}'; sortable fields: {', '.join(SORT_COLUMNS)}."
+        )
+
+    filters = []
+    if status_filter is not None:
+        filters.extend(compile_status_filter(status_filter))
+    if title_filter is not None:
+        title_operator, title_conditions = compile_title_filter(title_filter)
+        if title_operator == "prefix" and sort_field != "title":
+            raise bad_listing_request("A title prefix filter needs sort=title or sort=-title.")
+        filters.extend(title_conditions)
+
+    if sort == DEFAULT_SORT:
+        return TaskListing(filters)
+    return TaskListing(filters, KeysetOrder(sort, SORT_COLUMNS[sort_field], descending))
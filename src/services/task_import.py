@@ -0,0 +1,367 @@
+import codecs
+import collections
+import csv
+import io
+import os
+from typing import AsyncIterator, List, Optional, Tuple
+
+import orjson
+from fastapi import HTTPException, status
+from pydantic import ValidationError
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from src.enums.task_status import TaskStatus
+from src.models import Task
+from src.schemas.task import TaskBase
+from src.services.dependencies import run_db
+from src.services.task_versions import bump_tasks_version
+
+# Valid rows written per INSERT / COPY round trip
+IMPORT_BATCH_SIZE = int(os.getenv("IMPORT_BATCH_SIZE", "1000"))
+# Row errors listed in the report; further errors are only counted
+IMPORT_MAX_ERRORS = int(os.getenv("IMPORT_MAX_ERRORS", "1000"))
+# Longest line or CSV record, in characters; a longer one, e.g. a missing line break or an
+# unclosed quote, fails alone and is dropped as it arrives
+IMPORT_MAX_RECORD_SIZE = int(os.getenv("IMPORT_MAX_RECORD_SIZE", "65536"))
+# Received CSV lines collected before each parse; a record split across two parses is
+# parsed again from its first line
+CSV_LINES_PER_PARSE = 100
+
+IMPORT_FIELDS = ("title", "description", "status")
+COPY_COLUMNS = ("title", "description", "status", "owner_id", "revision")
+
+# (line number, parsed fields, error message); exactly one of fields and error is set
+ParsedRow = Tuple[int, Optional[dict], Optional[str]]
+
+
+async def iter_lines(chunks: AsyncIterator[bytes], keepends: bool = False) -> AsyncIterator[Tuple[int, Optional[str]]]:
+    """
+    Decode the upload incrementally and yield numbered lines, with their line break only
+    if ``keepends`` is set.
+
+    A line longer than ``IMPORT_MAX_RECORD_SIZE`` characters is yielded as None. Its
+    characters are dropped as they arrive, up to the next line break, so memory stays
+    bounded whatever the upload holds.
+    """
+    # utf-8-sig drops the byte order mark that spreadsheet exports often start with
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    # Parts of the unfinished line, or None while an oversized line is being dropped
+    pending: Optional[List[str]] = []
+    pending_size = 0
+    line_number = 0
+
+    def take_line(last_part: str, line_break: str = "\n") -> Optional[str]:
+        nonlocal pending, pending_size
+        line = None
+        if pending is not None and pending_size + len(last_part) <= IMPORT_MAX_RECORD_SIZE:
+            line = "".join(pending) + last_part
+            line = f"{line}{line_break}" if keepends else line.rstrip("\r")
+        pending, pending_size = [], 0
+        return line
+
+    def keep_part(part: str) -> None:
+        nonlocal pending, pending_size
+        if pending is not None:
+            # Only new text is split, and parts are joined once, so each character is handled once
+            pending.append(part)
+            pending_size += len(part)
+            if pending_size > IMPORT_MAX_RECORD_SIZE:
+                pending = None
+
+    try:
+        async for chunk in chunks:
+            *lines, tail = decoder.decode(chunk).split("\n")
+            for part in lines:
+                line_number += 1
+                yield line_number, take_line(part)
+            keep_part(tail)
+        keep_part(decoder.decode(b"", final=True))
+    except UnicodeDecodeError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Upload is not valid UTF-8 after line {line_number}."
+        )
+    if pending is None or pending_size:
+        # The last line has no line break of its own
+        yield line_number + 1, take_line("", line_break="")
+
+
+async def parse_ndjson(chunks: AsyncIterator[bytes]) -> AsyncIterator[ParsedRow]:
+    async for line_number, line in iter_lines(chunks):
+        if line is None:
+            yield line_number, None, f"Line is longer than {IMPORT_MAX_RECORD_SIZE} characters."
+            continue
+        if not line.strip():
+            continue
+        try:
+            fields = orjson.loads(line)
+        except orjson.JSONDecodeError:
+            yield line_number, None, "Invalid JSON."
+            continue
+        if not isinstance(fields, dict):
+            yield line_number, None, "Each line must be a JSON object."
+            continue
+        yield line_number, fields, None
+
+
+class RecordTooLarge(Exception):
+    pass
+
+
+class NeedMoreLines(Exception):
+    pass
+
+
+class CSVLineFeed:
+    """
+    Line iterator feeding ``csv.reader`` from the lines of the upload received so far.
+
+    ``csv.reader`` pulls lines synchronously, so records are parsed in plain sync code,
+    from lines already collected. A record that needs a line which has not arrived yet is
+    abandoned with ``NeedMoreLines`` and parsed again from its first line once more
+    lines are in. The lines of the record being parsed are kept, at most
+    ``IMPORT_MAX_RECORD_SIZE`` characters of them, so that a record that cannot be
+    parsed is dropped on its own and its later lines are parsed again as new records.
+    """
+
+    def __init__(self):
+        self.lines = collections.deque()
+        self.ended = False
+        self.start_record()
+
+    def start_record(self) -> None:
+        self.record: List[Tuple[int, Optional[str]]] = []
+        self.record_size = 0
+        self.reached_end = False
+
+    @property
+    def record_line(self) -> int:
+        return self.record[0][0] if self.record else 0
+
+    def rewind(self) -> None:
+        """
+        Put the current record's lines back, to parse it again when more lines arrive.
+        """
+        self.lines.extendleft(reversed(self.record))
+        self.start_record()
+
+    def resync(self) -> None:
+        """
+        Drop the first line of the current record and parse the rest of it again.
+        """
+        self.lines.extendleft(reversed(self.record[1:]))
+        self.start_record()
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> str:
+        if not self.lines:
+            if not self.ended:
+                raise NeedMoreLines
+            self.reached_end = True
+            raise StopIteration
+        line_number, line = self.lines.popleft()
+        self.record.append((line_number, line))
+        # An oversized line arrives as None, already dropped
+        self.record_size += len(line) if line is not None else IMPORT_MAX_RECORD_SIZE + 1
+        if self.record_size > IMPORT_MAX_RECORD_SIZE:
+            raise RecordTooLarge
+        return line
+
+
+def read_csv_records(reader, feed: CSVLineFeed) -> List[Tuple[int, Optional[list], Optional[str]]]:
+    """
+    Parse the non-blank records complete in the lines received so far.
+    """
+    records = []
+    while True:
+        feed.start_record()
+        try:
+            values = next(reader, None)
+        except NeedMoreLines:
+            feed.rewind()
+            return records
+        except RecordTooLarge:
+            records.append((feed.record_line, None, f"Record is longer than {IMPORT_MAX_RECORD_SIZE} characters."))
+            feed.resync()
+            continue
+        except csv.Error as exc:
+            if feed.reached_end:
+                # A quote was never closed: only its line fails
+                records.append((feed.record_line, None, "Unterminated quoted field."))
+                feed.resync()
+            else:
+                records.append((feed.record_line, None, f"Malformed CSV: {exc}."))
+            continue
+        if values is None:
+            return records
+        if values:
+            records.append((feed.record_line, values, None))
+
+
+class CSVRows:
+    """
+    Turn parsed CSV records into rows named after the header, the first record.
+    """
+
+    def __init__(self):
+        self.feed = CSVLineFeed()
+        # Strict, so that input ending inside a quoted field is an error instead of a row
+        self.reader = csv.reader(self.feed, strict=True)
+        self.header: Optional[List[str]] = None
+
+    def parse(self) -> List[ParsedRow]:
+        rows = []
+        for record_line, values, error in read_csv_records(self.reader, self.feed):
+            if self.header is None:
+                if error is not None:
+                    raise HTTPException(
+                        status_code=status.HTTP_400_BAD_REQUEST,
+                        detail=f"CSV header on line {record_line} is invalid: {error}"
+                    )
+                self.header = [name.strip().lower() for name in values]
+                if "title" not in self.header:
+                    raise HTTPException(
+                        status_code=status.HTTP_400_BAD_REQUEST,
+                        detail="CSV header must include a 'title' column."
+                    )
+                continue
+            if error is not None:
+                rows.append((record_line, None, error))
+                continue
+            if len(values) != len(self.header):
+                rows.append((record_line, None, f"Expected {len(self.header)} columns, got {len(values)}."))
+                continue
+            # Empty cells mean "not set", so status and description fall back to their defaults
+            rows.append((record_line, {name: value for name, value in zip(self.header, values) if value != ""}, None))
+        return rows
+
+
+async def parse_csv(chunks: AsyncIterator[bytes]) -> AsyncIterator[ParsedRow]:
+    """
+    Parse CSV with a header row; quoted fields may span lines and keep their line breaks.
+    """
+    parser = CSVRows()
+    # newline="" semantics: csv.reader sees line breaks, and keeps them in quoted fields
+    async for line in iter_lines(chunks, keepends=True):
+        parser.feed.lines.append(line)
+        if len(parser.feed.lines) >= CSV_LINES_PER_PARSE:
+            for row in parser.parse():
+                yield row
+    parser.feed.ended = True
+    for row in parser.parse():
+        yield row
+
+
+PARSERS = {"ndjson": parse_ndjson, "csv": parse_csv}
+
+
+def format_validation_error(exc: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in error['loc'])}: {error['msg']}" for error in exc.errors()
+    )
+
+
+def copy_records(rows: List[dict]) -> List[tuple]:
+    # The tasks.status enum stores member names
+    return [
+        (row["title"], row["description"], row["status"].name, row["owner_id"], row["revision"])
+        for row in rows
+    ]
+
+
+def copy_task_rows(db: Session, rows: List[dict]) -> None:
+    """
+    Write rows with psycopg2's COPY through the session's connection, inside its transaction.
+    """
+    buffer = io.StringIO()
+    # Quote everything: in COPY's CSV format an unquoted empty value is NULL
+    csv.writer(buffer, quoting=csv.QUOTE_ALL).writerows(copy_records(rows))
+    buffer.seek(0)
+    with db.connection().connection.cursor() as cursor:
+        cursor.copy_expert(
+            f"COPY {Task.__tablename__} ({', '.join(COPY_COLUMNS)}) FROM STDIN WITH (FORMAT csv)", buffer
+        )
+
+
+async def insert_task_rows(db, rows: List[dict]) -> None:
+    """
+    Insert a batch of validated rows: COPY on PostgreSQL, a multi-row INSERT elsewhere.
+    """
+    if db.get_bind().dialect.name != "postgresql":
+        await run_db(db, lambda session: session.execute(insert(Task), rows))
+    elif isinstance(db, AsyncSession):
+        # asyncpg's COPY is a coroutine: await it on the session's driver connection
+        connection = await (await db.connection()).get_raw_connection()
+        await connection.driver_connection.copy_records_to_table(
+            Task.__tablename__, records=copy_records(rows), columns=COPY_COLUMNS
+        )
+    else:
+        await run_db(db, copy_task_rows, rows)
+
+
+async def write_task_batch(db, owner_id: int, batch: List[dict]) -> None:
+    """
+    Insert a batch of validated rows under a new revision of the owner's tasks, and commit.
+
+    The revision bump locks the owner's row (on SQLite, the whole database) until the
+    commit, so the transaction only starts once the batch is complete and never waits
+    on the client's upload.
+    """
+    revision = await run_db(db, bump_tasks_version, owner_id)
+    for row in batch:
+        row["revision"] = revision
+    await insert_task_rows(db, batch)
+    await run_db(db, Session.commit)
+
+
+async def import_task_upload(db, owner_id: int, chunks: AsyncIterator[bytes], import_format: str) -> dict:
+    """
+    Stream an NDJSON or CSV upload into the owner's tasks, committing one batch at a time.
+
+    Invalid rows are skipped and reported by line number; only a batch of valid rows and
+    at most ``IMPORT_MAX_ERRORS`` errors are held in memory at a time. An upload that
+    fails midway keeps the batches committed before it.
+    """
+    imported = 0
+    failed = 0
+    errors = []
+    batch = []
+
+    async for line_number, fields, error in PARSERS[import_format](chunks):
+        if error is None:
+            try:
+                item = TaskBase.model_validate(fields)
+            except ValidationError as exc:
+                error = format_validation_error(exc)
+        if error is not None:
+            failed += 1
+            if len(errors) < IMPORT_MAX_ERRORS:
+                errors.append({"line": line_number, "detail": error})
+            continue
+
+        batch.append({
+            "title": item.title,
+            # tasks.description is NOT NULL, as in bulk creation
+            "description": item.description or "",
+            "status": TaskStatus(item.status or TaskStatus.PENDING),
+            "owner_id": owner_id,
+        })
+        if len(batch) >= IMPORT_BATCH_SIZE:
+            await write_task_batch(db, owner_id, batch)
+            imported += len(batch)
+            batch = []
+
+    # Imports without a valid row leave the collection and its version untouched
+    if batch:
+        await write_task_batch(db, owner_id, batch)
+        imported += len(batch)
+    return {
+        "imported": imported,
+        "failed": failed,
+        "errors": errors,
+        "errors_truncated": failed > len(errors),
+    }
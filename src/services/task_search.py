@@ -0,0 +1,124 @@
+import hashlib
+import os
+import re
+from typing import List, Optional, Tuple
+
+from fastapi import HTTPException, status
+from sqlalchemy import column, func, literal_column, select, table
+from sqlalchemy.orm import Session
+
+from src.models import Task
+from src.models.task_search import SEARCH_CONFIG
+from src.services.pagination import DEFAULT_PAGE_SIZE, decode_token, encode_token
+
+SEARCH_COLUMNS = (Task.id, Task.title, Task.status, Task.description)
+
+# Title matches count 2.5 times as much as description matches, as PostgreSQL's default
+# weights for the A and B labels do
+SQLITE_COLUMN_WEIGHTS = (2.5, 1.0)
+
+# Searches page through at most this many matches; refine the query to reach the rest
+SEARCH_MAX_RESULTS = int(os.getenv("SEARCH_MAX_RESULTS", "1000"))
+
+tasks_fts = table("tasks_fts", column("rowid"), column("owner_id"))
+
+
+def search_terms(q: str) -> List[str]:
+    """
+    Split a query into words; FTS5 and tsquery syntax characters in user input are ignored.
+    """
+    return re.findall(r"\w+", q)
+
+
+def query_key(q: str) -> str:
+    return hashlib.blake2b(" ".join(search_terms(q)).lower().encode(), digest_size=6).hexdigest()
+
+
+# Encode the number of matches already returned as an opaque cursor
+def encode_search_cursor(owner_id: int, q: str, offset: int) -> str:
+    return encode_token(owner_id, q=query_key(q), n=offset)
+
+
+# Decode a cursor and make sure it was issued for the same owner and query
+def decode_search_cursor(cursor: str, owner_id: int, q: str) -> int:
+    cursor_query, offset = decode_token(cursor, owner_id, lambda payload: (str(payload["q"]), int(payload["n"])))
+    if cursor_query != query_key(q):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Pagination cursor does not belong to this search."
+        )
+    if not 0 <= offset < SEARCH_MAX_RESULTS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor."
+        )
+    return offset
+
+
+def build_search_query(dialect: str, owner_id: int, q: str):
+    """
+    Return the owner's matches for ``q`` and the rank expression, best match first.
+
+    Both databases require every word of the query, with no operators: FTS5 gets each
+    word quoted, PostgreSQL the same words through plainto_tsquery(). The rank sorts
+    ascending on both: FTS5's bm25() is lower for better matches, and PostgreSQL's
+    ts_rank() is negated to match.
+    """
+    words = search_terms(q)
+    if dialect == "sqlite":
+        match = " ".join(f'"{term}"' for term in words)
+        rank = func.bm25(literal_column("tasks_fts"), *SQLITE_COLUMN_WEIGHTS)
+        query = (
+            select(*SEARCH_COLUMNS, rank.label("rank"))
+            .select_from(tasks_fts.join(Task.__table__, Task.id == tasks_fts.c.rowid))
+            .where(literal_column("tasks_fts").op("MATCH")(match), tasks_fts.c.owner_id == owner_id)
+        )
+        return query, rank
+
+    if dialect == "postgresql":
+        search_vector = literal_column("tasks.search_vector")
+        ts_query = func.plainto_tsquery(SEARCH_CONFIG, " ".join(words))
+        rank = -func.ts_rank(search_vector, ts_query)
+        query = select(*SEARCH_COLUMNS, rank.label("rank")).where(
+            search_vector.op("@@")(ts_query), Task.owner_id == owner_id
+        )
+        return query, rank
+
+    raise HTTPException(
+        status_code=status.HTTP_501_NOT_IMPLEMENTED,
+        detail=f"Full-text search is not available on '{dialect}' databases."
+    )
+
+
+def search_tasks(
+        db: Session,
+        owner_id: int,
+        q: str,
+        limit: Optional[int],
+        cursor: Optional[str],
+) -> Tuple[list, Optional[str]]:
+    """
+    Return one page of the owner's tasks matching ``q``, best match first, and the next cursor.
+
+    Pages are positions in the ranked list, up to ``SEARCH_MAX_RESULTS`` matches. Ranks
+    cannot anchor a keyset cursor: FTS5's bm25() depends on corpus-wide statistics, so
+    any task written by anyone shifts every score between two requests. Positions only
+    move when the order of the owner's matches changes. Every match is scored to sort
+    them either way, so an offset costs no more than a keyset would.
+    """
+    limit = limit or DEFAULT_PAGE_SIZE
+    if not search_terms(q):
+        return [], None
+
+    query, rank = build_search_query(db.get_bind().dialect.name, owner_id, q)
+    offset = decode_search_cursor(cursor, owner_id, q) if cursor else 0
+    limit = min(limit, SEARCH_MAX_RESULTS - offset)
+
+    # Fetch one extra row to find out whether another page exists
+    rows = db.execute(query.order_by(rank, Task.id).offset(offset).limit(limit + 1)).all()
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        if offset + limit < SEARCH_MAX_RESULTS:
+            next_cursor = encode_search_cursor(owner_id, q, offset + limit)
+    return rows, next_cursor
@@ -0,0 +1,20 @@
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from src.enums.task_status import TaskStatus
+from src.models import TaskStatusCount
+
+
+def get_task_stats(db: Session, owner_id: int) -> dict:
+    """
+    Return the owner's task counts per status from the trigger-maintained counters.
+
+    This reads at most one row per status, however many tasks the owner has.
+    """
+    counts = {task_status: 0 for task_status in TaskStatus}
+    rows = db.execute(
+        select(TaskStatusCount.status, TaskStatusCount.count).where(TaskStatusCount.owner_id == owner_id)
+    )
+    for row in rows:
+        counts[row.status] = row.count
+    return {"counts": counts, "total": sum(counts.values())}
@@ -0,0 +1,229 @@
+import asyncio
+import logging
+import os
+import time
+from datetime import datetime, timedelta, timezone
+from typing import NamedTuple, Optional, Tuple
+
+from fastapi import HTTPException, status
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import and_, delete, or_, select
+from sqlalchemy.orm import Session
+
+from src.models import Task, TaskTombstone
+from src.services.database import AsyncSessionLocal, SessionLocal
+from src.services.pagination import DEFAULT_PAGE_SIZE, decode_token, encode_token
+from src.services.task_versions import get_tasks_version
+
+logger = logging.getLogger(__name__)
+
+# Tombstones are kept this long; older sync tokens must be answered with a full sync
+TOMBSTONE_RETENTION_SECONDS = float(os.getenv("TOMBSTONE_RETENTION_SECONDS", str(30 * 24 * 60 * 60)))
+TOMBSTONE_PURGE_INTERVAL_SECONDS = float(os.getenv("TOMBSTONE_PURGE_INTERVAL_SECONDS", "3600"))
+# A write in flight when a token is issued can stamp its tombstone slightly before the
+# token's time, so tokens expire this much before the tombstones they need are purged
+SYNC_TOKEN_EXPIRY_MARGIN_SECONDS = 60
+
+CHANGE_COLUMNS = (Task.id, Task.title, Task.status, Task.description, Task.revision, Task.updated_at)
+
+# Within a revision, written tasks are returned before tombstones
+CHANGED, DELETED = 0, 1
+
+
+class SyncToken(NamedTuple):
+    """
+    Where a client's sync stands.
+
+    ``revision`` is the revision synced up to (None during a full sync) and ``issued_at``
+    when it was current. Between pages, ``target`` is the revision the sync runs to,
+    ``target_issued_at`` when it was read, and ``after`` the (revision, kind, id) of the
+    last change returned.
+    """
+    revision: Optional[int]
+    issued_at: Optional[int]
+    target: Optional[int] = None
+    target_issued_at: Optional[int] = None
+    after: Optional[Tuple[int, int, int]] = None
+
+
+# Encode where a client's sync stands as an opaque token
+def encode_sync_token(owner_id: int, token: SyncToken) -> str:
+    fields = {"r": token.revision, "t": token.issued_at}
+    if token.after is not None:
+        fields.update(u=token.target, ut=token.target_issued_at, p=list(token.after))
+    return encode_token(owner_id, **fields)
+
+
+def parse_sync_token(payload: dict) -> SyncToken:
+    revision = None if payload["r"] is None else int(payload["r"])
+    # Tokens without an issue time predate the retention window and count as expired
+    issued_at = None if revision is None else int(payload.get("t") or 0)
+    if "p" not in payload:
+        if revision is None:
+            raise ValueError("Only continuation tokens are issued during a full sync")
+        return SyncToken(revision, issued_at)
+    after_revision, kind, last_id = (int(value) for value in payload["p"])
+    if kind not in (CHANGED, DELETED):
+        raise ValueError(f"Unknown change kind {kind}")
+    return SyncToken(revision, issued_at, int(payload["u"]), int(payload["ut"]), (after_revision, kind, last_id))
+
+
+# Decode a sync token and make sure it was issued for the same owner
+def decode_sync_token(token: str, owner_id: int) -> SyncToken:
+    return decode_token(token, owner_id, parse_sync_token, name="sync token")
+
+
+def changes_after(query, revision_column, id_column, after: Optional[Tuple[int, int, int]], kind: int):
+    """
+    Continue ``query`` after the (revision, kind, id) position of the previous page.
+    """
+    if after is None:
+        return query
+    after_revision, after_kind, last_id = after
+    if after_kind > kind:
+        return query.where(revision_column > after_revision)
+    if after_kind < kind:
+        return query.where(revision_column >= after_revision)
+    return query.where(or_(
+        revision_column > after_revision,
+        and_(revision_column == after_revision, id_column > last_id),
+    ))
+
+
+def get_task_changes(db: Session, owner_id: int, token: Optional[SyncToken], limit: Optional[int] = None) -> dict:
+    """
+    Return up to ``limit`` of the owner's task writes and deletes after ``token``.
+
+    Without a token every live task is returned (a full sync). Changes come in (revision,
+    kind, id) order; ``has_more`` says whether to call again at once with the returned
+    ``sync_token``, which then continues the same sync up to the same revision. Both
+    lookups are range scans of the ``(owner_id, revision)`` indexes, so the cost follows
+    the page size, not the number of tasks.
+    """
+    limit = limit or DEFAULT_PAGE_SIZE
+    since = token.revision if token is not None else None
+    if since is not None and token.issued_at < time.time() - TOMBSTONE_RETENTION_SECONDS + SYNC_TOKEN_EXPIRY_MARGIN_SECONDS:
+        raise HTTPException(
+            status_code=status.HTTP_410_GONE,
+            detail="Sync token is older than the deleted task retention window; run a full sync."
+        )
+
+    if token is not None and token.after is not None:
+        target, target_issued_at, after = token.target, token.target_issued_at, token.after
+    else:
+        # Rows are stamped with the version before it is committed, and writers of one
+        # owner are serialized on it, so every row up to this version is already visible
+        target_issued_at = int(time.time())
+        target, after = get_tasks_version(db, owner_id), None
+        if since is not None and since > target:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Sync token is ahead of the server; run a full sync."
+            )
+
+    changed_query = select(*CHANGE_COLUMNS).where(Task.owner_id == owner_id, Task.revision <= target)
+    if since is not None:
+        changed_query = changed_query.where(Task.revision > since)
+    changed_query = changes_after(changed_query, Task.revision, Task.id, after, CHANGED)
+    # Fetch one extra change to find out whether another page exists
+    entries = [
+        (row.revision, CHANGED, row.id, row)
+        for row in db.execute(changed_query.order_by(Task.revision, Task.id).limit(limit + 1))
+    ]
+
+    if since is not None:
+        tombstone_query = select(TaskTombstone.id, TaskTombstone.task_id, TaskTombstone.revision).where(
+            TaskTombstone.owner_id == owner_id,
+            TaskTombstone.revision > since,
+            TaskTombstone.revision <= target,
+        )
+        tombstone_query = changes_after(tombstone_query, TaskTombstone.revision, TaskTombstone.id, after, DELETED)
+        entries += [
+            (row.revision, DELETED, row.id, row)
+            for row in db.execute(tombstone_query.order_by(TaskTombstone.revision, TaskTombstone.id).limit(limit + 1))
+        ]
+
+    entries.sort(key=lambda entry: entry[:3])
+    has_more = len(entries) > limit
+    entries = entries[:limit]
+
+    changed = [
+        {
+            "id": row.id,
+            "title": row.title,
+            "status": row.status,
+            "description": row.description,
+            "revision": row.revision,
+            "updated_at": row.updated_at,
+        }
+        for _, kind, _, row in entries if kind == CHANGED
+    ]
+    # SQLite may reuse the ID of a deleted task; a live row with it was created later.
+    # Across pages the client applies the tombstone first, as pages follow revisions.
+    changed_ids = {change["id"] for change in changed}
+    deleted = sorted({row.task_id for _, kind, _, row in entries if kind == DELETED} - changed_ids)
+
+    if has_more:
+        next_token = SyncToken(since, token.issued_at if since is not None else None,
+                               target, target_issued_at, entries[-1][:3])
+    else:
+        next_token = SyncToken(target, target_issued_at)
+    return {
+        "changed": changed,
+        "deleted": deleted,
+        "sync_token": encode_sync_token(owner_id, next_token),
+        "has_more": has_more,
+    }
+
+
+def purge_expired_tombstones(db: Session) -> int:
+    """
+    Delete tombstones older than the retention window and return how many, using the
+    deleted_at index.
+    """
+    cutoff = datetime.now(timezone.utc) - timedelta(seconds=TOMBSTONE_RETENTION_SECONDS)
+    purged = db.execute(
+        delete(TaskTombstone).where(TaskTombstone.deleted_at < cutoff)
+        .execution_options(synchronize_session=False)
+    ).rowcount
+    db.commit()
+    return purged
+
+
+async def run_tombstone_purge() -> int:
+    """
+    Purge expired tombstones in their own session, in either database mode.
+    """
+    if AsyncSessionLocal is not None:
+        async with AsyncSessionLocal() as db:
+            return await db.run_sync(purge_expired_tombstones)
+
+    def purge() -> int:
+        with SessionLocal() as db:
+            return purge_expired_tombstones(db)
+
+    return await run_in_threadpool(purge)
+
+
+async def purge_tombstones_periodically() -> None:
+    while True:
+        await asyncio.sleep(TOMBSTONE_PURGE_INTERVAL_SECONDS)
+        try:
+            purged = await run_tombstone_purge()
+            if purged:
+                logger.info(f"Purged {purged} expired task tombstones")
+        except Exception:
+            logger.exception("Purging expired task tombstones failed")
+
+
+_purge_task: Optional[asyncio.Task] = None
+
+
+async def start_tombstone_purge() -> None:
+    global _purge_task
+    _purge_task = asyncio.create_task(purge_tombstones_periodically())
+
+
+async def stop_tombstone_purge() -> None:
+    if _purge_task is not None:
+        _purge_task.cancel()
@@ -0,0 +1,29 @@
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+
+from src.models import User
+
+
+def get_tasks_version(db: Session, owner_id: int) -> int:
+    """
+    Return the version of the owner's task collection with a primary key lookup.
+    """
+    return db.execute(select(User.tasks_version).where(User.id == owner_id)).scalar_one_or_none() or 0
+
+
+def bump_tasks_version(db: Session, owner_id: int) -> int:
+    """
+    Mark the owner's task collection as changed, in the caller's transaction, and return
+    the new version: the revision to stamp on every task row the transaction writes.
+
+    The UPDATE locks the user row until the transaction ends, so writes to one user's
+    tasks commit in revision order and a reader that sees version N sees every row
+    stamped up to N. Call it before writing, and commit or roll back promptly.
+    """
+    return db.execute(
+        update(User)
+        .where(User.id == owner_id)
+        .values(tasks_version=User.tasks_version + 1)
+        .returning(User.tasks_version)
+        .execution_options(synchronize_session=False)
+    ).scalar_one()
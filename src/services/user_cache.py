@@ -0,0 +1,77 @@
+import itertools
+import os
+import threading
+import time
+from typing import Optional
+
+from src.schemas.user import CurrentUser
+from src.services.cache import TTLCache
+
+# Authenticated users are cached per token for at most this long (and never past token expiry)
+USER_CACHE_TTL_SECONDS = float(os.getenv("USER_CACHE_TTL_SECONDS", "60"))
+USER_CACHE_MAX_SIZE = int(os.getenv("USER_CACHE_MAX_SIZE", "10000"))
+
+_cache = TTLCache(maxsize=USER_CACHE_MAX_SIZE, ttl=USER_CACHE_TTL_SECONDS)
+
+# Invalidation uses generations instead of a token index: an entry is only valid if it was
+# loaded after the last invalidation of its user, which also covers lookups that race an update.
+# A user's marker only has to outlive the entries cached before it, so it shares their TTL.
+_generation = itertools.count(1)
+_current_generation = 0
+_invalidated_at = TTLCache(maxsize=USER_CACHE_MAX_SIZE, ttl=USER_CACHE_TTL_SECONDS)
+# Entries loaded before this generation may have lost their user's marker to eviction
+_evicted_before = 0
+_lock = threading.Lock()
+
+
+def current_generation() -> int:
+    """
+    Return the generation to pass to ``cache_user`` for a lookup that starts now.
+    """
+    return _current_generation
+
+
+def get_cached_user(token: str) -> Optional[CurrentUser]:
+    """
+    Return the cached user for a token, or None on a miss or after invalidation.
+    """
+    entry = _cache.get(token)
+    if entry is None:
+        return None
+    user, generation = entry
+    if generation < _evicted_before or (_invalidated_at.get(user.id) or 0) > generation:
+        _cache.pop(token)
+        return None
+    return user
+
+
+def cache_user(token: str, user: CurrentUser, generation: int, expires_at: Optional[float] = None) -> None:
+    """
+    Cache a user loaded for a token; ``expires_at`` is the token's ``exp`` as a Unix timestamp.
+    """
+    ttl = None
+    if expires_at is not None:
+        ttl = expires_at - time.time()
+    _cache.set(token, (user, generation), ttl=ttl)
+
+
+def invalidate_user(user_id: int) -> None:
+    """
+    Drop every cached entry for a user, e.g. after it was updated, disabled or deleted.
+    """
+    global _current_generation, _evicted_before
+    with _lock:
+        _current_generation = next(_generation)
+        evictions = _invalidated_at.evictions
+        _invalidated_at.set(user_id, _current_generation)
+        if _invalidated_at.evictions != evictions:
+            # Another user's marker was dropped early: treat every older entry as stale
+            _evicted_before = _current_generation
+
+
+def clear_user_cache() -> None:
+    _cache.clear()
+
+
+def user_cache_stats() -> dict:
+    return _cache.stats()
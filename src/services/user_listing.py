@@ -0,0 +1,68 @@
+from typing import List, NamedTuple, Optional
+
+from src.models import User
+from src.services.filters import bad_listing_request, prefix_conditions, split_operator
+from src.services.pagination import KeysetOrder
+
+# Columns a listing may return; hashed_password and flags are never selectable
+USER_FIELDS = {
+    "id": User.id,
+    "username": User.username,
+    "email": User.email,
+}
+
+# Usernames are searched through the unique username index
+USERNAME_OPERATORS = ("eq", "prefix")
+
+# Prefix matches are a range over the username index, returned in its order
+USERNAME_ORDER = KeysetOrder("username", User.username)
+
+
+class UserListing(NamedTuple):
+    """
+    Compiled user listing parameters: response columns, filters and keyset order.
+    """
+    columns: tuple
+    filters: List
+    order: Optional[KeysetOrder] = None
+
+    @property
+    def select_columns(self) -> tuple:
+        """
+        The response columns plus the order's column, which cursors are built from.
+        """
+        if self.order is None or self.order.column in self.columns:
+            return self.columns
+        return self.columns + (self.order.column,)
+
+    def serialize(self, row) -> dict:
+        return {column.key: getattr(row, column.key) for column in self.columns}
+
+
+def parse_user_fields(fields: Optional[str]) -> tuple:
+    """
+    Return the columns for a ``fields=`` sparse fieldset; the ID is always included.
+    """
+    if not fields:
+        return tuple(USER_FIELDS.values())
+    names = [name.strip() for name in fields.split(",") if name.strip()]
+    unknown = [name for name in names if name not in USER_FIELDS]
+    if unknown:
+        raise bad_listing_request(
+            f"Unknown user field '{unknown[0]}'; selectable fields: {', '.join(USER_FIELDS)}."
+        )
+    return tuple(column for name, column in USER_FIELDS.items() if name == "id" or name in names)
+
+
+def parse_user_listing(fields: Optional[str] = None, username: Optional[str] = None) -> UserListing:
+    """
+    Compile the ``fields`` and ``username`` query parameters of the user listing.
+    """
+    columns = parse_user_fields(fields)
+    if username is None:
+        return UserListing(columns, [])
+
+    operator, operand = split_operator("username", username, USERNAME_OPERATORS)
+    if operator == "eq":
+        return UserListing(columns, [User.username == operand])
+    return UserListing(columns, prefix_conditions("username", User.username, operand), USERNAME_ORDER)
@@ -0,0 +1,67 @@
+import os
+
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import delete, select
+from sqlalchemy.orm import Session
+
+from src.models import Task, User
+from src.services import user_cache
+from src.services.database import AsyncSessionLocal, SessionLocal
+
+# Tasks deleted per transaction by a background purge; each chunk holds locks only briefly
+USER_PURGE_CHUNK_SIZE = int(os.getenv("USER_PURGE_CHUNK_SIZE", "5000"))
+
+
+def delete_task_chunk(db: Session, owner_id: int, chunk_size: int) -> int:
+    """
+    Delete up to ``chunk_size`` of the owner's tasks in ID order, commit, and return how many.
+
+    The subquery walks the (owner_id, id) index, so every chunk costs the same.
+    """
+    chunk = (
+        select(Task.id)
+        .where(Task.owner_id == owner_id)
+        .order_by(Task.id)
+        .limit(chunk_size)
+        .scalar_subquery()
+    )
+    deleted = db.execute(
+        delete(Task).where(Task.id.in_(chunk)).execution_options(synchronize_session=False)
+    ).rowcount
+    db.commit()
+    return deleted
+
+
+def purge_user(db: Session, user_id: int, chunk_size: int = USER_PURGE_CHUNK_SIZE) -> int:
+    """
+    Delete a user's tasks chunk by chunk, then the user, whose ON DELETE CASCADE removes
+    the rest. Returns the number of tasks deleted in chunks.
+
+    Each chunk is its own transaction, so an interrupted purge keeps its progress and
+    running it again finishes the job.
+    """
+    purged = 0
+    while True:
+        deleted = delete_task_chunk(db, user_id, chunk_size)
+        purged += deleted
+        if deleted < chunk_size:
+            break
+    db.execute(delete(User).where(User.id == user_id).execution_options(synchronize_session=False))
+    db.commit()
+    user_cache.invalidate_user(user_id)
+    return purged
+
+
+async def run_user_purge(user_id: int) -> int:
+    """
+    Purge a user in its own session after the response was sent, in either database mode.
+    """
+    if AsyncSessionLocal is not None:
+        async with AsyncSessionLocal() as db:
+            return await db.run_sync(purge_user, user_id)
+
+    def purge() -> int:
+        with SessionLocal() as db:
+            return purge_user(db, user_id)
+
+    return await run_in_threadpool(purge)
@@ -9,7 +9,7 @@ from sqlalchemy.orm import sessionmaker
 from httpx import ASGITransport
 
 from src.main import app
-from src.services.database import Base
+from src.services.database import Base, engine
 
 
 logging.basicConfig(level=logging.DEBUG)
@@ -92,6 +92,9 @@ def reset_database():
     logging.debug("Resetting database: Dropping and recreating tables...")
     Base.metadata.drop_all(bind=test_engine)
     Base.metadata.create_all(bind=test_engine)
+    # The app's pooled SQLite connections cached the dropped schema; FTS5 tables break on
+    # such connections ("no such table", "database disk image is malformed")
+    engine.dispose()
 
 
 @pytest.fixture(scope="function")
@@ -102,4 +105,36 @@ def db(setup_db):
         yield session
     finally:
         session.rollback()
-        session.close()
\ No newline at end of file
+        session.close()
+
+@pytest.fixture(scope="function")
+def auth_user(db):
+    """
+    Creates a user directly in the database and authenticates requests as that user.
+    """
+    import uuid
+
+    from src.models import User
+    from src.schemas.user import CurrentUser
+    from src.services.dependencies import get_current_user
+
+    unique_id = uuid.uuid4().hex[:8]
+    user = User(
+        username=f"authuser_{unique_id}",
+        email=f"authuser_{unique_id}@example.com",
+        hashed_password="not-a-real-hash",
+    )
+    db.add(user)
+    db.commit()
+    db.refresh(user)
+
+    current_user = CurrentUser(
+        id=user.id,
+        username=user.username,
+        email=user.email,
+        disabled=user.disabled,
+        is_admin=user.is_admin,
+    )
+    app.dependency_overrides[get_current_user] = lambda: current_user
+    yield current_user
+    app.dependency_overrides.pop(get_current_user, None)
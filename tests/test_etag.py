@@ -0,0 +1,212 @@
+import asyncio
+import logging
+
+import pytest
+from sqlalchemy.orm.exc import StaleDataError
+
+from src.models import Task, User
+from src.services.etag import etag_matches, if_match_versions, make_etag
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def test_etag_matching():
+    """
+    Tests If-None-Match parsing: lists, weak validators and the wildcard.
+    """
+    etag = make_etag("tasks", 1, 3)
+    assert etag.startswith('"') and etag.endswith('"')
+    assert etag != make_etag("tasks", 1, 4)
+    assert etag_matches(etag, etag)
+    assert etag_matches(f'"other", W/{etag}', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches('"other"', etag)
+    assert not etag_matches(None, etag)
+
+
+def test_if_match_parsing():
+    """
+    Tests that If-Match maps version ETags back to versions with strong comparison.
+    """
+    assert if_match_versions(None) is None
+    assert if_match_versions(" * ") is None
+    assert if_match_versions('"v3", "v12"') == [3, 12]
+    assert if_match_versions('W/"v3", "other", "v-1"') == []
+
+
+@pytest.mark.asyncio
+async def test_task_list_not_modified_until_tasks_change(client, db, auth_user):
+    """
+    Tests that an unchanged task list is revalidated with one query and no body,
+    and that every kind of task write changes the ETag.
+    """
+    db.add(Task(title="Poll", description="Me", owner_id=auth_user.id))
+    db.commit()
+
+    response = await client.get("/tasks")
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+    assert response.headers["cache-control"] == "private, no-cache"
+
+    response = await client.get("/tasks", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+    # Only the collection version is read; no task rows are loaded
+    assert 'desc="queries: 1"' in response.headers["server-timing"]
+
+    # The status listing shares the collection version
+    response = await client.get("/tasks/status/pending", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+
+    writes = [
+        ("POST", "/tasks/bulk", {"items": [{"title": "New"}]}),
+        ("PATCH", "/tasks/bulk", {"items": [{"id": 1, "title": "Renamed"}]}),
+        ("PUT", "/tasks/1", {"status": "completed"}),
+        ("DELETE", "/tasks/bulk", {"ids": [2]}),
+        ("DELETE", "/tasks/1", None),
+    ]
+    for method, url, payload in writes:
+        response = await client.request(method, url, json=payload)
+        assert response.status_code in (200, 201), response.text
+
+        response = await client.get("/tasks", headers={"If-None-Match": etag})
+        assert response.status_code == 200, f"{method} {url} did not change the ETag"
+        assert response.headers["etag"] != etag
+        etag = response.headers["etag"]
+
+
+@pytest.mark.asyncio
+async def test_bulk_update_of_missing_tasks_keeps_etag(client, db, auth_user):
+    """
+    Tests that bulk writes that change nothing leave cached task lists valid.
+    """
+    response = await client.get("/tasks")
+    etag = response.headers["etag"]
+
+    response = await client.request("DELETE", "/tasks/bulk", json={"ids": [404]})
+    assert response.json()["data"][0]["result"] == "not_found"
+
+    response = await client.get("/tasks", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+
+
+@pytest.mark.asyncio
+async def test_single_task_etag_follows_row_version(client, db, auth_user):
+    """
+    Tests that a task's ETag changes when it is updated, and only then.
+    """
+    own = Task(title="Mine", description="Task", owner_id=auth_user.id)
+    db.add(own)
+    db.commit()
+
+    response = await client.get(f"/tasks/{own.id}")
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+
+    response = await client.get(f"/tasks/{own.id}", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+
+    # Writes to other tasks do not invalidate this one
+    response = await client.post("/tasks/bulk", json={"items": [{"title": "Other"}]})
+    assert response.status_code == 201
+    response = await client.get(f"/tasks/{own.id}", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+
+    response = await client.put(f"/tasks/{own.id}", json={"title": "Renamed"})
+    assert response.status_code == 200
+    response = await client.get(f"/tasks/{own.id}", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.json()["data"]["title"] == "Renamed"
+    assert response.headers["etag"] != etag
+
+
+@pytest.mark.asyncio
+async def test_user_etags(client, db, auth_user):
+    """
+    Tests that user reads are revalidated against a hash of their payload.
+    """
+    response = await client.get(f"/users/{auth_user.id}")
+    etag = response.headers["etag"]
+    response = await client.get(f"/users/{auth_user.id}", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+
+    # Only admins may list users
+    auth_user.is_admin = True
+    response = await client.get("/users")
+    list_etag = response.headers["etag"]
+    db.get(User, auth_user.id).email = "changed@example.com"
+    db.commit()
+
+    response = await client.get("/users", headers={"If-None-Match": list_etag})
+    assert response.status_code == 200
+    assert response.json()["data"][0]["email"] == "changed@example.com"
+
+
+@pytest.mark.asyncio
+async def test_if_match_rejects_stale_writes(client, db, auth_user):
+    """
+    Tests that PUT and DELETE with If-Match only apply to the task version it names.
+    """
+    task = Task(title="Shared", description="Task", owner_id=auth_user.id)
+    db.add(task)
+    db.commit()
+
+    etag = (await client.get(f"/tasks/{task.id}")).headers["etag"]
+    response = await client.put(f"/tasks/{task.id}", json={"title": "First"}, headers={"If-Match": etag})
+    assert response.status_code == 200
+    new_etag = response.headers["etag"]
+    assert new_etag != etag
+
+    # A second device still holding the old ETag
+    response = await client.put(f"/tasks/{task.id}", json={"title": "Second"}, headers={"If-Match": etag})
+    assert response.status_code == 412
+    response = await client.delete(f"/tasks/{task.id}", headers={"If-Match": etag})
+    assert response.status_code == 412
+    response = await client.get(f"/tasks/{task.id}")
+    assert response.json()["data"]["title"] == "First"
+
+    # A failed precondition leaves cached listings valid
+    list_etag = (await client.get("/tasks")).headers["etag"]
+    response = await client.put(f"/tasks/{task.id}", json={"title": "Third"}, headers={"If-Match": f"W/{new_etag}"})
+    assert response.status_code == 412
+    assert (await client.get("/tasks", headers={"If-None-Match": list_etag})).status_code == 304
+
+    response = await client.delete(f"/tasks/{task.id}", headers={"If-Match": new_etag})
+    assert response.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_concurrent_conditional_updates_apply_once(client, db, auth_user):
+    """
+    Tests that of several writers holding the same ETag exactly one wins.
+    """
+    task = Task(title="Contended", description="Task", owner_id=auth_user.id)
+    db.add(task)
+    db.commit()
+    etag = (await client.get(f"/tasks/{task.id}")).headers["etag"]
+
+    responses = await asyncio.gather(*(
+        client.put(f"/tasks/{task.id}", json={"title": f"Writer {n}"}, headers={"If-Match": etag})
+        for n in range(5)
+    ))
+    assert sorted(response.status_code for response in responses) == [200, 412, 412, 412, 412]
+    db.expire_all()
+    assert db.get(Task, task.id).version == 2
+
+
+def test_orm_flush_checks_task_version(db, auth_user):
+    """
+    Tests that ORM updates of a task loaded at an old version fail instead of clobbering.
+    """
+    task = Task(title="Loaded", description="Task", owner_id=auth_user.id)
+    db.add(task)
+    db.commit()
+    assert task.version == 1
+
+    # Another writer bumps the version behind this session's back
+    db.connection().exec_driver_sql("UPDATE tasks SET version = version + 1")
+    task.title = "Stale write"
+    with pytest.raises(StaleDataError):
+        db.flush()
@@ -0,0 +1,35 @@
+import logging
+
+import pytest
+from fastapi import HTTPException
+
+from src.services import hashing
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+@pytest.mark.asyncio
+async def test_hash_and_verify_password_in_pool():
+    """
+    Tests that hashing and verification round-trip through the process pool.
+    """
+    hashed = await hashing.hash_password("password123")
+    assert await hashing.verify_password("password123", hashed)
+    assert not hashing.verify_password_sync("wrong-password", hashed)
+
+
+def test_saturated_pool_rejects_with_429():
+    """
+    Tests that new hashing work is rejected once every pending slot is taken.
+    """
+    acquired = 0
+    while hashing._pending_slots.acquire(blocking=False):
+        acquired += 1
+    try:
+        with pytest.raises(HTTPException) as exc_info:
+            hashing.hash_password_sync("password123")
+        assert exc_info.value.status_code == 429
+    finally:
+        for _ in range(acquired):
+            hashing._pending_slots.release()
@@ -0,0 +1,106 @@
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from src.middleware import HTTPSOnlyMiddleware, parse_trusted_proxies, resolve_environment
+
+
+def make_app(environment="production", trusted_proxies=""):
+    app = FastAPI()
+
+    @app.get("/ping")
+    async def ping():
+        return {"status": "success"}
+
+    app.add_middleware(HTTPSOnlyMiddleware, environment=environment, trusted_proxies=trusted_proxies)
+    return app
+
+
+def make_client(app, scheme="http", peer="127.0.0.1"):
+    transport = ASGITransport(app=app, client=(peer, 12345))
+    return AsyncClient(transport=transport, base_url=f"{scheme}://test")
+
+
+def test_invalid_environment_fails_at_startup():
+    """
+    Tests that an unknown ENVIRONMENT value raises at startup instead of on each request.
+    """
+    with pytest.raises(ValueError):
+        resolve_environment("staging")
+
+
+def test_parse_trusted_proxies():
+    """
+    Tests that TRUSTED_PROXIES accepts '*' or a list of networks and bare addresses.
+    """
+    assert parse_trusted_proxies("*") == (True, ())
+    trust_all, networks = parse_trusted_proxies("10.0.0.0/8, 192.168.1.5")
+    assert not trust_all
+    assert [str(network) for network in networks] == ["10.0.0.0/8", "192.168.1.5/32"]
+
+
+@pytest.mark.asyncio
+async def test_http_allowed_in_development():
+    """
+    Tests that plain HTTP requests are served outside production.
+    """
+    async with make_client(make_app(environment="development")) as client:
+        response = await client.get("/ping")
+    assert response.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_http_rejected_in_production():
+    """
+    Tests that plain HTTP requests get 400 with the error envelope in production.
+    """
+    async with make_client(make_app()) as client:
+        response = await client.get("/ping")
+    assert response.status_code == 400
+    assert response.json() == {
+        "status": "error",
+        "message": "HTTPS is required for secure communication",
+    }
+
+
+@pytest.mark.asyncio
+async def test_https_allowed_in_production():
+    """
+    Tests that HTTPS requests are served in production.
+    """
+    async with make_client(make_app(), scheme="https") as client:
+        response = await client.get("/ping")
+    assert response.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_forwarded_proto_from_trusted_proxy():
+    """
+    Tests that X-Forwarded-Proto from a trusted proxy counts as HTTPS.
+    """
+    app = make_app(trusted_proxies="10.0.0.0/8")
+    async with make_client(app, peer="10.1.2.3") as client:
+        response = await client.get("/ping", headers={"X-Forwarded-Proto": "https"})
+    assert response.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_forwarded_proto_from_untrusted_peer_is_ignored():
+    """
+    Tests that X-Forwarded-Proto from a peer outside TRUSTED_PROXIES is ignored.
+    """
+    app = make_app(trusted_proxies="10.0.0.0/8")
+    async with make_client(app, peer="203.0.113.7") as client:
+        response = await client.get("/ping", headers={"X-Forwarded-Proto": "https"})
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_forwarded_proto_uses_entry_set_by_trusted_proxy():
+    """
+    Tests that only the last X-Forwarded-Proto entry, the one the trusted proxy set, is used.
+    """
+    app = make_app(trusted_proxies="10.0.0.0/8")
+    async with make_client(app, peer="10.1.2.3") as client:
+        response = await client.get("/ping", headers={"X-Forwarded-Proto": "https, http"})
+    assert response.status_code == 400
@@ -0,0 +1,137 @@
+import asyncio
+import logging
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import func, select, update
+
+from src.models import IdempotencyKey, Task, User
+from src.schemas.response import ResponseModel
+from src.services import idempotency
+from src.services.idempotency import (
+    REPLAYED_HEADER,
+    claim_idempotency_key,
+    commit_idempotent,
+    idempotent_request,
+    purge_expired_keys,
+)
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    idempotency.clear_idempotency_cache()
+
+
+def new_user_payload() -> dict:
+    unique_id = uuid.uuid4().hex[:8]
+    return {
+        "username": f"retry_{unique_id}",
+        "email": f"retry_{unique_id}@example.com",
+        "password": "password123",
+    }
+
+
+def count_users(db, username: str) -> int:
+    db.expire_all()
+    return db.execute(select(func.count()).select_from(User).where(User.username == username)).scalar_one()
+
+
+@pytest.mark.asyncio
+async def test_retried_user_creation_is_replayed(client, db, auth_user):
+    """
+    Tests that retries with the same Idempotency-Key replay the first response, from the
+    cache and from the table, without creating the user again.
+    """
+    auth_user.is_admin = True
+    payload = new_user_payload()
+    headers = {"Idempotency-Key": uuid.uuid4().hex}
+
+    first = await client.post("/user", json=payload, headers=headers)
+    assert first.status_code == 201
+    assert REPLAYED_HEADER.lower() not in first.headers
+
+    retry = await client.post("/user", json=payload, headers=headers)
+    assert retry.status_code == 201
+    assert retry.headers[REPLAYED_HEADER.lower()] == "true"
+    assert retry.json() == first.json()
+    # Served from memory, before hashing the password
+    assert 'desc="queries: 0"' in retry.headers["server-timing"]
+
+    # Another worker, or after a restart: replayed from the table
+    idempotency.clear_idempotency_cache()
+    retry = await client.post("/user", json=payload, headers=headers)
+    assert retry.status_code == 201
+    assert retry.json() == first.json()
+    assert count_users(db, payload["username"]) == 1
+
+    # The same key for another request is an error, not a replay
+    response = await client.post("/user", json=new_user_payload(), headers=headers)
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_concurrent_retries_create_one_user(client, db, auth_user):
+    """
+    Tests that concurrent requests with the same key create the user once and all get its response.
+    """
+    auth_user.is_admin = True
+    payload = new_user_payload()
+    headers = {"Idempotency-Key": uuid.uuid4().hex}
+
+    # Stay within the password hashing pool's pending limit (at least 4), which answers 429 beyond it
+    responses = await asyncio.gather(*(client.post("/user", json=payload, headers=headers) for _ in range(3)))
+    assert [response.status_code for response in responses] == [201, 201, 201]
+    assert len({response.json()["data"]["id"] for response in responses}) == 1
+    assert sum(REPLAYED_HEADER.lower() in response.headers for response in responses) == 2
+    assert count_users(db, payload["username"]) == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_requests_are_not_stored(client, db, auth_user):
+    """
+    Tests that a failed request releases its key, so a corrected retry is executed.
+    """
+    auth_user.is_admin = True
+    payload = new_user_payload()
+    headers = {"Idempotency-Key": uuid.uuid4().hex}
+    assert (await client.post("/user", json=payload)).status_code == 201
+
+    response = await client.post("/user", json=payload, headers=headers)
+    assert response.status_code == 400
+    db.expire_all()
+    assert db.execute(select(func.count()).select_from(IdempotencyKey)).scalar_one() == 0
+
+    response = await client.post("/user", json=new_user_payload(), headers=headers)
+    assert response.status_code == 201
+
+    response = await client.post("/user", json=payload, headers={"Idempotency-Key": "k" * 256})
+    assert response.status_code == 400
+
+
+def test_claimed_keys_replay_and_expire(db, auth_user):
+    """
+    Tests claiming a key with a task write, replaying it, and its expiry and purge.
+    """
+    request = idempotent_request("task-key", auth_user.id, "POST /tasks", {"title": "Once"})
+    assert claim_idempotency_key(db, request) is None
+    db.add(Task(title="Once", description="", owner_id=auth_user.id))
+    commit_idempotent(db, request, 201, ResponseModel(status="success", message="Created", data={"title": "Once"}))
+
+    idempotency.clear_idempotency_cache()
+    replay = claim_idempotency_key(db, request)
+    assert replay.status_code == 201
+    assert replay.headers[REPLAYED_HEADER] == "true"
+
+    # Expired keys are free again until the purge deletes them
+    expired = datetime.now(timezone.utc) - timedelta(seconds=idempotency.IDEMPOTENCY_KEY_TTL_SECONDS + 60)
+    db.execute(update(IdempotencyKey).values(created_at=expired))
+    db.commit()
+    idempotency.clear_idempotency_cache()
+    assert claim_idempotency_key(db, request) is None
+    db.rollback()
+    assert purge_expired_keys(db) == 1
+    assert db.execute(select(func.count()).select_from(Task)).scalar_one() == 1
@@ -0,0 +1,73 @@
+import logging
+
+import pytest
+
+from src.models import Task, TaskTombstone, User
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def query_count(response) -> int:
+    db_timing = response.headers["server-timing"].split(", ")[0]
+    return int(db_timing.rsplit("queries: ", 1)[1].rstrip('"'))
+
+
+@pytest.mark.asyncio
+async def test_single_task_routes_use_one_statement(client, db, auth_user):
+    """
+    Tests that reads, updates and deletes of an owned task filter by owner in the same
+    statement, with no separate ownership lookup or refresh.
+    """
+    task = Task(title="Owned", description="Task", owner_id=auth_user.id)
+    db.add(task)
+    db.commit()
+    task_id = task.id
+
+    response = await client.get(f"/tasks/{task_id}")
+    assert response.status_code == 200
+    assert query_count(response) == 1
+
+    # The collection version bump, then UPDATE ... RETURNING
+    response = await client.put(f"/tasks/{task_id}", json={"title": "Renamed", "status": "completed"})
+    assert response.status_code == 200
+    assert response.json()["data"] == {
+        "id": task_id, "title": "Renamed", "status": "completed", "description": "Task"
+    }
+    assert query_count(response) == 2
+    db.expire_all()
+    assert (db.get(Task, task_id).version, db.get(Task, task_id).revision) == (2, 1)
+
+    # The version bump, DELETE ... RETURNING and the tombstone
+    response = await client.delete(f"/tasks/{task_id}")
+    assert response.status_code == 200
+    assert query_count(response) == 3
+    db.expire_all()
+    assert db.query(Task).filter_by(id=task_id).count() == 0
+    assert db.query(TaskTombstone).filter_by(task_id=task_id).count() == 1
+
+
+@pytest.mark.asyncio
+async def test_missing_and_foreign_tasks_keep_404_and_403(client, db, auth_user):
+    """
+    Tests that unmatched statements still tell a missing task from another user's,
+    and leave nothing changed.
+    """
+    other = User(username="other_owner", email="other_owner@example.com", hashed_password="unused")
+    db.add(other)
+    db.commit()
+    foreign = Task(title="Foreign", description="Task", owner_id=other.id)
+    db.add(foreign)
+    db.commit()
+
+    for method, kwargs in (("GET", {}), ("PUT", {"json": {"title": "Mine"}}), ("PUT", {"json": {}}), ("DELETE", {})):
+        response = await client.request(method, f"/tasks/{foreign.id}", **kwargs)
+        assert response.status_code == 403, (method, kwargs)
+        response = await client.request(method, "/tasks/9999", **kwargs)
+        assert response.status_code == 404, (method, kwargs)
+        assert response.json()["message"] == "Task with ID 9999 not found"
+
+    db.expire_all()
+    assert db.get(Task, foreign.id).title == "Foreign"
+    assert db.get(User, auth_user.id).tasks_version == 0
+    assert db.query(TaskTombstone).count() == 0
@@ -0,0 +1,87 @@
+import logging
+
+import pytest
+
+from src.services.metrics import Histogram
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def test_histogram_buckets_are_cumulative():
+    """
+    Tests that observations land in the first bucket whose bound is not exceeded.
+    """
+    histogram = Histogram(buckets=(0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 2.0):
+        histogram.observe(value)
+
+    snapshot = histogram.snapshot()
+    assert snapshot["buckets"] == {"0.1": 2, "1.0": 3, "+Inf": 4}
+    assert snapshot["count"] == 4
+    assert snapshot["sum"] == pytest.approx(2.65)
+
+
+@pytest.mark.asyncio
+async def test_pool_metrics_endpoint(client, auth_user):
+    """
+    Tests that pool statistics include checkout wait times recorded by requests, for admins only.
+    """
+    await client.get("/tasks", params={"limit": 1})
+    assert (await client.get("/metrics/pool")).status_code == 403
+
+    auth_user.is_admin = True
+
+    response = await client.get("/metrics/pool")
+    assert response.status_code == 200
+    stats = response.json()["data"]
+    assert stats["checked_out"] >= 0
+    assert {"size", "overflow", "timeouts"} <= set(stats)
+    assert stats["wait_seconds"]["count"] > 0
+
+
+@pytest.mark.asyncio
+async def test_session_closes_run_concurrently():
+    """
+    Tests that closing request sessions does not queue behind one thread.
+    """
+    import asyncio
+    import time
+
+    from src.services.dependencies import get_db
+
+    async def open_and_close():
+        sessions = get_db()
+        db = await sessions.__anext__()
+        # A close that blocks, as returning a connection to a busy pool can
+        db.close = lambda: time.sleep(0.2)
+        await sessions.aclose()
+
+    started = time.perf_counter()
+    await asyncio.gather(*(open_and_close() for _ in range(5)))
+    assert time.perf_counter() - started < 0.6
+
+
+def test_checkout_timeouts_are_counted(tmp_path):
+    """
+    Tests that checkouts are timed through the pool's public connect(), including those
+    that give up after the pool timeout.
+    """
+    from sqlalchemy import create_engine
+    from sqlalchemy.exc import TimeoutError
+
+    from src.services import database
+
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}", poolclass=database.TimedQueuePool,
+        pool_size=1, max_overflow=0, pool_timeout=0.05,
+    )
+    checkouts = database.POOL_WAIT_SECONDS.snapshot()["count"]
+    timeouts = database.pool_stats()["timeouts"]
+    with engine.connect():
+        with pytest.raises(TimeoutError):
+            engine.connect()
+    engine.dispose()
+
+    assert database.POOL_WAIT_SECONDS.snapshot()["count"] == checkouts + 2
+    assert database.pool_stats()["timeouts"] == timeouts + 1
@@ -0,0 +1,94 @@
+import logging
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from src.enums.task_status import TaskStatus
+from src.models import Task
+from src.routers.task import build_task_query
+from src.services.task_filters import parse_task_listing
+from src.services.task_sync import CHANGE_COLUMNS
+from src.services.pagination import DEFAULT_PAGE_SIZE
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def explain(db: Session, query) -> str:
+    """
+    Return the query plan for a listing query as a single string.
+    """
+    dialect = db.get_bind().dialect
+    sql = str(query.statement.compile(dialect=dialect, compile_kwargs={"literal_binds": True}))
+
+    if dialect.name == "sqlite":
+        rows = db.execute(text(f"EXPLAIN QUERY PLAN {sql}")).fetchall()
+        return "\n".join(row[-1] for row in rows)
+
+    if dialect.name == "postgresql":
+        # The planner picks a sequential scan on tiny tables; we only assert an index is usable
+        db.execute(text("SET LOCAL enable_seqscan = off"))
+        rows = db.execute(text(f"EXPLAIN {sql}")).fetchall()
+        return "\n".join(row[0] for row in rows)
+
+    pytest.skip(f"No query plan assertions for dialect '{dialect.name}'")
+
+
+def assert_index_scan(plan: str, index_name: str):
+    logger.info("Query plan:\n%s", plan)
+    assert index_name in plan, f"Expected plan to use {index_name}, got:\n{plan}"
+    # Full table scans (SQLite "SCAN tasks", Postgres "Seq Scan") and sorts defeat the index
+    assert "SCAN tasks" not in plan
+    assert "Seq Scan" not in plan
+    assert "TEMP B-TREE" not in plan
+
+
+@pytest.mark.parametrize("paginated", [False, True])
+def test_get_tasks_uses_owner_index(db, paginated):
+    """
+    Tests that listing a user's tasks searches the (owner_id, id) index.
+    """
+    query = build_task_query(db, owner_id=1)
+    if paginated:
+        query = query.order_by(Task.id).limit(DEFAULT_PAGE_SIZE + 1)
+    assert_index_scan(explain(db, query), "ix_tasks_owner_id_id")
+
+
+@pytest.mark.parametrize("paginated", [False, True])
+def test_get_tasks_by_status_uses_owner_status_index(db, paginated):
+    """
+    Tests that listing a user's tasks by status searches the (owner_id, status, id) index.
+    """
+    query = build_task_query(db, owner_id=1, task_status=TaskStatus.IN_PROGRESS.value)
+    if paginated:
+        query = query.order_by(Task.id).limit(DEFAULT_PAGE_SIZE + 1)
+    assert_index_scan(explain(db, query), "ix_tasks_owner_id_status_id")
+
+
+@pytest.mark.parametrize("params, index_name", [
+    ({"status_filter": "in:pending,in-progress", "sort": "-id"}, "ix_tasks_owner_id_id"),
+    ({"status_filter": "completed"}, "ix_tasks_owner_id_status_id"),
+    ({"title_filter": "prefix:Buy", "sort": "title"}, "ix_tasks_owner_id_title_id"),
+    ({"title_filter": "prefix:Buy", "status_filter": "pending", "sort": "-title"}, "ix_tasks_owner_id_title_id"),
+    ({"title_filter": "Buy milk", "sort": "-id"}, "ix_tasks_owner_id_title_id"),
+    ({"sort": "title"}, "ix_tasks_owner_id_title_id"),
+])
+def test_filtered_listings_use_indexes_in_order(db, params, index_name):
+    """
+    Tests that the allowed filter and sort combinations are served in index order, without a sort step.
+    """
+    listing = parse_task_listing(**params)
+    query = build_task_query(db, owner_id=1, listing=listing).limit(DEFAULT_PAGE_SIZE + 1)
+    assert_index_scan(explain(db, query), index_name)
+
+
+def test_task_changes_use_owner_revision_index(db):
+    """
+    Tests that delta sync range-scans the (owner_id, revision) index instead of all tasks.
+    """
+    query = db.query(*CHANGE_COLUMNS).filter(
+        Task.owner_id == 1, Task.revision > 10, Task.revision <= 20
+    ).order_by(Task.revision, Task.id)
+    assert_index_scan(explain(db, query), "ix_tasks_owner_id_revision")
+
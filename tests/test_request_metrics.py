@@ -0,0 +1,79 @@
+import logging
+
+import pytest
+
+from src.models import Task
+from src.services.metrics import CounterFamily, HistogramFamily
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def test_prometheus_rendering():
+    """
+    Tests the text format of labelled counters and cumulative histogram buckets.
+    """
+    counter = CounterFamily("requests_total", "Requests.", ("route",))
+    counter.inc('/a"b')
+    assert counter.render()[-1] == 'requests_total{route="/a\\"b"} 1'
+
+    histogram = HistogramFamily("latency_seconds", "Latency.", ("route",), buckets=(0.1, 1.0))
+    histogram.labels("/a").observe(0.5)
+    assert histogram.render()[2:] == [
+        'latency_seconds_bucket{route="/a",le="0.1"} 0',
+        'latency_seconds_bucket{route="/a",le="1.0"} 1',
+        'latency_seconds_bucket{route="/a",le="+Inf"} 1',
+        'latency_seconds_sum{route="/a"} 0.5',
+        'latency_seconds_count{route="/a"} 1',
+    ]
+
+
+@pytest.mark.asyncio
+async def test_server_timing_counts_queries(client, db, auth_user):
+    """
+    Tests that responses report the request's SQL statements and DB time.
+    """
+    db.add(Task(title="Timed", description="Task", owner_id=auth_user.id))
+    db.commit()
+
+    response = await client.get("/tasks")
+    assert response.status_code == 200
+    db_timing, total_timing = response.headers["server-timing"].split(", ")
+    assert db_timing.startswith("db;dur=")
+    # The collection version lookup for the ETag, then the task rows
+    assert db_timing.endswith('desc="queries: 2"')
+    assert total_timing.startswith("total;dur=")
+
+
+@pytest.mark.asyncio
+async def test_metrics_endpoint_labels_route_templates(client, db, auth_user):
+    """
+    Tests that /metrics reports requests by route template, not by concrete path.
+    """
+    task = Task(title="Labelled", description="Task", owner_id=auth_user.id)
+    db.add(task)
+    db.commit()
+    await client.get(f"/tasks/{task.id}")
+    await client.get("/no-such-route")
+
+    response = await client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    body = response.text
+    assert 'http_requests_total{method="GET",route="/tasks/{task_id}",status="200"}' in body
+    assert 'http_requests_total{method="GET",route="unmatched",status="404"}' in body
+    assert f"/tasks/{task.id}\"" not in body
+    assert 'http_request_db_queries_count{method="GET",route="/tasks/{task_id}"}' in body
+    assert "db_pool_wait_seconds_count" in body
+
+
+@pytest.mark.asyncio
+async def test_metrics_label_unknown_methods_as_other(client, auth_user):
+    """
+    Tests that requests with a non-standard method are counted under the OTHER label.
+    """
+    await client.request("PURGE-A1B2", "/no-such-route")
+
+    body = (await client.get("/metrics")).text
+    assert 'http_requests_total{method="OTHER",route="unmatched",status="404"}' in body
+    assert "PURGE-A1B2" not in body
@@ -0,0 +1,37 @@
+import logging
+
+import pytest
+from fastapi.responses import ORJSONResponse
+
+from src.enums.task_status import TaskStatus
+from src.main import app
+from src.models import Task
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def test_task_routes_document_typed_payloads():
+    """
+    Tests that responses default to orjson and are described by their payload schemas.
+    """
+    assert app.router.default_response_class is ORJSONResponse
+    schemas = app.openapi()["components"]["schemas"]
+    assert {"TaskData", "TaskPage", "UserData"} <= set(schemas)
+    assert schemas["TaskData"]["required"] == ["id", "title", "status", "description"]
+
+
+@pytest.mark.asyncio
+async def test_task_list_payload(client, db, auth_user):
+    """
+    Tests that the task list renders status values and exactly the TaskData fields.
+    """
+    db.add(Task(title="Typed", description="Payload", status=TaskStatus.IN_PROGRESS, owner_id=auth_user.id))
+    db.commit()
+
+    response = await client.get("/tasks")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    task = response.json()["data"][0]
+    assert task["status"] == TaskStatus.IN_PROGRESS.value
+    assert set(task) == {"id", "title", "status", "description"}
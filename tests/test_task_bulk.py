@@ -0,0 +1,66 @@
+import logging
+
+import pytest
+
+from src.enums.task_status import TaskStatus
+from src.models import Task
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_tasks(client, db, auth_user):
+    """
+    Tests that bulk creation inserts every item for the authenticated user, in order.
+    """
+    payload = {
+        "items": [
+            {"title": "Bulk 1", "description": "First"},
+            {"title": "Bulk 2", "status": TaskStatus.COMPLETED.value},
+        ]
+    }
+    response = await client.post("/tasks/bulk", json=payload)
+    assert response.status_code == 201
+    results = response.json()["data"]
+    assert [result["title"] for result in results] == ["Bulk 1", "Bulk 2"]
+    assert [result["status"] for result in results] == [TaskStatus.PENDING.value, TaskStatus.COMPLETED.value]
+    assert db.query(Task).filter_by(owner_id=auth_user.id).count() == 2
+
+
+@pytest.mark.asyncio
+async def test_bulk_update_and_delete_tasks(client, db, auth_user):
+    """
+    Tests per-item results of bulk update and delete, including unknown IDs.
+    """
+    response = await client.post("/tasks/bulk", json={"items": [{"title": "A"}, {"title": "B"}]})
+    first_id, second_id = [result["id"] for result in response.json()["data"]]
+
+    payload = {
+        "items": [
+            {"id": first_id, "title": "A updated"},
+            {"id": second_id, "status": TaskStatus.IN_PROGRESS.value},
+            {"id": 9999, "title": "Missing"},
+        ]
+    }
+    response = await client.patch("/tasks/bulk", json=payload)
+    assert response.status_code == 200
+    results = response.json()["data"]
+    assert [result["result"] for result in results] == ["updated", "updated", "not_found"]
+    assert results[0]["title"] == "A updated"
+    assert results[1]["title"] == "B"
+    assert results[1]["status"] == TaskStatus.IN_PROGRESS.value
+
+    response = await client.request("DELETE", "/tasks/bulk", json={"ids": [first_id, 9999]})
+    assert response.status_code == 200
+    assert [result["result"] for result in response.json()["data"]] == ["deleted", "not_found"]
+    assert db.query(Task).filter_by(owner_id=auth_user.id).count() == 1
+
+
+@pytest.mark.asyncio
+async def test_bulk_rejects_duplicate_ids(client, auth_user):
+    """
+    Tests that a bulk request referencing the same task twice is rejected.
+    """
+    response = await client.request("DELETE", "/tasks/bulk", json={"ids": [1, 1]})
+    assert response.status_code == 400
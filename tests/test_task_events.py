@@ -0,0 +1,177 @@
+import asyncio
+import logging
+import threading
+
+import anyio
+import pytest
+
+from src.main import app
+from src.models import Task
+from src.services.task_events import RESYNC, TaskEventBus, stream_task_events, task_event_bus
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def parse_event(chunk: bytes) -> dict:
+    fields = {}
+    for line in chunk.decode().strip().splitlines():
+        name, _, value = line.partition(": ")
+        fields[name] = value
+    return fields
+
+
+class StreamConnection:
+    """
+    Drives ``GET /tasks/stream`` through the ASGI app: the test client would wait for
+    the endless body to finish.
+    """
+
+    def __init__(self, last_event_id: str = None):
+        self.chunks: "asyncio.Queue[bytes]" = asyncio.Queue()
+        self.status_code = None
+        self._request_sent = False
+        self._disconnected = asyncio.Event()
+        headers = [(b"host", b"test")]
+        if last_event_id is not None:
+            headers.append((b"last-event-id", last_event_id.encode()))
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "path": "/tasks/stream",
+            "raw_path": b"/tasks/stream",
+            "query_string": b"",
+            "root_path": "",
+            "headers": headers,
+            "client": ("127.0.0.1", 12345),
+            "server": ("test", 80),
+        }
+        self.task = asyncio.create_task(app(scope, self._receive, self._send))
+
+    async def _receive(self):
+        if not self._request_sent:
+            self._request_sent = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await self._disconnected.wait()
+        return {"type": "http.disconnect"}
+
+    async def _send(self, message):
+        if message["type"] == "http.response.start":
+            self.status_code = message["status"]
+        elif message["type"] == "http.response.body" and message.get("body"):
+            self.chunks.put_nowait(message["body"])
+
+    async def next_event(self) -> dict:
+        return parse_event(await asyncio.wait_for(self.chunks.get(), 5))
+
+    async def close(self):
+        self._disconnected.set()
+        await asyncio.wait_for(self.task, 5)
+
+
+@pytest.mark.asyncio
+async def test_stream_pushes_task_changes_and_resumes(client, db, auth_user):
+    """
+    Tests that create, update and delete events reach an open stream, and that a
+    reconnect with Last-Event-ID replays what it missed.
+    """
+    task = Task(title="Watched", description="Task", owner_id=auth_user.id)
+    db.add(task)
+    db.commit()
+
+    stream = StreamConnection()
+    opening = await stream.next_event()
+    assert stream.status_code == 200
+    assert opening["retry"] == "3000"
+
+    assert (await client.put(f"/tasks/{task.id}", json={"title": "Renamed"})).status_code == 200
+    event = await stream.next_event()
+    assert event["event"] == "updated"
+    assert '"title":"Renamed"' in event["data"]
+    await stream.close()
+    assert task_event_bus.subscriber_count() == 0
+
+    # Missed while disconnected
+    response = await client.post("/tasks/bulk", json={"items": [{"title": "New"}]})
+    new_id = response.json()["data"][0]["id"]
+    assert (await client.delete(f"/tasks/{task.id}")).status_code == 200
+
+    stream = StreamConnection(last_event_id=event["id"])
+    await stream.next_event()
+    created, deleted = await stream.next_event(), await stream.next_event()
+    assert (created["event"], created["data"]) == ("created", f'{{"id":{new_id},"title":"New","status":"pending","description":""}}')
+    assert (deleted["event"], deleted["data"]) == ("deleted", f'{{"id":{task.id}}}')
+    await stream.close()
+
+    # An ID from another worker or process cannot be resumed from
+    stream = StreamConnection(last_event_id="0000-1")
+    await stream.next_event()
+    assert (await stream.next_event())["event"] == RESYNC
+    await stream.close()
+
+
+@pytest.mark.asyncio
+async def test_idle_streams_need_no_threads(auth_user):
+    """
+    Tests that many idle connections are served without a thread each, and all receive events.
+    """
+    connections = 1000
+    threads = threading.active_count()
+    streams = [StreamConnection() for _ in range(connections)]
+    for stream in streams:
+        await stream.next_event()
+    assert task_event_bus.subscriber_count() == connections
+    # Sync dependencies may start the shared worker threads, but nothing scales per connection
+    worker_threads = anyio.to_thread.current_default_thread_limiter().total_tokens
+    assert threading.active_count() <= threads + worker_threads
+
+    task_event_bus.publish(auth_user.id, "deleted", {"id": 1})
+    for stream in streams:
+        assert (await stream.next_event())["event"] == "deleted"
+
+    await asyncio.gather(*(stream.close() for stream in streams))
+    assert task_event_bus.subscriber_count() == 0
+
+
+@pytest.mark.asyncio
+async def test_resume_needs_buffered_events():
+    """
+    Tests that a resume point older than the ring buffer, or an overflowing connection,
+    gets a resync event instead of silently missing events.
+    """
+    bus = TaskEventBus(buffer_size=2, queue_size=2)
+    subscription, backlog, position = bus.subscribe(1)
+    assert backlog == [] and position == bus.event_id(0)
+    bus.unsubscribe(subscription)
+
+    for n in range(3):
+        bus.publish(1, "deleted", {"id": n})
+    _, backlog, _ = bus.subscribe(1, bus.event_id(2))
+    assert [event.data for event in backlog] == [{"id": 2}]
+    _, backlog, _ = bus.subscribe(1, bus.event_id(0))
+    assert [event.type for event in backlog] == [RESYNC]
+
+    # Users without events since the resume point need no replay
+    _, backlog, _ = bus.subscribe(2, bus.event_id(3))
+    assert backlog == []
+
+    subscription, _, _ = bus.subscribe(3)
+    for n in range(3):
+        bus.publish(3, "deleted", {"id": n})
+    await asyncio.sleep(0)
+    assert subscription.queue.qsize() == 1
+    assert subscription.queue.get_nowait().type == RESYNC
+
+
+@pytest.mark.asyncio
+async def test_heartbeats_keep_idle_streams_alive():
+    """
+    Tests that an idle stream sends a comment line at the heartbeat interval.
+    """
+    events = stream_task_events(1, bus=TaskEventBus(), heartbeat_seconds=0.01)
+    assert (await events.__anext__()).startswith(b"retry: 3000\nid: ")
+    assert await events.__anext__() == b": heartbeat\n\n"
+    await events.aclose()
@@ -0,0 +1,206 @@
+import asyncio
+import logging
+
+import pytest
+
+from src.enums.task_status import TaskStatus
+from src.models import Task
+from src.services import task_import
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+async def in_chunks(body: bytes, size: int = 7):
+    """
+    Send the body in small chunks that split lines and multi-byte characters.
+    """
+    for start in range(0, len(body), size):
+        yield body[start:start + size]
+
+
+@pytest.mark.asyncio
+async def test_import_ndjson_reports_invalid_rows(client, db, auth_user, monkeypatch):
+    """
+    Tests that valid rows are imported across batches and invalid rows reported by line.
+    """
+    monkeypatch.setattr(task_import, "IMPORT_BATCH_SIZE", 2)
+    body = "\n".join([
+        '{"title": "Café", "status": "in-progress"}',
+        '{"title": "Second", "description": "Described"}',
+        "not json",
+        '{"title": "Bad status", "status": "done"}',
+        "",
+        '{"title": "Last"}',
+    ]).encode()
+
+    response = await client.post("/tasks/import", params={"format": "ndjson"}, content=in_chunks(body))
+    assert response.status_code == 201
+    report = response.json()["data"]
+    assert report["imported"] == 3
+    assert report["failed"] == 2
+    assert [error["line"] for error in report["errors"]] == [3, 4]
+    assert report["errors_truncated"] is False
+
+    tasks = db.query(Task).filter_by(owner_id=auth_user.id).order_by(Task.id).all()
+    assert [task.title for task in tasks] == ["Café", "Second", "Last"]
+    assert [task.status for task in tasks] == [TaskStatus.IN_PROGRESS, TaskStatus.PENDING, TaskStatus.PENDING]
+    assert tasks[0].description == ""
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("lines_per_parse", [1, 100])
+async def test_import_csv(client, db, auth_user, monkeypatch, lines_per_parse):
+    """
+    Tests CSV with a byte order mark, CRLF line breaks, quoted line breaks and empty cells,
+    including records that span two parses.
+    """
+    monkeypatch.setattr(task_import, "CSV_LINES_PER_PARSE", lines_per_parse)
+    body = (
+        "\ufeffTitle,Description,Status\r\n"
+        '"Multi, line","First\r\nSecond",completed\r\n'
+        "Plain,,\r\n"
+        "Short row\r\n"
+    ).encode()
+
+    response = await client.post("/tasks/import", params={"format": "csv"}, content=in_chunks(body, 5))
+    assert response.status_code == 201
+    report = response.json()["data"]
+    assert report["imported"] == 2
+    assert report["errors"] == [{"line": 5, "detail": "Expected 3 columns, got 1."}]
+
+    tasks = db.query(Task).filter_by(owner_id=auth_user.id).order_by(Task.id).all()
+    assert tasks[0].title == "Multi, line"
+    # Line breaks inside quoted fields are kept as sent
+    assert tasks[0].description == "First\r\nSecond"
+    assert tasks[0].status == TaskStatus.COMPLETED
+    assert (tasks[1].description, tasks[1].status) == ("", TaskStatus.PENDING)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("lines_per_parse", [1, 100])
+async def test_import_csv_recovers_from_bad_quotes(client, db, auth_user, monkeypatch, lines_per_parse):
+    """
+    Tests that stray quotes, unclosed quotes and oversized records fail only their own row.
+    """
+    monkeypatch.setattr(task_import, "IMPORT_MAX_RECORD_SIZE", 40)
+    monkeypatch.setattr(task_import, "CSV_LINES_PER_PARSE", lines_per_parse)
+    body = (
+        "title,description\n"
+        '5" screen,TV\n'
+        '"Unclosed,never closed\n'
+        "After unclosed,ok\n"
+        '"Quoted ""twice""",ok\n'
+        '"Bad"tail,x\n'
+        "Last,ok\n"
+        '"Runaway,too\n'
+    ).encode()
+
+    response = await client.post("/tasks/import", params={"format": "csv"}, content=in_chunks(body))
+    assert response.status_code == 201
+    report = response.json()["data"]
+    assert report["imported"] == 4
+    assert [(error["line"], error["detail"].split(":")[0]) for error in report["errors"]] == [
+        (3, "Record is longer than 40 characters."),
+        (6, "Malformed CSV"),
+        (8, "Unterminated quoted field."),
+    ]
+
+    tasks = db.query(Task).filter_by(owner_id=auth_user.id).order_by(Task.id).all()
+    assert [task.title for task in tasks] == ['5" screen', "After unclosed", 'Quoted "twice"', "Last"]
+
+
+@pytest.mark.asyncio
+async def test_import_csv_requires_title_column(client, db, auth_user):
+    """
+    Tests that a CSV header without a title column rejects the whole upload.
+    """
+    response = await client.post("/tasks/import", params={"format": "csv"}, content=b"name\nTask\n")
+    assert response.status_code == 400
+    assert db.query(Task).filter_by(owner_id=auth_user.id).count() == 0
+
+
+@pytest.mark.asyncio
+async def test_import_truncates_error_report(client, auth_user, monkeypatch):
+    """
+    Tests that only the first IMPORT_MAX_ERRORS errors are listed.
+    """
+    monkeypatch.setattr(task_import, "IMPORT_MAX_ERRORS", 2)
+    response = await client.post("/tasks/import", content=b"[]\n[]\n[]\n")
+    report = response.json()["data"]
+    assert report["failed"] == 3
+    assert len(report["errors"]) == 2
+    assert report["errors_truncated"] is True
+
+
+@pytest.mark.asyncio
+async def test_writes_proceed_while_an_import_streams(client, db, auth_user, monkeypatch):
+    """
+    Tests that a stalled upload holds no lock: other writes of the same user succeed
+    while the import waits for the rest of its body.
+    """
+    monkeypatch.setattr(task_import, "IMPORT_BATCH_SIZE", 2)
+    stalled = asyncio.Event()
+    resume = asyncio.Event()
+
+    async def stalling_upload():
+        yield b'{"title": "Imported 1"}\n{"title": "Imported 2"}\n{"title": "Imported 3"}\n'
+        stalled.set()
+        await resume.wait()
+        yield b'{"title": "Imported 4"}\n'
+
+    upload = asyncio.create_task(client.post("/tasks/import", content=stalling_upload()))
+    await stalled.wait()
+    # Let the first batch get written and committed
+    await asyncio.sleep(0.2)
+
+    response = await asyncio.wait_for(client.post("/tasks/bulk", json={"items": [{"title": "Meanwhile"}]}), 5)
+    assert response.status_code == 201
+
+    resume.set()
+    response = await upload
+    assert response.json()["data"]["imported"] == 4
+    db.expire_all()
+    assert db.query(Task).filter_by(owner_id=auth_user.id).count() == 5
+
+
+@pytest.mark.asyncio
+async def test_import_ndjson_drops_oversized_lines(client, db, auth_user, monkeypatch):
+    """
+    Tests that a line over IMPORT_MAX_RECORD_SIZE fails alone, whether it ends in the
+    middle of the upload or runs to its end, and the lines after it are imported.
+    """
+    monkeypatch.setattr(task_import, "IMPORT_MAX_RECORD_SIZE", 40)
+    body = (
+        b'{"title": "Before"}\n'
+        + b'{"title": "' + b"x" * 500 + b'"}\n'
+        + b'{"title": "After"}\n'
+        + b'{"title": "' + b"y" * 500
+    )
+
+    response = await client.post("/tasks/import", content=in_chunks(body, 16))
+    assert response.status_code == 201
+    report = response.json()["data"]
+    assert report["imported"] == 2
+    assert report["errors"] == [
+        {"line": 2, "detail": "Line is longer than 40 characters."},
+        {"line": 4, "detail": "Line is longer than 40 characters."},
+    ]
+    tasks = db.query(Task).filter_by(owner_id=auth_user.id).order_by(Task.id).all()
+    assert [task.title for task in tasks] == ["Before", "After"]
+
+
+@pytest.mark.asyncio
+async def test_iter_lines_keeps_memory_bounded(monkeypatch):
+    """
+    Tests that a newline-free upload is dropped as it arrives instead of being buffered.
+    """
+    monkeypatch.setattr(task_import, "IMPORT_MAX_RECORD_SIZE", 100)
+
+    async def endless_line():
+        for _ in range(10_000):
+            yield b"z" * 1000
+        yield b"\nlast"
+
+    lines = [line async for line in task_import.iter_lines(endless_line(), keepends=True)]
+    assert lines == [(1, None), (2, "last")]
@@ -0,0 +1,81 @@
+import logging
+
+import pytest
+from sqlalchemy import insert
+
+from src.enums.task_status import TaskStatus
+from src.models import Task
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def insert_tasks(db, owner_id, count, status=TaskStatus.PENDING):
+    """
+    Bulk insert tasks for a user directly through the test session.
+    """
+    db.execute(
+        insert(Task),
+        [
+            {"title": f"Task {i}", "description": f"Description {i}", "owner_id": owner_id, "status": status}
+            for i in range(count)
+        ],
+    )
+    db.commit()
+
+
+@pytest.mark.asyncio
+async def test_cursor_pagination_walks_all_tasks(client, db, auth_user):
+    """
+    Tests that following next_cursor returns every task exactly once, in ID order.
+    """
+    insert_tasks(db, auth_user.id, 25)
+
+    seen_ids = []
+    cursor = None
+    while True:
+        params = {"limit": 10}
+        if cursor:
+            params["cursor"] = cursor
+        response = await client.get("/tasks", params=params)
+        assert response.status_code == 200
+        page = response.json()["data"]
+        assert len(page["items"]) <= 10
+        seen_ids.extend(item["id"] for item in page["items"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    assert len(seen_ids) == 25
+    assert seen_ids == sorted(seen_ids)
+    logger.info("Cursor pagination walked %s tasks.", len(seen_ids))
+
+
+@pytest.mark.asyncio
+async def test_cursor_pagination_by_status(client, db, auth_user):
+    """
+    Tests cursor pagination on the status listing only returns matching tasks.
+    """
+    insert_tasks(db, auth_user.id, 3, status=TaskStatus.PENDING)
+    insert_tasks(db, auth_user.id, 4, status=TaskStatus.COMPLETED)
+
+    response = await client.get("/tasks/status/completed", params={"limit": 3})
+    assert response.status_code == 200
+    page = response.json()["data"]
+    assert len(page["items"]) == 3
+    assert all(item["status"] == TaskStatus.COMPLETED.value for item in page["items"])
+
+    response = await client.get("/tasks/status/completed", params={"cursor": page["next_cursor"]})
+    assert response.status_code == 200
+    page = response.json()["data"]
+    assert len(page["items"]) == 1
+    assert page["next_cursor"] is None
+
+
+@pytest.mark.asyncio
+async def test_cursor_pagination_rejects_invalid_cursor(client, auth_user):
+    """
+    Tests that a malformed cursor is rejected with 400.
+    """
+    response = await client.get("/tasks", params={"cursor": "not-a-cursor"})
+    assert response.status_code == 400
@@ -0,0 +1,152 @@
+import logging
+
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import text
+
+from src.models import Task
+from src.services import task_search
+from src.services.database import Base
+from src.services.task_search import search_tasks
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+@pytest.mark.asyncio
+async def test_search_ranks_and_stems(client, db, auth_user):
+    """
+    Tests that search matches word forms, ranks title matches first and only returns own tasks.
+    """
+    db.add_all([
+        Task(title="Weekly report", description="Summarize running projects", owner_id=auth_user.id),
+        Task(title="Run the reports", description="Monthly numbers", owner_id=auth_user.id),
+        Task(title="Groceries", description="Milk", owner_id=auth_user.id),
+        Task(title="Run reports", description="Not mine", owner_id=auth_user.id + 1),
+    ])
+    db.commit()
+
+    response = await client.get("/tasks/search", params={"q": "running report"})
+    assert response.status_code == 200
+    titles = [task["title"] for task in response.json()["data"]["items"]]
+    assert titles == ["Run the reports", "Weekly report"]
+
+    # FTS syntax in user input is treated as plain words
+    response = await client.get("/tasks/search", params={"q": 'milk"*('})
+    assert [task["title"] for task in response.json()["data"]["items"]] == ["Groceries"]
+
+
+
+@pytest.mark.asyncio
+async def test_search_requires_every_word_without_operators(client, db, auth_user):
+    """
+    Tests that a search matches tasks containing every word, and that a leading minus or
+    quotes do not exclude words or require a phrase on any database.
+    """
+    db.add_all([
+        Task(title="Buy milk and eggs", description="", owner_id=auth_user.id),
+        Task(title="Buy milk", description="", owner_id=auth_user.id),
+        Task(title="Buy eggs", description="", owner_id=auth_user.id),
+        Task(title="Eggs, then milk", description="", owner_id=auth_user.id),
+    ])
+    db.commit()
+
+    for q in ("milk eggs", "milk -eggs", '"eggs milk"'):
+        response = await client.get("/tasks/search", params={"q": q})
+        titles = sorted(task["title"] for task in response.json()["data"]["items"])
+        assert titles == ["Buy milk and eggs", "Eggs, then milk"]
+
+@pytest.mark.asyncio
+async def test_search_index_follows_writes(client, db, auth_user):
+    """
+    Tests that updates and deletes are reflected in search results.
+    """
+    response = await client.post("/tasks/bulk", json={"items": [{"title": "Paint fence"}, {"title": "Paint door"}]})
+    fence, door = (result["id"] for result in response.json()["data"])
+
+    await client.put(f"/tasks/{fence}", json={"title": "Repair fence"})
+    await client.delete(f"/tasks/{door}")
+
+    response = await client.get("/tasks/search", params={"q": "paint"})
+    assert response.json()["data"]["items"] == []
+    response = await client.get("/tasks/search", params={"q": "repair"})
+    assert [task["id"] for task in response.json()["data"]["items"]] == [fence]
+
+
+@pytest.mark.asyncio
+async def test_search_cursor_pagination(client, db, auth_user):
+    """
+    Tests that paging returns each match once while other users' writes shift bm25
+    scores between pages, that results stop at SEARCH_MAX_RESULTS, and that cursors are
+    bound to their query.
+    """
+    db.add_all([Task(title=f"Call {'back ' * n}{n}", description="phone", owner_id=auth_user.id) for n in range(5)])
+    db.commit()
+    expected = [task.id for task in search_tasks(db, auth_user.id, "call", None, None)[0]]
+
+    seen = []
+    cursor = None
+    while True:
+        params = {"q": "call", "limit": 2}
+        if cursor:
+            params["cursor"] = cursor
+        data = (await client.get("/tasks/search", params=params)).json()["data"]
+        seen.extend(task["id"] for task in data["items"])
+        cursor = data["next_cursor"]
+        if cursor is None:
+            break
+        response = await client.get("/tasks/search", params={"q": "phone", "cursor": cursor})
+        assert response.status_code == 400
+        # Changes the corpus statistics, and with them every score, but not the order
+        db.add_all([Task(title=f"Other {n}", description="", owner_id=auth_user.id + 1) for n in range(20)])
+        db.commit()
+    assert seen == expected
+
+    with patch.object(task_search, "SEARCH_MAX_RESULTS", 3):
+        data = (await client.get("/tasks/search", params={"q": "call", "limit": 2})).json()["data"]
+        data = (await client.get("/tasks/search", params={"q": "call", "cursor": data["next_cursor"]})).json()["data"]
+        assert [task["id"] for task in data["items"]] == expected[2:3]
+        assert data["next_cursor"] is None
+
+
+def test_startup_installs_missing_search_index(db, auth_user):
+    """
+    Tests that create_all on an existing database without the FTS5 table and triggers
+    installs them and indexes the tasks written meanwhile.
+    """
+    for action in ("insert", "delete", "update"):
+        db.execute(text(f"DROP TRIGGER tasks_fts_{action}"))
+    db.execute(text("DROP TABLE tasks_fts"))
+    db.add(Task(title="Unindexed chore", description="", owner_id=auth_user.id))
+    db.commit()
+
+    Base.metadata.create_all(bind=db.get_bind())
+    db.add(Task(title="Indexed chore", description="", owner_id=auth_user.id))
+    db.commit()
+    tasks, _ = search_tasks(db, auth_user.id, "chore", None, None)
+    assert sorted(task.title for task in tasks) == ["Indexed chore", "Unindexed chore"]
+
+
+
+def test_startup_rebuilds_search_index_without_owner(db, auth_user):
+    """
+    Tests that create_all replaces an FTS5 table created before it carried the owner,
+    and that searches still find the tasks it held.
+    """
+    for action in ("insert", "delete", "update"):
+        db.execute(text(f"DROP TRIGGER tasks_fts_{action}"))
+    db.execute(text("DROP TABLE tasks_fts"))
+    db.execute(text(
+        "CREATE VIRTUAL TABLE tasks_fts USING fts5("
+        "title, description, content='tasks', content_rowid='id', tokenize='porter unicode61')"
+    ))
+    db.add(Task(title="Older chore", description="", owner_id=auth_user.id))
+    db.commit()
+
+    Base.metadata.create_all(bind=db.get_bind())
+    schema = db.execute(text("SELECT sql FROM sqlite_master WHERE name = 'tasks_fts'")).scalar_one()
+    assert "owner_id UNINDEXED" in schema
+    tasks, _ = search_tasks(db, auth_user.id, "chore", None, None)
+    assert [task.title for task in tasks] == ["Older chore"]
+    assert search_tasks(db, auth_user.id + 1, "chore", None, None)[0] == []
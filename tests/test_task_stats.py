@@ -0,0 +1,117 @@
+import logging
+
+import pytest
+from sqlalchemy import delete, func, select, text
+
+from src.enums.task_status import TaskStatus
+from src.models import Task, TaskStatusCount, User
+from src.models.task_status_count import TRIGGER_NAMES
+from src.services.database import Base, SessionLocal
+from src.services.task_stats import get_task_stats
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def counted_by_group_by(db, owner_id: int) -> dict:
+    counts = {task_status.value: 0 for task_status in TaskStatus}
+    rows = db.execute(
+        select(Task.status, func.count()).where(Task.owner_id == owner_id).group_by(Task.status)
+    )
+    for task_status, count in rows:
+        counts[task_status.value] = count
+    return counts
+
+
+@pytest.mark.asyncio
+async def test_stats_follow_every_write_path(client, db, auth_user):
+    """
+    Tests that the counters match a GROUP BY over tasks after ORM, bulk, import and delete writes.
+    """
+    response = await client.get("/tasks/stats")
+    assert response.status_code == 200
+    assert response.json()["data"] == {
+        "counts": {"pending": 0, "in-progress": 0, "completed": 0},
+        "total": 0,
+    }
+
+    db.add(Task(title="ORM", description="Task", owner_id=auth_user.id, status=TaskStatus.COMPLETED))
+    db.commit()
+    response = await client.post("/tasks/bulk", json={"items": [{"title": "A"}, {"title": "B"}, {"title": "C"}]})
+    ids = [result["id"] for result in response.json()["data"]]
+    await client.post("/tasks/import", content=b'{"title": "I", "status": "in-progress"}\n')
+    await client.patch("/tasks/bulk", json={"items": [
+        {"id": ids[0], "status": "in-progress"},
+        {"id": ids[1], "title": "Renamed only"},
+    ]})
+    await client.put(f"/tasks/{ids[2]}", json={"status": "completed"})
+    await client.delete(f"/tasks/{ids[1]}")
+
+    data = (await client.get("/tasks/stats")).json()["data"]
+    assert data["counts"] == counted_by_group_by(db, auth_user.id)
+    assert data["counts"] == {"pending": 0, "in-progress": 2, "completed": 2}
+    assert data["total"] == 4
+
+    await client.request("DELETE", "/tasks/bulk", json={"ids": [ids[0], ids[2]]})
+    data = (await client.get("/tasks/stats")).json()["data"]
+    assert data["counts"] == counted_by_group_by(db, auth_user.id)
+    assert data["total"] == 2
+
+
+def test_counters_are_per_owner(db, auth_user):
+    """
+    Tests that moving a task to another owner moves its count too.
+    """
+    other = User(username="other_owner", email="other_owner@example.com", hashed_password="unused")
+    db.add(other)
+    task = Task(title="Moved", description="Task", owner_id=auth_user.id)
+    db.add(task)
+    db.commit()
+
+    task.owner_id = other.id
+    db.commit()
+    assert get_task_stats(db, auth_user.id)["total"] == 0
+    assert get_task_stats(db, other.id)["counts"][TaskStatus.PENDING] == 1
+
+
+def test_deleting_an_owner_with_tasks_drops_its_counters(db, auth_user):
+    """
+    Tests that deleting a user whose tasks cascade with it succeeds, leaves no counters
+    behind and keeps the other owners' counts.
+    """
+    owner = User(username="deleted_owner", email="deleted_owner@example.com", hashed_password="unused")
+    db.add(owner)
+    db.commit()
+    db.add_all([
+        Task(title=f"Task {i}", description="Task", owner_id=user_id, status=task_status)
+        for i, task_status in enumerate(TaskStatus)
+        for user_id in (owner.id, auth_user.id)
+    ])
+    db.commit()
+    owner_id = owner.id
+
+    # The application's engine enforces the foreign keys the delete cascades through
+    with SessionLocal() as session:
+        session.execute(delete(User).where(User.id == owner_id))
+        session.commit()
+    assert db.execute(select(TaskStatusCount).where(TaskStatusCount.owner_id == owner_id)).first() is None
+    assert get_task_stats(db, auth_user.id)["counts"] == counted_by_group_by(db, auth_user.id)
+
+
+def test_startup_installs_missing_triggers(db, auth_user):
+    """
+    Tests that create_all on an existing database without the triggers installs them and
+    rebuilds the counts of the tasks written meanwhile.
+    """
+    for name in TRIGGER_NAMES:
+        db.execute(text(f"DROP TRIGGER {name}"))
+    db.add_all([Task(title=f"Untracked {i}", description="Task", owner_id=auth_user.id) for i in range(3)])
+    db.commit()
+    assert get_task_stats(db, auth_user.id)["total"] == 0
+
+    Base.metadata.create_all(bind=db.get_bind())
+    assert get_task_stats(db, auth_user.id)["counts"] == counted_by_group_by(db, auth_user.id)
+
+    db.add(Task(title="Tracked", description="Task", owner_id=auth_user.id, status=TaskStatus.COMPLETED))
+    db.commit()
+    assert get_task_stats(db, auth_user.id)["total"] == 4
@@ -0,0 +1,163 @@
+import logging
+
+import pytest
+
+import time
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import func, select, update
+
+from src.models import Task, TaskTombstone
+from src.services import task_sync
+from src.services.task_sync import SyncToken, encode_sync_token, purge_expired_tombstones
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+@pytest.mark.asyncio
+async def test_full_sync_then_deltas(client, db, auth_user):
+    """
+    Tests that a full sync returns every task and later syncs only what changed since.
+    """
+    db.add_all([Task(title=f"Task {i}", description="Sync", owner_id=auth_user.id) for i in range(3)])
+    db.commit()
+
+    response = await client.get("/tasks/changes")
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert [task["title"] for task in data["changed"]] == ["Task 0", "Task 1", "Task 2"]
+    assert data["deleted"] == []
+    assert {"revision", "updated_at"} <= set(data["changed"][0])
+    token = data["sync_token"]
+
+    # Nothing changed since the token
+    response = await client.get("/tasks/changes", params={"since": token})
+    unchanged = response.json()["data"]
+    assert (unchanged["changed"], unchanged["deleted"], unchanged["has_more"]) == ([], [], False)
+
+    ids = [task["id"] for task in data["changed"]]
+    assert (await client.put(f"/tasks/{ids[0]}", json={"title": "Renamed"})).status_code == 200
+    assert (await client.delete(f"/tasks/{ids[1]}")).status_code == 200
+    response = await client.post("/tasks/bulk", json={"items": [{"title": "New"}]})
+    new_id = response.json()["data"][0]["id"]
+
+    response = await client.get("/tasks/changes", params={"since": token})
+    data = response.json()["data"]
+    assert [task["title"] for task in data["changed"]] == ["Renamed", "New"]
+    assert data["changed"][1]["id"] == new_id
+    assert data["deleted"] == [ids[1]]
+    token = data["sync_token"]
+
+    response = await client.request("DELETE", "/tasks/bulk", json={"ids": [ids[2], new_id]})
+    assert response.status_code == 200
+    response = await client.patch("/tasks/bulk", json={"items": [{"id": ids[0], "status": "completed"}]})
+    assert response.status_code == 200
+
+    data = (await client.get("/tasks/changes", params={"since": token})).json()["data"]
+    assert [(task["id"], task["status"]) for task in data["changed"]] == [(ids[0], "completed")]
+    assert data["deleted"] == sorted([ids[2], new_id])
+
+
+@pytest.mark.asyncio
+async def test_imports_are_synced(client, db, auth_user):
+    """
+    Tests that imported tasks are stamped with a revision past the previous token.
+    """
+    token = (await client.get("/tasks/changes")).json()["data"]["sync_token"]
+    response = await client.post("/tasks/import", content=b'{"title": "Imported"}\n')
+    assert response.status_code == 201
+
+    data = (await client.get("/tasks/changes", params={"since": token})).json()["data"]
+    assert [task["title"] for task in data["changed"]] == ["Imported"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("token_for", ["garbage", "other_user", "future", "bad_position"])
+async def test_invalid_sync_tokens(client, auth_user, token_for):
+    """
+    Tests that malformed, foreign and not yet issued tokens are rejected.
+    """
+    now = int(time.time())
+    tokens = {
+        "garbage": "not-a-token",
+        "other_user": encode_sync_token(auth_user.id + 1, SyncToken(0, now)),
+        "future": encode_sync_token(auth_user.id, SyncToken(1000, now)),
+        "bad_position": encode_sync_token(auth_user.id, SyncToken(0, now, 5, now, (1, 7, 1))),
+    }
+    response = await client.get("/tasks/changes", params={"since": tokens[token_for]})
+    assert response.status_code == 400
+
+
+async def sync_pages(client, token, limit):
+    """
+    Follow a sync through its pages and return them, with the final token.
+    """
+    pages = []
+    while True:
+        params = {"limit": limit, **({"since": token} if token else {})}
+        data = (await client.get("/tasks/changes", params=params)).json()["data"]
+        pages.append(data)
+        token = data["sync_token"]
+        if not data["has_more"]:
+            return pages, token
+
+
+@pytest.mark.asyncio
+async def test_sync_pages_continue_up_to_the_same_revision(client, db, auth_user):
+    """
+    Tests that limited syncs page through writes and deletes in revision order, including
+    a bulk write that shares one revision, and ignore writes made after the first page.
+    """
+    response = await client.post("/tasks/bulk", json={"items": [{"title": f"Bulk {i}"} for i in range(5)]})
+    ids = [task["id"] for task in response.json()["data"]]
+
+    pages, token = await sync_pages(client, None, limit=2)
+    assert [len(page["changed"]) for page in pages] == [2, 2, 1]
+    assert [task["id"] for page in pages for task in page["changed"]] == ids
+
+    response = await client.request("DELETE", "/tasks/bulk", json={"ids": ids[:3]})
+    assert response.status_code == 200
+    assert (await client.put(f"/tasks/{ids[3]}", json={"title": "Renamed"})).status_code == 200
+
+    first = (await client.get("/tasks/changes", params={"since": token, "limit": 2})).json()["data"]
+    assert first["has_more"] and first["changed"] == [] and first["deleted"] == ids[:2]
+    # Written after the sync started: left for the next sync
+    assert (await client.put(f"/tasks/{ids[4]}", json={"title": "Later"})).status_code == 200
+
+    pages, token = await sync_pages(client, first["sync_token"], limit=2)
+    assert [page["deleted"] for page in pages] == [[ids[2]]]
+    assert [task["title"] for task in pages[0]["changed"]] == ["Renamed"]
+
+    data = (await client.get("/tasks/changes", params={"since": token})).json()["data"]
+    assert [task["title"] for task in data["changed"]] == ["Later"]
+    assert data["deleted"] == []
+
+
+@pytest.mark.asyncio
+async def test_expired_tokens_require_a_full_sync(client, db, auth_user):
+    """
+    Tests that tokens older than the tombstone retention window get 410, and that the
+    purge only deletes tombstones past the window.
+    """
+    db.add(Task(title="Gone", description="", owner_id=auth_user.id))
+    db.commit()
+    token = (await client.get("/tasks/changes")).json()["data"]["sync_token"]
+    task_id = db.execute(select(Task.id).where(Task.owner_id == auth_user.id)).scalar_one()
+    assert (await client.delete(f"/tasks/{task_id}")).status_code == 200
+
+    expired = int(time.time() - task_sync.TOMBSTONE_RETENTION_SECONDS)
+    stale = encode_sync_token(auth_user.id, SyncToken(0, expired))
+    response = await client.get("/tasks/changes", params={"since": stale})
+    assert response.status_code == 410
+    assert "full sync" in response.json()["message"]
+
+    assert purge_expired_tombstones(db) == 0
+    data = (await client.get("/tasks/changes", params={"since": token})).json()["data"]
+    assert data["deleted"] == [task_id]
+
+    deleted_at = datetime.now(timezone.utc) - timedelta(seconds=task_sync.TOMBSTONE_RETENTION_SECONDS + 60)
+    db.execute(update(TaskTombstone).values(deleted_at=deleted_at))
+    db.commit()
+    assert purge_expired_tombstones(db) == 1
+    assert db.execute(select(func.count()).select_from(TaskTombstone)).scalar_one() == 0
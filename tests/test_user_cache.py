@@ -0,0 +1,87 @@
+import logging
+from unittest.mock import patch
+
+import pytest
+from fastapi import HTTPException
+
+from src.models import User
+from src.services import user_cache
+from src.services.auth import create_access_token
+from src.services.cache import TTLCache
+from src.services.dependencies import get_current_user
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+@pytest.fixture
+def user(db):
+    user_cache.clear_user_cache()
+    user = User(username="cacheduser", email="cacheduser@example.com", hashed_password="not-a-real-hash")
+    db.add(user)
+    db.commit()
+    db.refresh(user)
+    return user
+
+
+@pytest.mark.asyncio
+async def test_get_current_user_is_cached(db, user):
+    """
+    Tests that a second lookup with the same token is served from the cache.
+    """
+    token = create_access_token(data={"sub": user.username})
+    hits_before = user_cache.user_cache_stats()["hits"]
+
+    first = await get_current_user(token=token, db=db)
+    second = await get_current_user(token=token, db=db)
+
+    assert first.id == second.id == user.id
+    assert user_cache.user_cache_stats()["hits"] == hits_before + 1
+
+
+@pytest.mark.asyncio
+async def test_invalidate_user_takes_effect_immediately(db, user):
+    """
+    Tests that disabling a user rejects a token that was already cached.
+    """
+    token = create_access_token(data={"sub": user.username})
+    await get_current_user(token=token, db=db)
+
+    user.disabled = True
+    db.commit()
+    user_cache.invalidate_user(user.id)
+
+    with pytest.raises(HTTPException) as exc_info:
+        await get_current_user(token=token, db=db)
+    assert exc_info.value.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_invalidation_markers_are_bounded(db, user):
+    """
+    Tests that invalidation markers are capped, and that a cached user whose marker was
+    evicted is still rejected instead of served stale.
+    """
+    token = create_access_token(data={"sub": user.username})
+    await get_current_user(token=token, db=db)
+
+    with patch.object(user_cache, "_invalidated_at", TTLCache(maxsize=2, ttl=60)):
+        user_cache.invalidate_user(user.id)
+        for other_id in range(user.id + 1, user.id + 4):
+            user_cache.invalidate_user(other_id)
+        assert user_cache._invalidated_at.stats()["size"] == 2
+        assert user_cache.get_cached_user(token) is None
+
+
+@pytest.mark.asyncio
+async def test_user_cache_metrics_endpoint(client, auth_user):
+    """
+    Tests that cache counters are exposed to admins for monitoring.
+    """
+    response = await client.get("/metrics/user-cache")
+    assert response.status_code == 403
+
+    auth_user.is_admin = True
+    response = await client.get("/metrics/user-cache")
+    assert response.status_code == 200
+    assert {"hits", "misses", "size"} <= set(response.json()["data"])
@@ -0,0 +1,116 @@
+import logging
+
+import pytest
+from sqlalchemy import insert
+
+from src.models import User
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def insert_users(db, usernames):
+    db.execute(
+        insert(User),
+        [
+            {"username": name, "email": f"{name}@example.com", "hashed_password": "not-a-real-hash"}
+            for name in usernames
+        ],
+    )
+    db.commit()
+
+
+@pytest.mark.asyncio
+async def test_user_listing_requires_admin(client, db, auth_user):
+    """
+    Tests that a user who is not an admin cannot list users.
+    """
+    insert_users(db, ["alice"])
+
+    response = await client.get("/users")
+    assert response.status_code == 403
+    assert response.json()["message"] == f"User '{auth_user.username}' is not authorized to view this resource."
+
+
+@pytest.mark.asyncio
+async def test_user_listing_pagination(client, db, auth_user):
+    """
+    Tests that cursor pagination walks every user once in ID order.
+    """
+    auth_user.is_admin = True
+    insert_users(db, [f"user{i:02d}" for i in range(7)])
+
+    seen = []
+    params = {"limit": 3}
+    while True:
+        response = await client.get("/users", params=params)
+        assert response.status_code == 200
+        page = response.json()["data"]
+        seen.extend(user["id"] for user in page["items"])
+        if page["next_cursor"] is None:
+            break
+        params["cursor"] = page["next_cursor"]
+    assert seen == sorted(seen)
+    assert len(seen) == 8
+
+
+@pytest.mark.asyncio
+async def test_user_listing_selects_fields(client, db, auth_user):
+    """
+    Tests that ``fields`` limits the returned columns and never exposes password hashes.
+    """
+    auth_user.is_admin = True
+    insert_users(db, ["alice"])
+
+    response = await client.get("/users", params={"fields": "username"})
+    assert response.status_code == 200
+    users = response.json()["data"]
+    assert all(set(user) == {"id", "username"} for user in users)
+
+    response = await client.get("/users")
+    assert all(set(user) == {"id", "username", "email"} for user in response.json()["data"])
+
+
+@pytest.mark.asyncio
+async def test_user_listing_username_prefix(client, db, auth_user):
+    """
+    Tests that a username prefix returns matching users in username order, page by page.
+    """
+    auth_user.is_admin = True
+    insert_users(db, ["carol", "al_x", "alice", "albert", "bob", "alfred"])
+
+    response = await client.get("/users", params={"username": "prefix:al"})
+    assert [user["username"] for user in response.json()["data"]] == ["al_x", "albert", "alfred", "alice"]
+
+    # LIKE wildcards in a prefix are literal
+    response = await client.get("/users", params={"username": "prefix:al_"})
+    assert [user["username"] for user in response.json()["data"]] == ["al_x"]
+
+    first_page = await client.get("/users", params={"username": "prefix:al", "limit": 3})
+    page = first_page.json()["data"]
+    assert [user["username"] for user in page["items"]] == ["al_x", "albert", "alfred"]
+    response = await client.get(
+        "/users", params={"username": "prefix:al", "limit": 3, "cursor": page["next_cursor"]}
+    )
+    assert [user["username"] for user in response.json()["data"]["items"]] == ["alice"]
+
+    response = await client.get("/users", params={"username": "bob", "fields": "email"})
+    assert [user["email"] for user in response.json()["data"]] == ["bob@example.com"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("params", [
+    {"fields": "hashed_password"},
+    {"fields": "username,is_admin"},
+    {"username": "in:alice,bob"},
+    {"username": "prefix:"},
+    {"limit": 0},
+])
+async def test_user_listing_rejects_invalid_requests(client, auth_user, params):
+    """
+    Tests that unknown fields and operators are rejected.
+    """
+    auth_user.is_admin = True
+    response = await client.get("/users", params=params)
+    assert response.status_code in (400, 422)
+    logger.info("Rejected %s: %s", params, response.json())
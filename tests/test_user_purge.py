@@ -0,0 +1,73 @@
+import logging
+
+import pytest
+from sqlalchemy import insert
+
+from src.models import Task, TaskStatusCount, TaskTombstone, User
+from src.services.database import SessionLocal
+from src.services.user_purge import purge_user
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def create_user_with_tasks(db, name: str, count: int) -> int:
+    user = User(username=name, email=f"{name}@example.com", hashed_password="unused")
+    db.add(user)
+    db.commit()
+    db.execute(insert(Task), [
+        {"title": f"Task {i}", "description": "", "owner_id": user.id} for i in range(count)
+    ])
+    db.add(TaskTombstone(task_id=0, owner_id=user.id, revision=1))
+    db.commit()
+    return user.id
+
+
+def owned_rows(db, user_id: int) -> tuple:
+    db.expire_all()
+    return (
+        db.query(Task).filter_by(owner_id=user_id).count(),
+        db.query(TaskTombstone).filter_by(owner_id=user_id).count(),
+        db.query(TaskStatusCount).filter_by(owner_id=user_id).count(),
+        db.get(User, user_id) is not None,
+    )
+
+
+@pytest.mark.asyncio
+async def test_delete_user_cascades_in_the_database(client, db, auth_user):
+    """
+    Tests that deleting a user removes its tasks, tombstones and counters without
+    loading its tasks.
+    """
+    user_id = create_user_with_tasks(db, "cascaded", 200)
+    assert owned_rows(db, user_id) == (200, 1, 1, True)
+
+    response = await client.delete(f"/users/{user_id}")
+    assert response.status_code == 200
+    # Load the user, then delete it: no per-task statements
+    assert response.headers["server-timing"].split(", ")[0].endswith('desc="queries: 2"')
+    assert owned_rows(db, user_id) == (0, 0, 0, False)
+
+
+@pytest.mark.asyncio
+async def test_background_purge(client, db, auth_user):
+    """
+    Tests that a background delete answers 202, and the user is gone once the purge ran.
+    """
+    user_id = create_user_with_tasks(db, "purged", 25)
+
+    response = await client.delete(f"/users/{user_id}", params={"mode": "background"})
+    assert response.status_code == 202
+    # The test transport runs background tasks before returning the response
+    assert owned_rows(db, user_id) == (0, 0, 0, False)
+
+
+def test_purge_deletes_tasks_in_chunks(db):
+    """
+    Tests that a purge commits chunk by chunk and deletes the user last.
+    """
+    user_id = create_user_with_tasks(db, "chunked", 10)
+    # The application's engine, which enforces foreign keys on SQLite
+    with SessionLocal() as app_db:
+        assert purge_user(app_db, user_id, chunk_size=4) == 10
+    assert owned_rows(db, user_id) == (0, 0, 0, False)
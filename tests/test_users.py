@@ -1,7 +1,12 @@
+import asyncio
 import logging
 import uuid
 
 import pytest
+from sqlalchemy import insert, inspect, select, text
+from sqlalchemy.exc import IntegrityError
+
+from src.models import User
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -25,6 +30,97 @@ async def test_create_user(client):
     logger.info("Create user passed for payload: %s", payload)
 
 
+@pytest.mark.asyncio
+async def test_email_uniqueness_ignores_case(client, auth_user):
+    """
+    Tests that emails are stored lowercased and that duplicates differing only in case are rejected.
+    """
+    # Only admins may create users
+    auth_user.is_admin = True
+    unique_id = uuid.uuid4().hex[:8]
+    payload = {
+        "username": f"caseuser_{unique_id}",
+        "email": f"CaseUser_{unique_id}@Example.com",
+        "password": "password123",
+    }
+    response = await client.post("/user", json=payload)
+    assert response.status_code == 201
+    assert response.json()["data"]["email"] == payload["email"].lower()
+
+    duplicate = {**payload, "username": f"other_{unique_id}", "email": payload["email"].upper()}
+    response = await client.post("/user", json=duplicate)
+    assert response.status_code == 400
+
+    response = await client.put(f"/users/{auth_user.id}", json={"email": payload["email"].swapcase()})
+    assert response.status_code == 400
+    logger.info("Case-insensitive email uniqueness passed for: %s", payload["email"])
+
+
+
+def users_index_names(db) -> set:
+    bind = db.get_bind()
+    if bind.dialect.name == "sqlite":
+        # SQLAlchemy does not reflect expression indexes on SQLite
+        return set(db.execute(text(
+            "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'users'"
+        )).scalars())
+    return {index["name"] for index in inspect(bind).get_indexes("users")}
+
+
+def test_lower_email_index_exists(db):
+    """
+    Tests that the unique index on lower(email) is created with the users table.
+    """
+    assert "ix_users_lower_email" in users_index_names(db)
+
+
+def test_lower_email_index_rejects_case_variants(db):
+    """
+    Tests that the database rejects emails differing only in case even when they bypass
+    the model's lowercasing.
+    """
+    unique_id = uuid.uuid4().hex[:8]
+    db.execute(insert(User.__table__), [
+        {"username": f"first_{unique_id}", "email": f"Mixed_{unique_id}@Example.com", "hashed_password": "unused"},
+    ])
+    db.commit()
+    stored = db.execute(select(User.email).where(User.username == f"first_{unique_id}")).scalar_one()
+    assert stored == f"Mixed_{unique_id}@Example.com"
+
+    with pytest.raises(IntegrityError):
+        db.execute(insert(User.__table__), [
+            {"username": f"second_{unique_id}", "email": f"mixed_{unique_id}@example.COM", "hashed_password": "unused"},
+        ])
+    db.rollback()
+
+@pytest.mark.asyncio
+async def test_concurrent_signups_create_one_user(client, auth_user):
+    """
+    Tests that user creation is a single INSERT and that of concurrent signups for the same
+    username exactly one succeeds.
+    """
+    auth_user.is_admin = True
+    unique_id = uuid.uuid4().hex[:8]
+    payload = {
+        "username": f"racer_{unique_id}",
+        "email": f"racer_{unique_id}@example.com",
+        "password": "password123",
+    }
+
+    response = await client.post("/user", json={**payload, "username": f"solo_{unique_id}", "email": f"solo_{unique_id}@example.com"})
+    assert response.status_code == 201
+    assert 'desc="queries: 1"' in response.headers["server-timing"]
+
+    # Stay within the password hashing pool's pending limit (at least 4), which answers 429 beyond it
+    responses = await asyncio.gather(*(
+        client.post("/user", json={**payload, "email": f"racer_{unique_id}_{n}@example.com"})
+        for n in range(3)
+    ))
+    assert sorted(response.status_code for response in responses) == [201, 400, 400]
+    rejected = next(response for response in responses if response.status_code == 400)
+    assert rejected.json()["message"] == "Username or Email already exists"
+
+
 @pytest.mark.asyncio
 async def test_get_user(client, setup_user):
     """